@@ -4,7 +4,7 @@ import tempfile
 import fitz
 import pdfCropMargins
 
-from rendercv.renderer.pdf_png import generate_pdf
+from rendercv.renderer.pdf_png import compile_typst, generate_pdf
 from rendercv.renderer.typst import generate_typst
 from rendercv.schema.models.cv.cv import Cv
 from rendercv.schema.models.design.built_in_design import available_themes
@@ -74,7 +74,7 @@ with tempfile.TemporaryDirectory() as temporary_directory:
 
             # Render
             generate_typst(model)
-            generate_pdf(model, typst_path)
+            generate_pdf(model, compile_typst(model, typst_path))
 
             # Prepare output directory and file path
             output_directory = image_assets_directory / theme
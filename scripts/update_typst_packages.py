@@ -0,0 +1,36 @@
+import io
+import pathlib
+import re
+import shutil
+import tarfile
+import urllib.request
+
+from rendercv.renderer.pdf_png import typst_package_path
+
+repository_root = pathlib.Path(__file__).parent.parent
+templates_directory = (
+    repository_root / "src" / "rendercv" / "renderer" / "templater" / "templates"
+)
+registry_url = "https://packages.typst.org"
+package_import_pattern = re.compile(r'#import "@(\w+)/([\w-]+):(\d+\.\d+\.\d+)"')
+
+# Collect every package the templates import:
+packages = {
+    match.groups()
+    for template in templates_directory.rglob("*.typ")
+    for match in package_import_pattern.finditer(template.read_text(encoding="utf-8"))
+}
+
+# Replace the vendored packages with the imported versions from the registry:
+shutil.rmtree(typst_package_path, ignore_errors=True)
+for namespace, name, version in sorted(packages):
+    url = f"{registry_url}/{namespace}/{name}-{version}.tar.gz"
+    with urllib.request.urlopen(url) as response:
+        archive = response.read()
+
+    package_directory = typst_package_path / namespace / name / version
+    package_directory.mkdir(parents=True)
+    with tarfile.open(fileobj=io.BytesIO(archive), mode="r:gz") as tar_file:
+        tar_file.extractall(package_directory, filter="data")
+
+    print(f"Vendored @{namespace}/{name}:{version}.")  # NOQA: T201
@@ -18,6 +18,10 @@ app = typer.Typer(
     context_settings={"help_option_names": ["-h", "--help"]},
 )
 
+# Commands whose standard output is read by programs, so it must not contain the
+# update notice:
+machine_readable_commands = frozenset({"render-batch"})
+
 
 @app.callback()
 def cli_command_no_args(
@@ -29,7 +33,8 @@ def cli_command_no_args(
     """RenderCV is a command-line tool for rendering CVs from YAML input files. For more
     information, see https://docs.rendercv.com.
     """
-    warn_if_new_version_is_available()
+    if ctx.invoked_subcommand not in machine_readable_commands:
+        warn_if_new_version_is_available()
 
     if version_requested:
         print(f"RenderCV v{__version__}")
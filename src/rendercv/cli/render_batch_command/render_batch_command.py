@@ -0,0 +1,157 @@
+import json
+import pathlib
+from typing import Annotated
+
+import typer
+
+from rendercv.exception import RenderCVUserError
+
+from ..app import app
+from ..error_handler import handle_user_errors
+from .run_batch import collect_input_files, run_batch
+
+
+@app.command(
+    name="render-batch",
+    help=(
+        "Render many YAML input files on a pool of worker processes and print a"
+        " JSON line per file. Example: [yellow]rendercv render-batch cvs[/yellow]."
+        " Details: [cyan]rendercv render-batch --help[/cyan]"
+    ),
+)
+@handle_user_errors
+def cli_command_render_batch(
+    inputs: Annotated[
+        list[str] | None,
+        typer.Argument(
+            help=(
+                "YAML input files, directories whose YAML files are rendered, or glob"
+                ' patterns like [cyan bold]"cvs/**/*_CV.yaml"[/cyan bold].'
+            ),
+        ),
+    ] = None,
+    manifest: Annotated[
+        pathlib.Path | None,
+        typer.Option(
+            "--manifest",
+            "-m",
+            help=(
+                "A text file listing one YAML input file per line, relative to the"
+                " manifest."
+            ),
+        ),
+    ] = None,
+    workers: Annotated[
+        int | None,
+        typer.Option(
+            "--workers",
+            "-j",
+            help="Number of worker processes. The default is the number of CPUs.",
+            min=1,
+        ),
+    ] = None,
+    design: Annotated[
+        pathlib.Path | None,
+        typer.Option(
+            "--design",
+            "-d",
+            help='The "design" field\'s YAML input file, used for every file.',
+        ),
+    ] = None,
+    locale: Annotated[
+        pathlib.Path | None,
+        typer.Option(
+            "--locale-catalog",
+            "-lc",
+            help='The "locale" field\'s YAML input file, used for every file.',
+        ),
+    ] = None,
+    settings: Annotated[
+        pathlib.Path | None,
+        typer.Option(
+            "--settings",
+            "-s",
+            help='The "settings" field\'s YAML input file, used for every file.',
+        ),
+    ] = None,
+    dont_generate_markdown: Annotated[
+        bool | None,
+        typer.Option(
+            "--dont-generate-markdown",
+            "-nomd",
+            help=(
+                "If provided, Markdown files will not be generated. Disabling"
+                " Markdown generation implicitly disables HTML."
+            ),
+        ),
+    ] = None,
+    dont_generate_html: Annotated[
+        bool | None,
+        typer.Option(
+            "--dont-generate-html",
+            "-nohtml",
+            help="If provided, HTML files will not be generated.",
+        ),
+    ] = None,
+    dont_generate_typst: Annotated[
+        bool | None,
+        typer.Option(
+            "--dont-generate-typst",
+            "-notyp",
+            help=(
+                "If provided, Typst files will not be written. PDF, PNG, and SVG"
+                " files are still generated."
+            ),
+        ),
+    ] = None,
+    dont_generate_pdf: Annotated[
+        bool | None,
+        typer.Option(
+            "--dont-generate-pdf",
+            "-nopdf",
+            help="If provided, PDF files will not be generated.",
+        ),
+    ] = None,
+    dont_generate_png: Annotated[
+        bool | None,
+        typer.Option(
+            "--dont-generate-png",
+            "-nopng",
+            help="If provided, PNG files will not be generated.",
+        ),
+    ] = None,
+    cache_dir: Annotated[
+        pathlib.Path | None,
+        typer.Option(
+            "--cache-dir",
+            help=(
+                "Keep caches, such as compiled templates, in the specified directory"
+                " so that later runs start faster."
+            ),
+        ),
+    ] = None,
+):
+    input_files = collect_input_files(inputs or [], manifest)
+    if not input_files:
+        message = "No input files were found!"
+        raise RenderCVUserError(message)
+
+    failed = 0
+    for result in run_batch(
+        input_files,
+        workers,
+        design_file_path_or_contents=design,
+        locale_file_path_or_contents=locale,
+        settings_file_path_or_contents=settings,
+        dont_generate_typst=dont_generate_typst,
+        dont_generate_html=dont_generate_html,
+        dont_generate_markdown=dont_generate_markdown,
+        dont_generate_pdf=dont_generate_pdf,
+        dont_generate_png=dont_generate_png,
+        cache_dir=cache_dir,
+    ):
+        failed += result["status"] == "error"
+        typer.echo(json.dumps(result))
+
+    if failed:
+        raise typer.Exit(code=1)
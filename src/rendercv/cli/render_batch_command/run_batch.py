@@ -0,0 +1,253 @@
+import collections
+import concurrent.futures
+import contextlib
+import glob
+import pathlib
+import time
+from collections.abc import Iterable, Iterator
+from typing import Any, Unpack
+
+import jinja2
+import ruamel.yaml
+
+from rendercv.exception import RenderCVUserError, RenderCVUserValidationError
+from rendercv.renderer.font_index import get_font_paths
+from rendercv.renderer.output_writer import is_output_unchanged
+from rendercv.renderer.templater.templater import render_full_template
+from rendercv.schema.rendercv_model_builder import (
+    BuildRendercvModelArguments,
+    build_rendercv_dictionary,
+    build_rendercv_model_from_commented_map,
+)
+from rendercv.schema.sample_generator import create_sample_yaml_input_file
+
+from ..render_command.progress_panel import ProgressPanel
+from ..render_command.run_rendercv import render_input_file
+
+input_file_suffixes = frozenset({".yaml", ".yml"})
+
+
+def collect_input_files(
+    inputs: Iterable[str], manifest: pathlib.Path | None = None
+) -> list[pathlib.Path]:
+    """Expand directories, glob patterns, and a manifest into input files.
+
+    Why:
+        Nightly jobs pass whole directories or patterns instead of listing tens
+        of thousands of files on the command line, which would exceed the
+        argument length limit. A manifest lists files explicitly, one per line.
+
+    Example:
+        ```py
+        files = collect_input_files(["cvs", "extra/*_CV.yaml"])
+        # Returns: [Path("cvs/Jane_Doe_CV.yaml"), Path("extra/John_Doe_CV.yaml")]
+        ```
+
+    Args:
+        inputs: Input files, directories whose YAML files are rendered, or glob
+            patterns.
+        manifest: Optional text file with one input file per line, relative to
+            the manifest. Empty lines and lines starting with `#` are skipped.
+
+    Returns:
+        Input files in the given order, without duplicates.
+    """
+    candidates: list[pathlib.Path] = []
+    for item in inputs:
+        path = pathlib.Path(item)
+        if path.is_dir():
+            candidates.extend(
+                sorted(
+                    file
+                    for file in path.iterdir()
+                    if file.suffix in input_file_suffixes and file.is_file()
+                )
+            )
+        elif glob.has_magic(item):
+            # `Path.glob` doesn't accept absolute patterns:
+            matches = glob.glob(item, recursive=True)  # NOQA: PTH207
+            candidates.extend(pathlib.Path(match) for match in sorted(matches))
+        else:
+            candidates.append(path)
+
+    if manifest is not None:
+        if not manifest.is_file():
+            message = f"The manifest {manifest} doesn't exist!"
+            raise RenderCVUserError(message)
+        for line in manifest.read_text(encoding="utf-8").splitlines():
+            entry = line.strip()
+            if entry and not entry.startswith("#"):
+                candidates.append(manifest.parent / entry)
+
+    return list(dict.fromkeys(candidates))
+
+
+def warm_up_worker(
+    input_directory: pathlib.Path | None = None,
+    arguments: BuildRendercvModelArguments | None = None,
+) -> None:
+    """Render a sample CV in memory so that the worker's caches are filled.
+
+    Why:
+        The first render in a process validates through cold Pydantic models,
+        compiles every built-in template, and indexes the fonts. Doing that
+        once when a worker starts keeps it out of the timings of the first
+        files and lets later files reuse the compiled templates. Jinja2
+        environments and template indexes are kept per input directory and
+        cache directory, so the sample is rendered as if it were an input in
+        `input_directory`, with the same arguments as the real inputs.
+
+    Args:
+        input_directory: Directory of the inputs the worker will render.
+            Defaults to the working directory, which inputs given as contents
+            use.
+        arguments: Overrides applied to every input, like `cache_dir`.
+    """
+    if input_directory is None:
+        input_directory = pathlib.Path.cwd()
+    # Errors in the inputs' templates or arguments are reported for every file
+    # that uses them, so here they only make the first file slower:
+    with contextlib.suppress(
+        RenderCVUserError,
+        RenderCVUserValidationError,
+        ruamel.yaml.YAMLError,
+        jinja2.exceptions.TemplateError,
+        OSError,
+    ):
+        input_dictionary = build_rendercv_dictionary(
+            create_sample_yaml_input_file(file_path=None), **(arguments or {})
+        )
+        rendercv_model = build_rendercv_model_from_commented_map(
+            input_dictionary, input_directory / "cv.yaml"
+        )
+        render_full_template(rendercv_model, "typst")
+        render_full_template(rendercv_model, "markdown")
+        get_font_paths(rendercv_model)
+
+
+def render_file(
+    input_file_path: pathlib.Path, arguments: BuildRendercvModelArguments
+) -> dict[str, Any]:
+    """Render one input file and describe the result as a JSON-ready dictionary.
+
+    Args:
+        input_file_path: YAML input file.
+        arguments: Overrides for design/locale files and generation flags.
+
+    Returns:
+        The input, `status` (`success` or `error`), the total time and the time
+        of each output step in milliseconds, and either the generated and
+        unchanged outputs or the error message.
+    """
+    progress = ProgressPanel(quiet=True)
+    start = time.perf_counter()
+    try:
+        results = render_input_file(input_file_path, progress, **arguments)
+    # One broken file must not stop the whole batch:
+    except Exception as e:
+        return {
+            "input": str(input_file_path),
+            "status": "error",
+            "duration_ms": round((time.perf_counter() - start) * 1000),
+            "error": describe_error(e),
+        }
+
+    outputs: list[pathlib.Path] = []
+    for result in results.values():
+        if isinstance(result, pathlib.Path):
+            outputs.append(result)
+        elif isinstance(result, list):
+            outputs.extend(path for path in result if isinstance(path, pathlib.Path))
+
+    return {
+        "input": str(input_file_path),
+        "status": "success",
+        "duration_ms": round((time.perf_counter() - start) * 1000),
+        "timings_ms": {
+            step.message: int(step.timing_ms) for step in progress.completed_steps
+        },
+        "outputs": [str(path) for path in outputs],
+        "unchanged": [str(path) for path in outputs if is_output_unchanged(path)],
+    }
+
+
+def describe_error(error: Exception) -> str:
+    """Turn an error raised while rendering into a one-line message.
+
+    Args:
+        error: Raised error.
+
+    Returns:
+        Message for the batch output.
+    """
+    match error:
+        case RenderCVUserValidationError():
+            return "; ".join(
+                f"{'.'.join(validation_error.location)}: {validation_error.message}"
+                for validation_error in error.validation_errors
+            )
+        case RenderCVUserError():
+            return error.message or "An unknown error occurred."
+        case ruamel.yaml.YAMLError():
+            return f"This is not a valid YAML file! {error}"
+        case jinja2.exceptions.TemplateSyntaxError():
+            return (
+                f"There is a problem with the template ({error.filename}) at line"
+                f" {error.lineno}! {error}"
+            )
+        case OSError():
+            return f"OS Error: {error}"
+        case _:
+            return f"{type(error).__name__}: {error}"
+
+
+def run_batch(
+    input_files: list[pathlib.Path],
+    workers: int | None = None,
+    **arguments: Unpack[BuildRendercvModelArguments],
+) -> Iterator[dict[str, Any]]:
+    """Render many input files on a pool of warm worker processes.
+
+    Why:
+        Running the CLI once per file pays for importing RenderCV, validating
+        through cold models, and compiling templates every time, which takes
+        longer than rendering a typical CV. Long-lived workers pay for it once
+        and keep their template, font, and compiler caches across files.
+
+    Example:
+        ```py
+        for result in run_batch([pathlib.Path("John_Doe_CV.yaml")], workers=4):
+            print(result["status"], result["duration_ms"])
+        ```
+
+    Args:
+        input_files: YAML input files.
+        workers: Number of worker processes. Defaults to the number of CPUs.
+        arguments: Overrides for design/locale files and generation flags,
+            applied to every file.
+
+    Returns:
+        Results of `render_file` in the order the files finish.
+    """
+    # Workers warm up the caches of the directory most inputs are in:
+    input_directory = (
+        collections.Counter(file.parent for file in input_files).most_common(1)[0][0]
+        if input_files
+        else None
+    )
+    with concurrent.futures.ProcessPoolExecutor(
+        max_workers=workers,
+        initializer=warm_up_worker,
+        initargs=(input_directory, arguments),
+    ) as executor:
+        file_arguments = BuildRendercvModelArguments(**arguments)
+        futures = [
+            executor.submit(render_file, input_file, file_arguments)
+            for input_file in input_files
+        ]
+        # Stopping early or Ctrl+C must not wait for the files that are left:
+        try:
+            for future in concurrent.futures.as_completed(futures):
+                yield future.result()
+        finally:
+            executor.shutdown(cancel_futures=True)
@@ -1,6 +1,7 @@
 import contextlib
 import pathlib
-from dataclasses import dataclass
+import threading
+from dataclasses import dataclass, field
 
 import rich.box
 import rich.live
@@ -18,8 +19,13 @@ class ProgressPanel(rich.live.Live):
         ```py
         with ProgressPanel(quiet=False) as progress:
             progress.update_progress("50", "Generated PDF", [Path("cv.pdf")])
+            progress.update_progress(
+                "20", "Generated HTML", [Path("cv.html")], [], [Path("cv.html")]
+            )
             progress.finish_progress()
         # Displays: ✓ 50 ms   Generated PDF: ./cv.pdf
+        #           ✓ 20 ms   Generated HTML: ./cv.html
+        #                     Unchanged, not rewritten
         ```
 
     Args:
@@ -29,6 +35,8 @@ class ProgressPanel(rich.live.Live):
     def __init__(self, quiet: bool = False):
         self.quiet = quiet
         self.completed_steps: list[CompletedStep] = []
+        # Steps of the output pipeline finish on different threads:
+        self.steps_lock = threading.Lock()
         super().__init__(
             rich.panel.Panel(
                 "...",
@@ -40,7 +48,12 @@ class ProgressPanel(rich.live.Live):
         )
 
     def update_progress(
-        self, time_took: str, message: str, paths: list[pathlib.Path]
+        self,
+        time_took: str,
+        message: str,
+        paths: list[pathlib.Path],
+        notes: list[str] | None = None,
+        unchanged_paths: list[pathlib.Path] | None = None,
     ) -> None:
         """Add completed step to progress display.
 
@@ -48,9 +61,16 @@ class ProgressPanel(rich.live.Live):
             time_took: Execution time in milliseconds as string.
             message: Step description.
             paths: Generated file paths to display.
+            notes: Extra lines to display below the step.
+            unchanged_paths: Paths among `paths` whose contents didn't change.
         """
-        self.completed_steps.append(CompletedStep(time_took, message, paths))
-        self.print_progress_panel(title="Rendering your CV...")
+        with self.steps_lock:
+            self.completed_steps.append(
+                CompletedStep(
+                    time_took, message, paths, notes or [], unchanged_paths or []
+                )
+            )
+            self.print_progress_panel(title="Rendering your CV...")
 
     def finish_progress(self) -> None:
         """Display final success panel and clear state."""
@@ -70,17 +90,26 @@ class ProgressPanel(rich.live.Live):
         for step in self.completed_steps:
             paths_str = ""
             if step.paths:
-                with contextlib.suppress(ValueError):
-                    step.paths = [
-                        path.relative_to(pathlib.Path.cwd()) for path in step.paths
-                    ]
-                paths_as_strings = [f"./{path}" for path in step.paths]
+                paths_as_strings = [
+                    f"./{get_display_path(path)}" for path in step.paths
+                ]
                 paths_str = "; ".join(paths_as_strings)
 
             timing = f"[bold green]{step.timing_ms + ' ms':<8}[/bold green]"
             message = step.message + (": " if paths_str else ".")
             paths_display = f"[purple]{paths_str}[/purple]" if paths_str else ""
             lines.append(f"[green]✓[/green] {timing} {message:<26} {paths_display}")
+            notes = list(step.notes)
+            if step.unchanged_paths == step.paths and step.paths:
+                notes.append("Unchanged, not rewritten")
+            elif step.unchanged_paths:
+                unchanged = "; ".join(
+                    f"./{get_display_path(path)}" for path in step.unchanged_paths
+                )
+                notes.append(f"Unchanged, not rewritten: {unchanged}")
+            lines.extend(
+                f"{'':<11} [bright_black]{note}[/bright_black]" for note in notes
+            )
 
         content = "\n".join(lines) if lines else "Rendering..."
 
@@ -150,8 +179,24 @@ class ProgressPanel(rich.live.Live):
         self.update("")
 
 
+def get_display_path(path: pathlib.Path) -> pathlib.Path:
+    """Return the path relative to the working directory if it is inside it.
+
+    Args:
+        path: Path to display.
+
+    Returns:
+        Relative path, or the path itself if it is outside the working directory.
+    """
+    with contextlib.suppress(ValueError):
+        return path.relative_to(pathlib.Path.cwd())
+    return path
+
+
 @dataclass
 class CompletedStep:
     timing_ms: str
     message: str
     paths: list[pathlib.Path]
+    notes: list[str] = field(default_factory=list)
+    unchanged_paths: list[pathlib.Path] = field(default_factory=list)
@@ -109,6 +109,17 @@ def cli_command_render(
             ),
         ),
     ] = None,
+    svg_path: Annotated[
+        pathlib.Path | None,
+        typer.Option(
+            "--svg-path",
+            "-svg",
+            help=(
+                "Generate SVG files and save them to the specified path, relative to"
+                " the input file."
+            ),
+        ),
+    ] = None,
     dont_generate_markdown: Annotated[
         bool | None,
         typer.Option(
@@ -134,8 +145,8 @@ def cli_command_render(
             "--dont-generate-typst",
             "-notyp",
             help=(
-                "If provided, the Typst file will not be generated. Disabling Typst"
-                " generation implicitly disables PDF and PNG."
+                "If provided, the Typst file will not be written. PDF, PNG, and SVG"
+                " files are still generated."
             ),
         ),
     ] = None,
@@ -155,6 +166,68 @@ def cli_command_render(
             help="If provided, the PNG file will not be generated.",
         ),
     ] = None,
+    png_ppi: Annotated[
+        int | None,
+        typer.Option(
+            "--png-ppi",
+            help="Resolution of the PNG files in pixels per inch. The default is 144.",
+            min=1,
+        ),
+    ] = None,
+    png_pages: Annotated[
+        list[int] | None,
+        typer.Option(
+            "--png-pages",
+            help=(
+                "Only save the specified page as PNG. Can be repeated, for example"
+                " [cyan bold]--png-pages 1 --png-pages 2[/cyan bold]."
+            ),
+            min=1,
+        ),
+    ] = None,
+    fit_pages: Annotated[
+        int | None,
+        typer.Option(
+            "--fit-pages",
+            help=(
+                "Shrink margins, spacing, and font size until the CV fits on the"
+                " specified number of pages."
+            ),
+            min=1,
+        ),
+    ] = None,
+    cache_dir: Annotated[
+        pathlib.Path | None,
+        typer.Option(
+            "--cache-dir",
+            help=(
+                "Keep caches, such as compiled templates, in the specified directory"
+                " so that later runs start faster."
+            ),
+        ),
+    ] = None,
+    themes: Annotated[
+        str | None,
+        typer.Option(
+            "--themes",
+            help=(
+                "Render the CV with each of the specified built-in themes, separated"
+                " by commas, into a subdirectory per theme. For example,"
+                " [cyan bold]--themes classic,moderncv[/cyan bold]."
+            ),
+        ),
+    ] = None,
+    locales: Annotated[
+        str | None,
+        typer.Option(
+            "--locales",
+            help=(
+                "Render the CV with each of the specified built-in locales, separated"
+                " by commas, into a subdirectory per locale. Combined with"
+                " [cyan bold]--themes[/cyan bold], every combination is rendered."
+            ),
+        ),
+    ] = None,
     watch: Annotated[
         bool | None,
         typer.Option(
@@ -195,11 +268,18 @@ def cli_command_render(
         "markdown_path": markdown_path,
         "html_path": html_path,
         "png_path": png_path,
+        "svg_path": svg_path,
         "dont_generate_typst": dont_generate_typst,
         "dont_generate_html": dont_generate_html,
         "dont_generate_markdown": dont_generate_markdown,
         "dont_generate_pdf": dont_generate_pdf,
         "dont_generate_png": dont_generate_png,
+        "png_ppi": png_ppi,
+        "png_pages": png_pages,
+        "fit_pages": fit_pages,
+        "cache_dir": cache_dir,
+        "themes": split_names(themes),
+        "locales": split_names(locales),
         "overrides": parse_override_arguments(extra_data_model_override_arguments),
     }
     input_file_path = pathlib.Path(input_file_name)
@@ -212,3 +292,17 @@ def cli_command_render(
             )
         else:
             run_rendercv(input_file_path, progress_panel, **arguments)
+
+
+def split_names(names: str | None) -> list[str] | None:
+    """Split a comma-separated option like `--themes classic,moderncv`.
+
+    Args:
+        names: Comma-separated names.
+
+    Returns:
+        Names without surrounding whitespace, or None if none are given.
+    """
+    if names is None:
+        return None
+    return [name.strip() for name in names.split(",") if name.strip()] or None
@@ -1,19 +1,37 @@
+import concurrent.futures
+import dataclasses
+import functools
 import pathlib
 import time
-from collections.abc import Callable
-from typing import Unpack
+from collections.abc import Callable, Mapping
+from typing import Any, Unpack
 
 import jinja2
 import ruamel.yaml
 
-from rendercv.exception import RenderCVUserError, RenderCVUserValidationError
+from rendercv.exception import (
+    RenderCVInternalError,
+    RenderCVUserError,
+    RenderCVUserValidationError,
+)
 from rendercv.renderer.html import generate_html
 from rendercv.renderer.markdown import generate_markdown
-from rendercv.renderer.pdf_png import generate_pdf, generate_png
+from rendercv.renderer.output_writer import is_output_unchanged
+from rendercv.renderer.page_fitter import fit_to_pages
+from rendercv.renderer.pdf_png import (
+    compile_typst,
+    generate_pdf,
+    generate_png,
+    generate_svg,
+)
+from rendercv.renderer.sidebar_balancer import balance_sidebar
+from rendercv.renderer.templater.templater import render_full_template
 from rendercv.renderer.typst import generate_typst
+from rendercv.schema.models.rendercv_model import RenderCVModel
 from rendercv.schema.rendercv_model_builder import (
     BuildRendercvModelArguments,
     build_rendercv_dictionary_and_model,
+    build_rendercv_model_variants,
 )
 
 from .progress_panel import ProgressPanel
@@ -31,11 +49,15 @@ def timed_step[T, **P](
     Why:
         Each generation step (Typst, PDF, PNG) returns file paths. This wrapper
         times execution and automatically displays results in progress panel.
+        Steps that return a dictionary, like the values chosen to fit the page
+        limit, have its items displayed as notes below the step. Outputs that
+        were left as they are because their contents didn't change are marked
+        as unchanged.
 
     Example:
         ```py
         pdf_path = timed_step(
-            "Generated PDF", progress, generate_pdf, rendercv_model, typst_path
+            "Generated PDF", progress, generate_pdf, rendercv_model, typst_document
         )
         # Progress shows: ✓ 150 ms  Generated PDF: ./cv.pdf
         ```
@@ -56,21 +78,222 @@ def timed_step[T, **P](
     timing_ms = f"{(end - start) * 1000:.0f}"
 
     paths: list[pathlib.Path] = []
+    notes: list[str] = []
     if isinstance(result, pathlib.Path):
         paths = [result]
     elif isinstance(result, list) and result:
         if len(result) > 1:
             message = f"{message}s"
         paths = result  # ty: ignore[invalid-assignment]
+    elif isinstance(result, dict) and result:
+        notes = [f"{key}: {value}" for key, value in result.items()]
 
-    if paths:
+    if paths or notes:
         progress_panel.update_progress(
-            time_took=timing_ms, message=message, paths=paths
+            time_took=timing_ms,
+            message=message,
+            paths=paths,
+            notes=notes,
+            unchanged_paths=[path for path in paths if is_output_unchanged(path)],
         )
 
     return result
 
 
+@dataclasses.dataclass(frozen=True)
+class RenderStep:
+    """A step of the output pipeline and the steps whose results it takes.
+
+    The function is called with the CV model followed by the results of the
+    dependencies, in order.
+    """
+
+    message: str
+    func: Callable[..., Any]
+    dependencies: tuple[str, ...] = ()
+
+
+render_steps: dict[str, RenderStep] = {
+    "typst_source": RenderStep(
+        "Rendered Typst", functools.partial(render_full_template, file_type="typst")
+    ),
+    "typst": RenderStep("Generated Typst", generate_typst, ("typst_source",)),
+    "typst_document": RenderStep("Compiled Typst", compile_typst, ("typst_source",)),
+    "pdf": RenderStep("Generated PDF", generate_pdf, ("typst_document",)),
+    "png": RenderStep("Generated PNG", generate_png, ("typst_document",)),
+    "svg": RenderStep("Generated SVG", generate_svg, ("typst_document",)),
+    "markdown_source": RenderStep(
+        "Rendered Markdown",
+        functools.partial(render_full_template, file_type="markdown"),
+    ),
+    "markdown": RenderStep(
+        "Generated Markdown", generate_markdown, ("markdown_source",)
+    ),
+    "html": RenderStep("Generated HTML", generate_html, ("markdown_source",)),
+}
+
+
+# Steps that only produce Markdown and HTML, which are both derived from the
+# Markdown source:
+markdown_render_steps = frozenset({"markdown_source", "markdown", "html"})
+
+
+def get_render_steps(rendercv_model: RenderCVModel) -> dict[str, RenderStep]:
+    """Select the render steps whose outputs are enabled.
+
+    Why:
+        HTML is converted from Markdown, so with Markdown disabled, neither
+        output is generated. Rendering the Markdown source in that case would
+        be wasted work.
+
+    Args:
+        rendercv_model: CV model with the render command settings.
+
+    Returns:
+        Render steps keyed by name.
+    """
+    if not rendercv_model.settings.render_command.dont_generate_markdown:
+        return render_steps
+    return {
+        name: step
+        for name, step in render_steps.items()
+        if name not in markdown_render_steps
+    }
+
+
+def run_render_steps(
+    steps: Mapping[str, RenderStep],
+    progress_panel: ProgressPanel,
+    rendercv_model: RenderCVModel,
+) -> dict[str, Any]:
+    """Run steps on a thread pool as soon as the steps they depend on finish.
+
+    Why:
+        Markdown and HTML don't depend on Typst, and Typst compilation releases
+        the GIL. Running the steps as a dependency graph overlaps independent
+        branches, so Markdown and HTML are rendered while the PDF compiles.
+        Each step still goes through `timed_step`, so it appears in the
+        progress panel when it finishes.
+
+    Example:
+        ```py
+        results = run_render_steps(render_steps, progress, rendercv_model)
+        # Returns: {"typst_source": "...", "pdf": Path("cv.pdf"), ...}
+        ```
+
+    Args:
+        steps: Steps keyed by name. Dependencies refer to these names.
+        progress_panel: Progress panel to update.
+        rendercv_model: CV model passed to every step.
+
+    Returns:
+        Results of all steps keyed by name.
+    """
+    results: dict[str, Any] = {}
+    waiting = dict(steps)
+    running: dict[concurrent.futures.Future, str] = {}
+    with concurrent.futures.ThreadPoolExecutor() as executor:
+        while waiting or running:
+            for name, step in list(waiting.items()):
+                if all(dependency in results for dependency in step.dependencies):
+                    del waiting[name]
+                    future = executor.submit(
+                        functools.partial(
+                            timed_step, step.message, progress_panel, step.func
+                        ),
+                        rendercv_model,
+                        *(results[dependency] for dependency in step.dependencies),
+                    )
+                    running[future] = name
+
+            if not running:
+                message = f"Render steps {list(waiting)} have unmet dependencies."
+                raise RenderCVInternalError(message)
+
+            done, _ = concurrent.futures.wait(
+                running, return_when=concurrent.futures.FIRST_COMPLETED
+            )
+            for future in done:
+                results[running.pop(future)] = future.result()
+
+    return results
+
+
+def render_model(
+    rendercv_model: RenderCVModel, progress: ProgressPanel
+) -> dict[str, Any]:
+    """Adjust the design of a validated model and generate all outputs.
+
+    Args:
+        rendercv_model: Validated CV model. Its design is replaced in place.
+        progress: Progress panel for output display.
+
+    Returns:
+        Results of the render steps keyed by step name.
+    """
+    timed_step(
+        "Balanced the sidebar",
+        progress,
+        balance_sidebar,
+        rendercv_model,
+    )
+    timed_step(
+        "Fitted to the page limit",
+        progress,
+        fit_to_pages,
+        rendercv_model,
+    )
+    return run_render_steps(get_render_steps(rendercv_model), progress, rendercv_model)
+
+
+def render_input_file(
+    main_input_file_path_or_contents: pathlib.Path | str,
+    progress: ProgressPanel,
+    **kwargs: Unpack[BuildRendercvModelArguments],
+) -> dict[str, Any]:
+    """Validate the input, adjust the design, and generate all outputs.
+
+    Why:
+        The render and batch commands run the same pipeline but report errors
+        differently, so errors are raised here and handled by the callers.
+        With `themes` or `locales`, the input is validated once and every
+        theme and locale combination is rendered in parallel, each to its own
+        subdirectory.
+
+    Args:
+        main_input_file_path_or_contents: YAML file path or raw content string.
+        progress: Progress panel for output display.
+        kwargs: Optional overrides for design/locale files, output paths, and generation flags.
+
+    Returns:
+        Results of the render steps keyed by step name. Results of variants are
+        keyed like `moderncv_french/pdf`.
+    """
+    _, rendercv_model = timed_step(
+        "Validated the input file",
+        progress,
+        build_rendercv_dictionary_and_model,
+        main_input_file_path_or_contents,
+        **kwargs,
+    )
+    themes = kwargs.get("themes")
+    locales = kwargs.get("locales")
+    if not themes and not locales:
+        return render_model(rendercv_model, progress)
+
+    variants = build_rendercv_model_variants(rendercv_model, themes, locales)
+    with concurrent.futures.ThreadPoolExecutor() as executor:
+        futures = {
+            variant_name: executor.submit(render_model, variant, progress)
+            for variant_name, variant in variants.items()
+        }
+    return {
+        f"{variant_name}/{step_name}": result
+        for variant_name, future in futures.items()
+        for step_name, result in future.result().items()
+    }
+
+
 def run_rendercv(
     main_input_file_path_or_contents: pathlib.Path | str,
     progress: ProgressPanel,
@@ -80,8 +303,8 @@ def run_rendercv(
 
     Why:
         Orchestrates the full flow: YAML → Pydantic validation → Typst generation →
-        PDF/PNG/HTML/Markdown outputs. Catches all error types and displays them
-        through progress panel for clean CLI experience.
+        PDF/PNG/SVG/HTML/Markdown outputs. Catches all error types and displays
+        them through progress panel for clean CLI experience.
 
     Example:
         ```py
@@ -98,46 +321,7 @@ def run_rendercv(
         kwargs: Optional overrides for design/locale files, output paths, and generation flags.
     """
     try:
-        _, rendercv_model = timed_step(
-            "Validated the input file",
-            progress,
-            build_rendercv_dictionary_and_model,
-            main_input_file_path_or_contents,
-            **kwargs,
-        )
-        typst_path = timed_step(
-            "Generated Typst",
-            progress,
-            generate_typst,
-            rendercv_model,
-        )
-        timed_step(
-            "Generated PDF",
-            progress,
-            generate_pdf,
-            rendercv_model,
-            typst_path,
-        )
-        timed_step(
-            "Generated PNG",
-            progress,
-            generate_png,
-            rendercv_model,
-            typst_path,
-        )
-        md_path = timed_step(
-            "Generated Markdown",
-            progress,
-            generate_markdown,
-            rendercv_model,
-        )
-        timed_step(
-            "Generated HTML",
-            progress,
-            generate_html,
-            rendercv_model,
-            md_path,
-        )
+        render_input_file(main_input_file_path_or_contents, progress, **kwargs)
         progress.finish_progress()
     except RenderCVUserError as e:
         progress.print_user_error(e)
@@ -0,0 +1,376 @@
+import concurrent.futures
+import http.server
+import json
+import pathlib
+import queue
+import socketserver
+import time
+import urllib.parse
+from typing import Any, cast
+
+import jinja2
+import ruamel.yaml
+
+from rendercv.exception import RenderCVUserError, RenderCVUserValidationError
+from rendercv.renderer.pdf_png import (
+    get_typst_compiler_pool_statistics,
+    set_typst_compiler_pool_size,
+)
+from rendercv.renderer.render import OutputFormat, render
+from rendercv.schema.models.rendercv_model import RenderCVModel
+from rendercv.schema.rendercv_model_builder import (
+    build_rendercv_dictionary,
+    build_rendercv_model_from_commented_map,
+)
+
+from ..render_batch_command.run_batch import describe_error
+
+# Output formats the server returns and their content types:
+content_types: dict[OutputFormat, str] = {
+    "pdf": "application/pdf",
+    "png": "image/png",
+    "svg": "image/svg+xml",
+    "html": "text/html; charset=utf-8",
+    "markdown": "text/markdown; charset=utf-8",
+    "typst": "text/plain; charset=utf-8",
+}
+
+# Larger request bodies are rejected before they are read:
+maximum_request_bytes = 10 * 1024 * 1024
+
+
+class RenderService:
+    """Render CVs to bytes with a bounded number of concurrent renders.
+
+    Why:
+        A Typst compiler can't be used by two threads at once, but a compiler
+        per request would lose the warm caches that make a long-running
+        process worth it. Each concurrent render gets a slot with its own
+        Typst root directory, so it gets its own pooled compiler, and the
+        number of slots is the concurrency limit. Requests wait for a free
+        slot for at most the timeout.
+
+    Args:
+        work_directory: Directory for the slots' Typst roots.
+        max_concurrent_renders: Number of renders that can run at once.
+        timeout: Seconds a request may take, including waiting for a slot.
+        cache_dir: Optional directory for caches like processed photos.
+        photo_dir: Optional directory that inputs may use photos from.
+    """
+
+    def __init__(
+        self,
+        work_directory: pathlib.Path,
+        max_concurrent_renders: int,
+        timeout: float,
+        cache_dir: pathlib.Path | None = None,
+        photo_dir: pathlib.Path | None = None,
+    ):
+        self.timeout = timeout
+        self.cache_dir = cache_dir
+        self.photo_dir = photo_dir
+        self.slots: queue.Queue[pathlib.Path] = queue.Queue()
+        for number in range(max_concurrent_renders):
+            slot = work_directory / f"slot_{number}"
+            slot.mkdir(parents=True, exist_ok=True)
+            self.slots.put(slot)
+        self.executor = concurrent.futures.ThreadPoolExecutor(
+            max_workers=max_concurrent_renders
+        )
+
+        pool_size = get_typst_compiler_pool_statistics()["max_size"]
+        if pool_size is not None and pool_size < max_concurrent_renders:
+            set_typst_compiler_pool_size(max_concurrent_renders)
+
+    def render(
+        self, input_contents: str, file_format: OutputFormat, page: int = 1
+    ) -> bytes:
+        """Render a YAML or JSON input in a free slot.
+
+        Args:
+            input_contents: YAML or JSON input.
+            file_format: One of `content_types`.
+            page: Page to return for PNG and SVG, starting from 1.
+
+        Raises:
+            queue.Empty: If no slot became free within the timeout.
+            TimeoutError: If the render didn't finish within the timeout. It
+                keeps its slot until it finishes.
+
+        Returns:
+            Contents of the output.
+        """
+        deadline = time.monotonic() + self.timeout
+        slot = self.slots.get(timeout=self.timeout)
+        try:
+            future = self.executor.submit(
+                self.render_in_slot, slot, input_contents, file_format, page
+            )
+        except BaseException:
+            self.slots.put(slot)
+            raise
+
+        return future.result(timeout=max(0, deadline - time.monotonic()))
+
+    def render_in_slot(
+        self,
+        slot: pathlib.Path,
+        input_contents: str,
+        file_format: OutputFormat,
+        page: int,
+    ) -> bytes:
+        """Render an input with the slot's Typst root, then free the slot.
+
+        Args:
+            slot: Typst root directory of the slot.
+            input_contents: YAML or JSON input.
+            file_format: One of `content_types`.
+            page: Page to return for PNG and SVG, starting from 1.
+
+        Returns:
+            Contents of the output.
+        """
+        try:
+            return render_to_bytes(
+                input_contents, file_format, slot, page, self.cache_dir, self.photo_dir
+            )
+        finally:
+            self.slots.put(slot)
+
+    def shutdown(self) -> None:
+        """Stop accepting renders and wait for the running ones."""
+        self.executor.shutdown(wait=True, cancel_futures=True)
+
+
+def render_to_bytes(
+    input_contents: str,
+    file_format: OutputFormat,
+    typst_root: pathlib.Path,
+    page: int = 1,
+    cache_dir: pathlib.Path | None = None,
+    photo_dir: pathlib.Path | None = None,
+) -> bytes:
+    """Validate an input and render only the requested format, in memory.
+
+    Example:
+        ```py
+        pdf = render_to_bytes(yaml_contents, "pdf", pathlib.Path("/tmp/slot_0"))
+        # Returns: b"%PDF-1.7..."
+        ```
+
+    Args:
+        input_contents: YAML or JSON input.
+        file_format: One of `content_types`.
+        typst_root: Directory that Typst compiles in.
+        page: Page to return for PNG and SVG, starting from 1.
+        cache_dir: Optional directory for caches like processed photos.
+        photo_dir: Optional directory that inputs may use photos from.
+
+    Returns:
+        Contents of the output.
+    """
+    rendercv_model = build_request_model(input_contents, cache_dir, photo_dir)
+    contents = render(rendercv_model, (file_format,), typst_root)[file_format]
+    if isinstance(contents, bytes):
+        return contents
+
+    if not 1 <= page <= len(contents):
+        message = f"The CV has {len(contents)} pages, so there is no page {page}!"
+        raise RenderCVUserError(message)
+    return contents[page - 1]
+
+
+def build_request_model(
+    input_contents: str,
+    cache_dir: pathlib.Path | None = None,
+    photo_dir: pathlib.Path | None = None,
+) -> RenderCVModel:
+    """Validate a request's input without letting it choose files on the server.
+
+    Why:
+        Inputs come from clients, but paths in them are resolved on the
+        server. `settings.render_command` could point the cache directory
+        somewhere else or load design and locale files, so it is replaced by
+        the server's settings. A photo would be read from anywhere on the
+        server, so photos are only accepted from the server's photo directory.
+
+    Args:
+        input_contents: YAML or JSON input.
+        cache_dir: Optional directory for caches like processed photos.
+        photo_dir: Optional directory that inputs may use photos from.
+
+    Returns:
+        Validated model.
+    """
+    input_dictionary = build_rendercv_dictionary(input_contents)
+    input_dictionary["settings"]["render_command"] = (
+        {"cache_dir": cache_dir} if cache_dir else {}
+    )
+
+    cv = input_dictionary.get("cv")
+    photo = cv.get("photo") if isinstance(cv, dict) else None
+    if photo is not None:
+        if photo_dir is None:
+            message = "This server doesn't accept photos!"
+            raise RenderCVUserError(message)
+        photo_path = (photo_dir / str(photo)).resolve()
+        if not photo_path.is_relative_to(photo_dir.resolve()):
+            message = "The photo must be in the server's photo directory!"
+            raise RenderCVUserError(message)
+        cv["photo"] = str(photo_path)
+
+    return build_rendercv_model_from_commented_map(input_dictionary)
+
+
+class RenderRequestHandler(http.server.BaseHTTPRequestHandler):
+    """Serve `POST /render?format=pdf&page=1` and `GET /health`.
+
+    The request body of `/render` is a YAML or JSON input. Errors are returned
+    as JSON objects with an `error` message.
+    """
+
+    server: "RenderHTTPServer | RenderUnixHTTPServer"
+    server_version = "RenderCV"
+    protocol_version = "HTTP/1.1"
+
+    def do_GET(self) -> None:
+        if urllib.parse.urlsplit(self.path).path != "/health":
+            self.send_json(404, {"error": "Not found."})
+            return
+
+        self.send_json(
+            200,
+            {
+                "status": "ok",
+                "typst_compilers": get_typst_compiler_pool_statistics(),
+            },
+        )
+
+    def do_POST(self) -> None:
+        url = urllib.parse.urlsplit(self.path)
+        if url.path != "/render":
+            self.send_json(404, {"error": "Not found."})
+            return
+
+        query = urllib.parse.parse_qs(url.query)
+        requested_format = query.get("format", ["pdf"])[0]
+        if requested_format not in content_types:
+            self.send_json(
+                400, {"error": f"The format must be one of {', '.join(content_types)}."}
+            )
+            return
+        file_format = cast(OutputFormat, requested_format)
+        try:
+            page = int(query.get("page", ["1"])[0])
+        except ValueError:
+            self.send_json(400, {"error": "The page must be an integer."})
+            return
+
+        length = self.headers.get("Content-Length")
+        if length is None or not length.isdigit():
+            self.send_json(411, {"error": "The Content-Length header is required."})
+            return
+        if int(length) > maximum_request_bytes:
+            self.send_json(413, {"error": "The input is too large."})
+            return
+        body = self.rfile.read(int(length))
+
+        try:
+            contents = self.server.render_service.render(
+                body.decode("utf-8"), file_format, page
+            )
+        except queue.Empty:
+            self.send_json(503, {"error": "All renders are busy, try again later."})
+        except TimeoutError:
+            self.send_json(504, {"error": "The render took too long."})
+        except RenderCVUserValidationError as e:
+            self.send_json(
+                422,
+                {
+                    "error": describe_error(e),
+                    "validation_errors": [
+                        {
+                            "location": list(validation_error.location),
+                            "message": validation_error.message,
+                        }
+                        for validation_error in e.validation_errors
+                    ],
+                },
+            )
+        except (
+            RenderCVUserError,
+            UnicodeDecodeError,
+            ruamel.yaml.YAMLError,
+            jinja2.exceptions.TemplateSyntaxError,
+        ) as e:
+            self.send_json(400, {"error": describe_error(e)})
+        # Other errors are bugs, but must not take the server down:
+        except Exception as e:
+            self.send_json(500, {"error": describe_error(e)})
+        else:
+            self.send_bytes(200, content_types[file_format], contents)
+
+    def send_json(self, status: int, body: dict[str, Any]) -> None:
+        self.send_bytes(status, "application/json", json.dumps(body).encode("utf-8"))
+
+    def send_bytes(self, status: int, content_type: str, body: bytes) -> None:
+        self.send_response(status)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def address_string(self) -> str:
+        # Unix socket clients have no address:
+        if isinstance(self.client_address, tuple):
+            return super().address_string()
+        return "unix"
+
+
+class RenderHTTPServer(http.server.ThreadingHTTPServer):
+    """Threading HTTP server on a TCP port that holds the render service."""
+
+    server_address: tuple[str, int]
+    render_service: RenderService
+
+
+class RenderUnixHTTPServer(socketserver.ThreadingMixIn, socketserver.UnixStreamServer):
+    """Threading HTTP server on a Unix socket that holds the render service."""
+
+    daemon_threads = True
+    server_address: str
+    render_service: RenderService
+
+
+def create_render_server(
+    render_service: RenderService,
+    host: str = "127.0.0.1",
+    port: int = 8000,
+    socket_path: pathlib.Path | None = None,
+) -> RenderHTTPServer | RenderUnixHTTPServer:
+    """Create an HTTP server for the render service on a TCP port or Unix socket.
+
+    Example:
+        ```py
+        server = create_render_server(render_service, port=0)
+        threading.Thread(target=server.serve_forever).start()
+        ```
+
+    Args:
+        render_service: Service that renders the requests.
+        host: Host to listen on. Ignored if a socket path is given.
+        port: Port to listen on, or 0 for a free one. Ignored if a socket path
+            is given.
+        socket_path: Unix socket to listen on instead of a TCP port.
+
+    Returns:
+        Server that is bound but not serving yet.
+    """
+    if socket_path is not None:
+        server: RenderHTTPServer | RenderUnixHTTPServer = RenderUnixHTTPServer(
+            str(socket_path), RenderRequestHandler
+        )
+    else:
+        server = RenderHTTPServer((host, port), RenderRequestHandler)
+    server.render_service = render_service
+    return server
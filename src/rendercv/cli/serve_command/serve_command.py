@@ -0,0 +1,116 @@
+import contextlib
+import os
+import pathlib
+import stat
+import tempfile
+from typing import Annotated
+
+import typer
+
+from rendercv.exception import RenderCVUserError
+
+from ..app import app
+from ..error_handler import handle_user_errors
+from ..render_batch_command.run_batch import warm_up_worker
+from .render_server import RenderService, create_render_server
+
+
+@app.command(
+    name="serve",
+    help=(
+        "Serve renders over HTTP from a warm process. Example: [yellow]rendercv"
+        " serve --port 8000[/yellow]. Details: [cyan]rendercv serve --help[/cyan]"
+    ),
+)
+@handle_user_errors
+def cli_command_serve(
+    host: Annotated[
+        str,
+        typer.Option("--host", help="Host to listen on."),
+    ] = "127.0.0.1",
+    port: Annotated[
+        int,
+        typer.Option("--port", "-p", help="Port to listen on.", min=0, max=65535),
+    ] = 8000,
+    socket_path: Annotated[
+        pathlib.Path | None,
+        typer.Option(
+            "--socket",
+            help="Listen on the specified Unix socket instead of a TCP port.",
+        ),
+    ] = None,
+    max_concurrent_renders: Annotated[
+        int | None,
+        typer.Option(
+            "--max-concurrent-renders",
+            "-j",
+            help=(
+                "Number of renders that can run at once. The default is the number of"
+                " CPUs."
+            ),
+            min=1,
+        ),
+    ] = None,
+    timeout: Annotated[
+        float,
+        typer.Option(
+            "--timeout",
+            help=(
+                "Seconds a request may take, including waiting for a free render,"
+                " before it fails."
+            ),
+            min=0.1,
+        ),
+    ] = 60,
+    cache_dir: Annotated[
+        pathlib.Path | None,
+        typer.Option(
+            "--cache-dir",
+            help=(
+                "Keep caches, such as processed photos, in the specified directory"
+                " so that later runs start faster."
+            ),
+        ),
+    ] = None,
+    photo_dir: Annotated[
+        pathlib.Path | None,
+        typer.Option(
+            "--photo-dir",
+            help=(
+                "Let inputs use photos from the specified directory. Photos are"
+                " rejected by default."
+            ),
+        ),
+    ] = None,
+):
+    if socket_path is not None and socket_path.exists():
+        # Only replace the socket a previous server left behind:
+        if not stat.S_ISSOCK(socket_path.stat().st_mode):
+            message = f"{socket_path} exists and isn't a socket!"
+            raise RenderCVUserError(message)
+        socket_path.unlink()
+
+    warm_up_worker(arguments={"cache_dir": cache_dir})
+
+    with tempfile.TemporaryDirectory() as work_directory:
+        render_service = RenderService(
+            pathlib.Path(work_directory),
+            max_concurrent_renders or os.cpu_count() or 1,
+            timeout,
+            cache_dir,
+            photo_dir,
+        )
+        server = create_render_server(render_service, host, port, socket_path)
+        if socket_path is not None:
+            address = f"unix:{socket_path}"
+        else:
+            address = f"http://{host}:{server.server_address[1]}"
+        typer.echo(f"Serving RenderCV on {address} (press Ctrl+C to stop)")
+
+        with contextlib.suppress(KeyboardInterrupt):
+            server.serve_forever()
+
+        server.server_close()
+        render_service.shutdown()
+        if socket_path is not None:
+            socket_path.unlink(missing_ok=True)
@@ -0,0 +1,219 @@
+import asyncio
+import concurrent.futures
+import os
+import pathlib
+import threading
+from collections.abc import Callable, Iterable, Sequence
+from typing import Any, Literal
+
+from rendercv.schema.models.rendercv_model import RenderCVModel
+from rendercv.schema.rendercv_model_builder import (
+    build_rendercv_dictionary_and_model,
+    build_rendercv_model_from_commented_map,
+)
+
+from .pdf_png import CompiledFormat, TypstDocument, compile_typst
+from .render import (
+    OutputFormat,
+    check_output_formats,
+    needs_markdown,
+    needs_typst,
+    prepare_render_model,
+    render_markdown_outputs,
+    render_typst_outputs,
+)
+from .templater.templater import render_full_template
+
+# Validation, templating, and Typst compilation block, so the coroutines below
+# run them on this executor. It is created on first use and shared by all event
+# loops of the process, like the caches the work relies on:
+render_executor: concurrent.futures.ThreadPoolExecutor | None = None
+render_executor_lock = threading.Lock()
+
+
+def get_render_executor() -> concurrent.futures.ThreadPoolExecutor:
+    """Return the executor that runs blocking render work, creating it if needed.
+
+    Why:
+        Running blocking work on the event loop's default executor would let a
+        burst of renders take all of its threads from other blocking calls of
+        the application. A separate executor bounds how many renders run at
+        once, and requests beyond that wait in its queue without blocking the
+        event loop.
+
+    Returns:
+        Executor with one thread per CPU unless `set_render_executor_size`
+        changed it.
+    """
+    global render_executor  # NOQA: PLW0603
+    with render_executor_lock:
+        if render_executor is None:
+            render_executor = concurrent.futures.ThreadPoolExecutor(
+                max_workers=os.cpu_count() or 1, thread_name_prefix="rendercv"
+            )
+        return render_executor
+
+
+def set_render_executor_size(max_workers: int) -> None:
+    """Change how many blocking render steps can run at once.
+
+    Why:
+        Typst compilation releases the GIL and scales with cores, but each
+        concurrent compilation keeps a compiler in memory. Services tune the
+        number to their CPU and memory limits. Steps already running on the
+        previous executor finish there.
+
+    Args:
+        max_workers: Maximum number of threads.
+    """
+    global render_executor  # NOQA: PLW0603
+    with render_executor_lock:
+        previous_executor = render_executor
+        render_executor = concurrent.futures.ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix="rendercv"
+        )
+    if previous_executor is not None:
+        previous_executor.shutdown(wait=False)
+
+
+async def run_in_render_executor[T](func: Callable[..., T], *args: Any) -> T:
+    """Run a blocking function on the render executor without blocking the loop.
+
+    Why:
+        If the awaiting task is cancelled before the function starts, the
+        function doesn't run at all. A function that already started can't be
+        interrupted and finishes in the background, but its result is dropped,
+        and the coroutines below don't start their next step.
+
+    Args:
+        func: Blocking function.
+        args: Positional arguments for func.
+
+    Returns:
+        Function result.
+    """
+    return await asyncio.get_running_loop().run_in_executor(
+        get_render_executor(), func, *args
+    )
+
+
+async def build_rendercv_model_async(
+    input_contents_or_dictionary: str | dict[str, Any],
+) -> RenderCVModel:
+    """Validate YAML contents or a dictionary into a model off the event loop.
+
+    Example:
+        ```py
+        rendercv_model = await build_rendercv_model_async("cv:\\n  name: John Doe\\n")
+        ```
+
+    Args:
+        input_contents_or_dictionary: Contents of an input file, or a dictionary
+            like its parsed contents.
+
+    Returns:
+        Validated RenderCVModel instance.
+    """
+    if isinstance(input_contents_or_dictionary, dict):
+        return await run_in_render_executor(
+            build_rendercv_model_from_commented_map, input_contents_or_dictionary
+        )
+    _, rendercv_model = await run_in_render_executor(
+        build_rendercv_dictionary_and_model, input_contents_or_dictionary
+    )
+    return rendercv_model
+
+
+async def render_full_template_async(
+    rendercv_model: RenderCVModel, file_type: Literal["typst", "markdown"]
+) -> str:
+    """Render the Typst or Markdown source of a model off the event loop.
+
+    Args:
+        rendercv_model: Validated CV model.
+        file_type: Source to render.
+
+    Returns:
+        Rendered source.
+    """
+    return await run_in_render_executor(render_full_template, rendercv_model, file_type)
+
+
+async def compile_typst_async(
+    rendercv_model: RenderCVModel,
+    typst_source: str,
+    formats: Sequence[CompiledFormat] | None = None,
+    typst_root: pathlib.Path | None = None,
+) -> TypstDocument | None:
+    """Compile a Typst source to the given formats off the event loop.
+
+    Args:
+        rendercv_model: CV model for photo handling, fonts, and PNG resolution.
+        typst_source: Typst source to compile.
+        formats: Formats to export. Defaults to the enabled outputs.
+        typst_root: Directory to compile in. Defaults to the directory of the
+            Typst output path.
+
+    Returns:
+        Compiled document, or None if no format is requested.
+    """
+    return await run_in_render_executor(
+        compile_typst, rendercv_model, typst_source, formats, typst_root
+    )
+
+
+async def render_async(
+    rendercv_model: RenderCVModel | dict[str, Any],
+    formats: Iterable[OutputFormat] = ("pdf",),
+    typst_root: pathlib.Path | None = None,
+) -> dict[OutputFormat, bytes | list[bytes]]:
+    """Render a CV to the contents of the requested formats without blocking.
+
+    Why:
+        `render` blocks the calling thread for hundreds of milliseconds, which
+        stalls every other request of an asyncio service. This runs the same
+        steps as `render` on the render executor, so the event loop keeps
+        serving requests, and a cancelled request stops before its next step.
+        Typst and Markdown are rendered concurrently. All requests share the
+        warm caches of the process, like the Typst compiler pool.
+
+    Example:
+        ```py
+        outputs = await render_async({"cv": {"name": "John Doe"}}, ["pdf"])
+        # Returns: {"pdf": b"%PDF-1.7..."}
+        ```
+
+    Args:
+        rendercv_model: Validated CV model, or a dictionary to validate. A given
+            model isn't changed.
+        formats: Formats to render.
+        typst_root: Directory to compile in. Defaults to the photo's directory.
+
+    Returns:
+        Contents keyed by format, in the requested order, like `render`.
+    """
+    formats = check_output_formats(formats)
+    rendercv_model, typst_root = await run_in_render_executor(
+        prepare_render_model, rendercv_model, typst_root
+    )
+
+    outputs: dict[OutputFormat, bytes | list[bytes]] = {}
+
+    async def render_branch(
+        render_outputs: Callable[..., dict[OutputFormat, bytes | list[bytes]]],
+        *args: Any,
+    ) -> None:
+        outputs.update(await run_in_render_executor(render_outputs, *args))
+
+    # A failing or cancelled branch cancels the other one:
+    async with asyncio.TaskGroup() as task_group:
+        if needs_typst(formats):
+            task_group.create_task(
+                render_branch(render_typst_outputs, rendercv_model, formats, typst_root)
+            )
+        if needs_markdown(formats):
+            task_group.create_task(
+                render_branch(render_markdown_outputs, rendercv_model, formats)
+            )
+
+    return {file_format: outputs[file_format] for file_format in formats}
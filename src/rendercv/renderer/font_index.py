@@ -0,0 +1,311 @@
+import functools
+import json
+import pathlib
+import struct
+import threading
+import uuid
+
+import rendercv_fonts
+
+from rendercv.schema.models.rendercv_model import RenderCVModel
+
+font_file_suffixes = frozenset({".ttf", ".otf", ".ttc", ".otc"})
+
+# Connection icons are drawn with Font Awesome, and Typst falls back to the Noto
+# Sans CJK and Mukta fonts for Chinese, Japanese, Korean, and Devanagari text
+# that the design's fonts don't cover. None of them is referenced by the design,
+# but they have to be available to every compiler:
+always_included_font_families = frozenset(
+    {
+        "font awesome 7 free",
+        "font awesome 7 brands",
+        "noto sans jp",
+        "noto sans kr",
+        "noto sans sc",
+        "mukta",
+    }
+)
+
+# The in-memory index is shared by renders running on several threads:
+font_index_lock = threading.Lock()
+
+# Name IDs of the OpenType `name` table, preferring typographic names over the
+# legacy ones like Typst does:
+family_name_ids = (16, 1)
+style_name_ids = (17, 2)
+
+
+def get_font_paths(rendercv_model: RenderCVModel) -> tuple[pathlib.Path, ...]:
+    """List the font folders that contain the families the design uses.
+
+    Why:
+        A Typst compiler reads every font in the folders it is given when it
+        starts. Most CVs use one or two of the bundled families, so passing only
+        their folders makes new compilers start faster. The icon and script
+        fallback fonts are always included. If a referenced family
+        isn't found in any folder, all folders are returned so that fallbacks
+        behave as before.
+
+    Example:
+        ```py
+        font_paths = get_font_paths(rendercv_model)
+        # Returns: (Path(".../rendercv_fonts/Source Sans 3"), ...)
+        ```
+
+    Args:
+        rendercv_model: CV model with the design and input file location.
+
+    Returns:
+        Font folder paths to pass to the Typst compiler.
+    """
+    input_file_path = rendercv_model._input_file_path
+    font_folders = (
+        *rendercv_fonts.paths_to_font_folders,
+        (
+            input_file_path.parent / "fonts"
+            if input_file_path
+            else pathlib.Path.cwd() / "fonts"
+        ),
+    )
+    families = frozenset(
+        family.casefold() for family in get_design_font_families(rendercv_model)
+    )
+
+    font_index = get_font_index(
+        font_folders, rendercv_model.settings.render_command.cache_dir
+    )
+    indexed_families = {
+        font["family"] for fonts in font_index.values() for font in fonts
+    }
+    if not families <= indexed_families:
+        return font_folders
+
+    families |= always_included_font_families
+    return tuple(
+        font_folder
+        for font_folder in font_folders
+        if any(font["family"] in families for font in font_index[str(font_folder)])
+    )
+
+
+def get_design_font_families(rendercv_model: RenderCVModel) -> list[str]:
+    """Collect the font families set in `design.typography.font_family`.
+
+    Args:
+        rendercv_model: CV model with the design.
+
+    Returns:
+        Font family names, possibly with duplicates.
+    """
+    typography = getattr(rendercv_model.design, "typography", None)
+    font_family = getattr(typography, "font_family", None)
+    if font_family is None:
+        return []
+    if isinstance(font_family, str):
+        return [font_family]
+
+    return [value for value in font_family.model_dump().values() if value]
+
+
+def get_font_index(
+    font_folders: tuple[pathlib.Path, ...], cache_directory: pathlib.Path | None
+) -> dict[str, list[dict[str, str]]]:
+    """Return the fonts of each folder, reading only folders that changed.
+
+    Why:
+        Reading the name tables of dozens of font files on every start adds
+        up, while font folders rarely change. The index is kept in memory and,
+        if a cache directory is set, in a JSON file so that new processes can
+        reuse it. Folders are read recursively, so a folder is read again when
+        the modification time of it or of any folder inside it changes, which
+        happens whenever a font is added, removed, or replaced.
+
+    Args:
+        font_folders: Font folders to index.
+        cache_directory: Optional directory for the persistent index.
+
+    Returns:
+        Map of folder paths to their fonts, each with `family`, `style`, and
+        `file` keys. Family names are case folded.
+    """
+    index_path = cache_directory / "font_index.json" if cache_directory else None
+    with font_index_lock:
+        font_index = read_font_index(index_path)
+
+        changed = False
+        for font_folder in font_folders:
+            fingerprint = get_folder_fingerprint(font_folder)
+            entry = font_index.get(str(font_folder))
+            if entry is None or entry.get("fingerprint") != fingerprint:
+                font_index[str(font_folder)] = {
+                    "fingerprint": fingerprint,
+                    "fonts": index_font_folder(font_folder),
+                }
+                changed = True
+
+        if changed and index_path is not None:
+            write_font_index(index_path, font_index)
+
+        return {
+            str(font_folder): font_index[str(font_folder)]["fonts"]
+            for font_folder in font_folders
+        }
+
+
+def write_font_index(index_path: pathlib.Path, font_index: dict) -> None:
+    """Store the font index atomically.
+
+    Why:
+        Batch workers share the cache directory. Writing to a temporary file
+        and renaming it keeps other processes from reading a half-written index.
+
+    Args:
+        index_path: Path to the JSON index.
+        font_index: Map of folder paths to their fingerprint and fonts.
+    """
+    index_path.parent.mkdir(parents=True, exist_ok=True)
+    temporary_path = index_path.with_name(f".{index_path.name}.{uuid.uuid4().hex}.tmp")
+    try:
+        temporary_path.write_text(json.dumps(font_index), encoding="utf-8")
+        temporary_path.replace(index_path)
+    except BaseException:
+        temporary_path.unlink(missing_ok=True)
+        raise
+
+
+@functools.cache
+def read_font_index(index_path: pathlib.Path | None) -> dict:
+    """Load the persistent font index once per process.
+
+    The returned dictionary is updated in place by `get_font_index`, so it also
+    serves as the in-memory index.
+
+    Args:
+        index_path: Path to the JSON index, or None for an in-memory index.
+
+    Returns:
+        Map of folder paths to their fingerprint and fonts.
+    """
+    if index_path is None or not index_path.is_file():
+        return {}
+    try:
+        return json.loads(index_path.read_text(encoding="utf-8"))
+    except ValueError:
+        return {}
+
+
+def get_folder_fingerprint(font_folder: pathlib.Path) -> list[int] | None:
+    """Return the modification times of a folder and the folders inside it.
+
+    Why:
+        Adding, removing, or renaming a file only changes the modification time
+        of the folder that directly contains it. Fonts are indexed recursively,
+        so every folder's time is part of the fingerprint. Listing folders is
+        much cheaper than reading the fonts again.
+
+    Args:
+        font_folder: Folder to check.
+
+    Returns:
+        Modification times in nanoseconds, in a stable order, or None if the
+        folder doesn't exist.
+    """
+    if not font_folder.is_dir():
+        return None
+
+    fingerprint = []
+    for folder, folder_names, _ in font_folder.walk():
+        folder_names.sort()
+        try:
+            fingerprint.append(folder.stat().st_mtime_ns)
+        except FileNotFoundError:
+            continue
+    return fingerprint
+
+
+def index_font_folder(font_folder: pathlib.Path) -> list[dict[str, str]]:
+    """Read the family and style of every font file in a folder.
+
+    Args:
+        font_folder: Folder to read, searched recursively.
+
+    Returns:
+        One dictionary with `family`, `style`, and `file` keys per font.
+    """
+    if not font_folder.is_dir():
+        return []
+
+    fonts = []
+    for font_file in sorted(font_folder.rglob("*")):
+        if font_file.suffix.lower() not in font_file_suffixes:
+            continue
+        try:
+            family, style = read_font_names(font_file.read_bytes())
+        except (struct.error, ValueError, UnicodeDecodeError):
+            continue
+        fonts.append(
+            {"family": family.casefold(), "style": style, "file": str(font_file)}
+        )
+
+    return fonts
+
+
+def read_font_names(font_bytes: bytes) -> tuple[str, str]:
+    """Read the family and style names from the `name` table of a font.
+
+    Why:
+        File and folder names don't reliably match the family names Typst
+        looks fonts up by, and parsing only the `name` table avoids depending
+        on a font library.
+
+    Example:
+        ```py
+        family, style = read_font_names(pathlib.Path("Lato-Bold.ttf").read_bytes())
+        # Returns: ("Lato", "Bold")
+        ```
+
+    Args:
+        font_bytes: Contents of an OpenType, TrueType, or collection file.
+
+    Returns:
+        Family and style names. Only the first font of a collection is read.
+    """
+    offset = 0
+    if font_bytes[:4] == b"ttcf":
+        (offset,) = struct.unpack_from(">I", font_bytes, 12)
+
+    (table_count,) = struct.unpack_from(">H", font_bytes, offset + 4)
+    for table_index in range(table_count):
+        tag, _, table_offset, _ = struct.unpack_from(
+            ">4sIII", font_bytes, offset + 12 + table_index * 16
+        )
+        if tag == b"name":
+            break
+    else:
+        message = "The font has no name table."
+        raise ValueError(message)
+
+    _, record_count, strings_offset = struct.unpack_from(
+        ">HHH", font_bytes, table_offset
+    )
+    names: dict[int, str] = {}
+    for record_index in range(record_count):
+        platform_id, encoding_id, language_id, name_id, length, string_offset = (
+            struct.unpack_from(
+                ">HHHHHH", font_bytes, table_offset + 6 + record_index * 12
+            )
+        )
+        start = table_offset + strings_offset + string_offset
+        string_bytes = font_bytes[start : start + length]
+        if platform_id == 3 and encoding_id in {0, 1} and language_id == 0x409:
+            names[name_id] = string_bytes.decode("utf-16-be")
+        elif platform_id == 1 and encoding_id == 0 and name_id not in names:
+            names[name_id] = string_bytes.decode("latin-1")
+
+    family = next((names[i] for i in family_name_ids if i in names), None)
+    if family is None:
+        message = "The font has no family name."
+        raise ValueError(message)
+    style = next((names[i] for i in style_name_ids if i in names), "Regular")
+
+    return family, style
@@ -2,11 +2,14 @@ import pathlib
 
 from rendercv.schema.models.rendercv_model import RenderCVModel
 
+from .output_writer import write_output, write_output_chunks
 from .path_resolver import resolve_rendercv_file_path
-from .templater.templater import render_full_template
+from .templater.templater import stream_full_template
 
 
-def generate_markdown(rendercv_model: RenderCVModel) -> pathlib.Path | None:
+def generate_markdown(
+    rendercv_model: RenderCVModel, markdown_source: str | None = None
+) -> pathlib.Path | None:
     """Generate Markdown file from CV model via Jinja2 templates.
 
     Why:
@@ -15,6 +18,8 @@ def generate_markdown(rendercv_model: RenderCVModel) -> pathlib.Path | None:
 
     Args:
         rendercv_model: Validated CV model with content.
+        markdown_source: Already rendered source to write. Rendered from the
+            model and streamed to the file if not given.
 
     Returns:
         Path to generated Markdown file, or None if generation disabled.
@@ -24,6 +29,14 @@ def generate_markdown(rendercv_model: RenderCVModel) -> pathlib.Path | None:
     markdown_path = resolve_rendercv_file_path(
         rendercv_model, rendercv_model.settings.render_command.markdown_path
     )
-    markdown_contents = render_full_template(rendercv_model, "markdown")
-    markdown_path.write_text(markdown_contents, encoding="utf-8")
+    if markdown_source is None:
+        write_output_chunks(
+            markdown_path,
+            (
+                chunk.encode("utf-8")
+                for chunk in stream_full_template(rendercv_model, "markdown")
+            ),
+        )
+    else:
+        write_output(markdown_path, markdown_source.encode("utf-8"))
     return markdown_path
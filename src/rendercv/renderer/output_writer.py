@@ -0,0 +1,219 @@
+import collections
+import dataclasses
+import hashlib
+import pathlib
+import shutil
+import threading
+import uuid
+from collections.abc import Iterable
+
+
+@dataclasses.dataclass(frozen=True)
+class OutputRecord:
+    """What an output file looked like after `write_output` last handled it."""
+
+    modification_time: int
+    size: int
+    digest: bytes
+    unchanged: bool
+
+
+# Outputs handled in this process. An output whose modification time and size
+# still match its record isn't read again to compare its contents. A long batch
+# handles many outputs only once, so the least recently used records are
+# dropped beyond the limit:
+output_records: collections.OrderedDict[pathlib.Path, OutputRecord] = (
+    collections.OrderedDict()
+)
+maximum_output_records = 4096
+output_records_lock = threading.Lock()
+
+
+def write_output(path: pathlib.Path, contents: bytes) -> bool:
+    """Write an output file atomically, unless it already has the same contents.
+
+    Why:
+        Rewriting an identical file still changes its modification time, which
+        makes sync tools upload it again and wakes up file watchers. Outputs
+        are compared by content hash and left untouched if they match.
+        Changed outputs are written to a temporary file in the same directory
+        and renamed over the old one, so readers never see a half-written file.
+
+    Example:
+        ```py
+        write_output(pathlib.Path("cv.pdf"), pdf_bytes)
+        # Returns: True
+        write_output(pathlib.Path("cv.pdf"), pdf_bytes)
+        # Returns: False, the file is left as it is
+        ```
+
+    Args:
+        path: Output file path. Its parent directory must exist.
+        contents: Contents to write.
+
+    Returns:
+        True if the file was written, False if it was left unchanged.
+    """
+    digest = hashlib.sha256(contents).digest()
+    unchanged = get_output_digest(path) == digest
+
+    if not unchanged:
+        temporary_path = get_temporary_path(path)
+        try:
+            # Exclusive creation applies the umask like a regular write would:
+            with temporary_path.open("xb") as file:
+                file.write(contents)
+            replace_output(path, temporary_path)
+        except BaseException:
+            temporary_path.unlink(missing_ok=True)
+            raise
+
+    record_output(path, digest, unchanged)
+    return not unchanged
+
+
+def write_output_chunks(path: pathlib.Path, chunks: Iterable[bytes]) -> bool:
+    """Stream an output file atomically, unless it already has the same contents.
+
+    Why:
+        Like `write_output`, but the contents are hashed and written chunk by
+        chunk as they are produced, so long documents never have to be held in
+        memory as a whole. As the digest is only known at the end, the chunks
+        always go to a temporary file, which is dropped if the output already
+        had the same contents.
+
+    Example:
+        ```py
+        write_output_chunks(
+            pathlib.Path("cv.typ"),
+            (chunk.encode("utf-8") for chunk in stream_full_template(model, "typst")),
+        )
+        # Returns: True
+        ```
+
+    Args:
+        path: Output file path. Its parent directory must exist.
+        chunks: Consecutive pieces of the contents.
+
+    Returns:
+        True if the file was written, False if it was left unchanged.
+    """
+    hash_object = hashlib.sha256()
+    temporary_path = get_temporary_path(path)
+    try:
+        with temporary_path.open("xb") as file:
+            for chunk in chunks:
+                hash_object.update(chunk)
+                file.write(chunk)
+        digest = hash_object.digest()
+        unchanged = get_output_digest(path) == digest
+        if unchanged:
+            temporary_path.unlink()
+        else:
+            replace_output(path, temporary_path)
+    except BaseException:
+        temporary_path.unlink(missing_ok=True)
+        raise
+
+    record_output(path, digest, unchanged)
+    return not unchanged
+
+
+def get_temporary_path(path: pathlib.Path) -> pathlib.Path:
+    """Return a unique temporary path next to an output file.
+
+    Args:
+        path: Output file path.
+
+    Returns:
+        Hidden path in the same directory, so renaming it over the output is
+        atomic.
+    """
+    return path.with_name(f".{path.name}.{uuid.uuid4().hex}.tmp")
+
+
+def replace_output(path: pathlib.Path, temporary_path: pathlib.Path) -> None:
+    """Rename a written temporary file over an output, keeping its permissions.
+
+    Args:
+        path: Output file path.
+        temporary_path: Temporary file with the new contents.
+    """
+    if path.is_file():
+        shutil.copymode(path, temporary_path)
+    temporary_path.replace(path)
+
+
+def record_output(path: pathlib.Path, digest: bytes, unchanged: bool) -> None:
+    """Remember what an output looks like after it was written or left as is.
+
+    Args:
+        path: Output file path.
+        digest: SHA-256 digest of its contents.
+        unchanged: Whether it already had the contents.
+    """
+    stat = path.stat()
+    with output_records_lock:
+        output_records[path] = OutputRecord(
+            stat.st_mtime_ns, stat.st_size, digest, unchanged
+        )
+        output_records.move_to_end(path)
+        while len(output_records) > maximum_output_records:
+            output_records.popitem(last=False)
+
+
+def get_output_record(path: pathlib.Path) -> OutputRecord | None:
+    """Return the record of an output and mark it as recently used.
+
+    Args:
+        path: Output file path.
+
+    Returns:
+        Its record, or None if it wasn't handled recently in this process.
+    """
+    with output_records_lock:
+        record = output_records.get(path)
+        if record is not None:
+            output_records.move_to_end(path)
+    return record
+
+
+def get_output_digest(path: pathlib.Path) -> bytes | None:
+    """Return the SHA-256 digest of an existing output file.
+
+    Args:
+        path: Output file path.
+
+    Returns:
+        Digest of the file's contents, or None if it doesn't exist.
+    """
+    try:
+        stat = path.stat()
+    except FileNotFoundError:
+        return None
+
+    record = get_output_record(path)
+    if (
+        record is not None
+        and record.modification_time == stat.st_mtime_ns
+        and record.size == stat.st_size
+    ):
+        return record.digest
+
+    if not path.is_file():
+        return None
+    with path.open("rb") as file:
+        return hashlib.file_digest(file, "sha256").digest()
+
+
+def is_output_unchanged(path: pathlib.Path) -> bool:
+    """Tell whether the last `write_output` call left the file unchanged.
+
+    Args:
+        path: Output file path.
+
+    Returns:
+        True if the file already had the contents it was last given.
+    """
+    record = get_output_record(path)
+    return record is not None and record.unchanged
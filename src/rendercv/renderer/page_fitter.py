@@ -0,0 +1,190 @@
+import pathlib
+import re
+
+from rendercv.exception import RenderCVInternalError
+from rendercv.schema.models.design.design import Design
+from rendercv.schema.models.rendercv_model import RenderCVModel
+
+from .pdf_png import lend_typst_compiler
+from .templater.templater import render_full_template
+
+# Design fields that are shrunk to fit the CV on fewer pages. Spacing fields are
+# scaled fully, font sizes only half as much so that the text stays readable:
+spacing_fields: tuple[tuple[str, ...], ...] = (
+    ("page", "top_margin"),
+    ("page", "bottom_margin"),
+    ("page", "left_margin"),
+    ("page", "right_margin"),
+    ("typography", "line_spacing"),
+    ("sections", "space_between_regular_entries"),
+    ("sections", "space_between_text_based_entries"),
+)
+font_size_fields: tuple[tuple[str, ...], ...] = (("typography", "font_size", "body"),)
+
+minimum_scale = 0.5
+maximum_compiles = 6
+
+dimension_pattern = re.compile(r"(-?\d+(?:\.\d+)?)([a-z]+)")
+# Page objects of a PDF, but not its page tree nodes (`/Type /Pages`):
+pdf_page_pattern = re.compile(rb"/Type\s*/Page(?![A-Za-z])")
+
+
+def fit_to_pages(
+    rendercv_model: RenderCVModel, typst_root: pathlib.Path | None = None
+) -> dict[str, str]:
+    """Shrink spacing and font sizes until the CV fits on the requested pages.
+
+    Why:
+        Many CVs have a hard page limit, and reaching it by hand means tweaking
+        margins and font sizes and re-running repeatedly. This searches a
+        single shrink factor with bisection, using the page count of the warm
+        Typst compiler as feedback, and never compiles more than
+        `maximum_compiles` times. The chosen design replaces the model's design
+        so that the following steps produce the fitted outputs.
+
+    Example:
+        ```py
+        rendercv_model.settings.render_command.fit_pages = 2
+        overrides = fit_to_pages(rendercv_model)
+        # Returns: {"design.page.top_margin": "0.525in", ...}
+        ```
+
+    Args:
+        rendercv_model: CV model to fit. Its design is replaced in place.
+        typst_root: Directory to compile in. Defaults to the directory of the
+            Typst output path.
+
+    Returns:
+        Chosen design values keyed by their override path, or an empty
+        dictionary if no change was needed or fitting is disabled.
+    """
+    page_limit = rendercv_model.settings.render_command.fit_pages
+    if page_limit is None:
+        return {}
+
+    original_design = rendercv_model.design
+
+    def count_pages_at(scale: float) -> int:
+        rendercv_model.design = scale_design(original_design, scale)
+        return count_pages(rendercv_model, typst_root)
+
+    if count_pages_at(1.0) <= page_limit:
+        rendercv_model.design = original_design
+        return {}
+
+    # Bisect between a scale that fits (low) and one that doesn't (high). If even
+    # the minimum scale doesn't fit, it is still the closest result:
+    low, high = minimum_scale, 1.0
+    if count_pages_at(low) <= page_limit:
+        for _ in range(maximum_compiles - 2):
+            middle = (low + high) / 2
+            if count_pages_at(middle) <= page_limit:
+                low = middle
+            else:
+                high = middle
+
+    rendercv_model.design = scale_design(original_design, low)
+    return get_scaled_values(rendercv_model.design)
+
+
+def count_pages(
+    rendercv_model: RenderCVModel, typst_root: pathlib.Path | None = None
+) -> int:
+    """Render the Typst source in memory and count the pages it compiles to.
+
+    Why:
+        The page count is needed for every bisection step. Exporting SVG or
+        PNG pages encodes all of their contents, while PDF export is several
+        times faster, and the pages can be counted from the PDF's page objects.
+
+    Args:
+        rendercv_model: CV model to compile.
+        typst_root: Directory to compile in. Defaults to the directory of the
+            Typst output path.
+
+    Returns:
+        Number of pages.
+    """
+    typst_source = render_full_template(rendercv_model, "typst")
+    with lend_typst_compiler(rendercv_model, typst_root) as typst_compiler:
+        pdf = typst_compiler.compile(input=typst_source.encode("utf-8"), format="pdf")
+
+    page_count = len(pdf_page_pattern.findall(pdf)) if isinstance(pdf, bytes) else 0
+    if page_count == 0:
+        message = "Typst compiler returned a PDF without pages."
+        raise RenderCVInternalError(message)
+    return page_count
+
+
+def scale_design(design: Design, scale: float) -> Design:
+    """Return a copy of the design with spacing and font sizes scaled.
+
+    Args:
+        design: Design to scale.
+        scale: Factor for spacing fields; font sizes use a gentler factor.
+
+    Returns:
+        Scaled copy of the design.
+    """
+    design = design.model_copy(deep=True)
+    font_scale = 1 - (1 - scale) / 2
+    for fields, field_scale in (
+        (spacing_fields, scale),
+        (font_size_fields, font_scale),
+    ):
+        for field_path in fields:
+            parent = design
+            for name in field_path[:-1]:
+                parent = getattr(parent, name, None)
+            if parent is None or not hasattr(parent, field_path[-1]):
+                continue
+
+            dimension = getattr(parent, field_path[-1])
+            setattr(parent, field_path[-1], scale_dimension(dimension, field_scale))
+
+    return design
+
+
+def scale_dimension(dimension: str, scale: float) -> str:
+    """Multiply a Typst dimension by a factor, keeping its unit.
+
+    Example:
+        ```py
+        result = scale_dimension("0.7in", 0.5)
+        # Returns: "0.35in"
+        ```
+
+    Args:
+        dimension: Typst dimension such as `10pt`.
+        scale: Factor to multiply by.
+
+    Returns:
+        Scaled dimension with the same unit.
+    """
+    match = dimension_pattern.fullmatch(dimension)
+    if match is None:
+        message = f"{dimension} is not a Typst dimension."
+        raise RenderCVInternalError(message)
+
+    value = round(float(match.group(1)) * scale, 3)
+    return f"{value:g}{match.group(2)}"
+
+
+def get_scaled_values(design: Design) -> dict[str, str]:
+    """Collect the values of all scaled fields, keyed by their override path.
+
+    Args:
+        design: Scaled design.
+
+    Returns:
+        Map of paths like `design.page.top_margin` to dimensions.
+    """
+    scaled_values: dict[str, str] = {}
+    for field_path in (*spacing_fields, *font_size_fields):
+        value: object = design
+        for name in field_path:
+            value = getattr(value, name, None)
+        if value is not None:
+            scaled_values[".".join(("design", *field_path))] = str(value)
+
+    return scaled_values
@@ -1,20 +1,348 @@
+import concurrent.futures
+import contextlib
+import dataclasses
 import functools
+import json
 import pathlib
-import shutil
+import threading
+from collections.abc import Iterator, Sequence
+from datetime import UTC
+from datetime import datetime as DateTime
+from typing import Any, Literal
 
-import rendercv_fonts
 import typst
 
 from rendercv.exception import RenderCVInternalError
 from rendercv.schema.models.rendercv_model import RenderCVModel
+from rendercv.schema.models.validation_context import get_source_date_epoch
 
+from .font_index import get_font_paths
+from .output_writer import write_output
 from .path_resolver import resolve_rendercv_file_path
+from .photo import place_photo
+
+# Typst packages shipped with RenderCV, laid out as `namespace/name/version`, so
+# that imports like `@preview/rendercv` resolve without network access. The
+# folder is filled by `just update-typst-packages` when wheels and executables
+# are built. Packages that aren't found here are still looked up in Typst's
+# cache and registry:
+typst_package_path = pathlib.Path(__file__).parent / "typst_packages"
+
+type CompiledFormat = Literal["pdf", "png", "svg"]
+
+# Ids of the pooled compilers that `lend_typst_compiler` has lent out, and the
+# compilers it created for when they were, keyed by root and font paths:
+lent_typst_compilers: set[int] = set()
+spare_typst_compilers: dict[
+    tuple[pathlib.Path, tuple[pathlib.Path, ...]], list[typst.Compiler]
+] = {}
+lent_typst_compilers_lock = threading.Lock()
+
+
+@dataclasses.dataclass
+class TypstDocument:
+    """Exports of a compiled Typst document, one field per output format."""
+
+    pdf: bytes | None = None
+    png: list[bytes] | None = None
+    svg: list[bytes] | None = None
+
+
+def compile_typst(
+    rendercv_model: RenderCVModel,
+    typst_source: str | None,
+    formats: Sequence[CompiledFormat] | None = None,
+    typst_root: pathlib.Path | None = None,
+) -> TypstDocument | None:
+    """Lay out the Typst document once and export every requested format from it.
+
+    Why:
+        Typst layout is the most expensive step of rendering. Exporting PDF,
+        PNG, and SVG with separate compilations would lay out the document for
+        each of them. All exports here go through the same warm compiler in a
+        single stage, so the layout of the first export is reused by the
+        others and only the encoding differs. The source is passed from
+        memory, so the Typst file doesn't need to be written first. The
+        creation date is fixed by `get_typst_timestamp`, so the same input
+        always gives the same bytes.
+
+    Example:
+        ```py
+        typst_source = render_full_template(rendercv_model, "typst")
+        typst_document = compile_typst(rendercv_model, typst_source)
+        pdf_path = generate_pdf(rendercv_model, typst_document)
+        ```
+
+    Args:
+        rendercv_model: CV model for output settings and photo handling.
+        typst_source: Typst source to compile.
+        formats: Formats to export, among `pdf`, `png`, and `svg`. Defaults to
+            the formats the output settings enable.
+        typst_root: Directory to compile in. Defaults to the directory of the
+            Typst output path.
+
+    Returns:
+        Exported bytes of the requested formats, or None if there are none.
+    """
+    render_command = rendercv_model.settings.render_command
+    if formats is None:
+        formats = get_enabled_compiled_formats(rendercv_model)
+    if typst_source is None or not formats:
+        return None
+
+    source = typst_source.encode("utf-8")
+    timestamp = get_typst_timestamp(rendercv_model)
+
+    typst_document = TypstDocument()
+    with lend_typst_compiler(rendercv_model, typst_root) as typst_compiler:
+        for file_format in formats:
+            exported = typst_compiler.compile(
+                input=source,
+                format=file_format,
+                ppi=render_command.png_ppi if file_format == "png" else None,
+                timestamp=timestamp,
+            )
+            if file_format == "pdf":
+                typst_document.pdf = exported  # ty: ignore[invalid-assignment]
+            else:
+                pages = exported if isinstance(exported, list) else [exported]
+                setattr(typst_document, file_format, pages)
+
+    return typst_document
+
+
+def get_enabled_compiled_formats(rendercv_model: RenderCVModel) -> list[CompiledFormat]:
+    """Return the compiled formats the output settings enable.
+
+    Args:
+        rendercv_model: CV model with output settings.
+
+    Returns:
+        Enabled formats among `pdf`, `png`, and `svg`.
+    """
+    render_command = rendercv_model.settings.render_command
+    enabled_formats: dict[CompiledFormat, bool] = {
+        "pdf": not render_command.dont_generate_pdf,
+        "png": not render_command.dont_generate_png,
+        "svg": render_command.svg_path is not None,
+    }
+    return [file_format for file_format, enabled in enabled_formats.items() if enabled]
+
+
+def get_typst_timestamp(rendercv_model: RenderCVModel) -> int:
+    """Return the creation time to put in the document metadata.
+
+    Why:
+        Typst stamps PDFs with the time of compilation, so identical inputs
+        give different bytes and content-addressed caches never hit. The time
+        is taken from `SOURCE_DATE_EPOCH` if it is set, like reproducible
+        builds expect, and otherwise from midnight UTC of
+        `settings.current_date`.
+
+    Example:
+        ```py
+        rendercv_model.settings.current_date = Date(2025, 1, 31)
+        timestamp = get_typst_timestamp(rendercv_model)
+        # Returns: 1738281600
+        ```
+
+    Args:
+        rendercv_model: CV model with the current date.
+
+    Returns:
+        Seconds since the Unix epoch.
+    """
+    source_date_epoch = get_source_date_epoch()
+    if source_date_epoch is not None:
+        return source_date_epoch
+
+    current_date = rendercv_model.settings.current_date
+    return int(
+        DateTime(
+            current_date.year, current_date.month, current_date.day, tzinfo=UTC
+        ).timestamp()
+    )
+
+
+def query_typst(
+    rendercv_model: RenderCVModel,
+    typst_source: str,
+    selector: str,
+    typst_root: pathlib.Path | None = None,
+) -> list[Any]:
+    """Return the values of the metadata matching a selector in the laid-out source.
+
+    Why:
+        Features like sidebar balancing need positions that are only known
+        after layout. `typst.Compiler.query` takes no input and only queries
+        the document given when the compiler is created, so the pooled
+        compilers, which get their source with each compile, can't be used.
+        This creates a compiler for the in-memory source instead.
+
+    Example:
+        ```py
+        markers = query_typst(rendercv_model, typst_source, "<marker>")
+        # Returns: [{"column": "sidebar", ...}, ...]
+        ```
+
+    Args:
+        rendercv_model: CV model for photo handling and font resolution.
+        typst_source: Typst source to lay out.
+        selector: Typst selector, such as a label.
+        typst_root: Directory to compile in. Defaults to the directory of the
+            Typst output path.
+
+    Returns:
+        Values of the matching metadata elements in document order.
+    """
+    if typst_root is None:
+        typst_root = get_typst_root(rendercv_model)
+    place_photo(rendercv_model, typst_root)
+    # The stub ties the font paths' type to the input's, so the folders are
+    # passed as a font collection:
+    fonts = typst.Fonts(font_paths=list(get_font_paths(rendercv_model)))
+    typst_compiler = typst.Compiler(
+        typst_source.encode("utf-8"),
+        root=typst_root,
+        font_paths=fonts,
+        package_path=get_typst_package_path(),
+    )
+
+    return json.loads(typst_compiler.query(selector, field="value"))
+
+
+@contextlib.contextmanager
+def lend_typst_compiler(
+    rendercv_model: RenderCVModel, typst_root: pathlib.Path | None = None
+) -> Iterator[typst.Compiler]:
+    """Lend the warm compiler for the model, with the photo placed for it.
+
+    Why:
+        A Typst compiler can't compile on two threads at once. Renders that run
+        at the same time with the same root and fonts, like the variants of a
+        theme matrix or concurrent requests to a service, would otherwise share
+        the pooled compiler and fail. It is lent to one of them at a time, and
+        the others get spare compilers. Spares are kept for the next time the
+        pooled compiler is busy, so concurrent renders stay warm too. At most as
+        many spares as the pool size are kept in total, and extra ones are
+        dropped, so bursts of concurrent renders don't keep compilers forever.
+
+    Example:
+        ```py
+        with lend_typst_compiler(rendercv_model) as typst_compiler:
+            pdf = typst_compiler.compile(input=source, format="pdf")
+        ```
+
+    Args:
+        rendercv_model: CV model for photo handling and font resolution.
+        typst_root: Directory to compile in. Defaults to the directory of the
+            Typst output path.
+
+    Returns:
+        Typst compiler for the root directory, used by no other thread.
+    """
+    if typst_root is None:
+        typst_root = get_typst_root(rendercv_model)
+    place_photo(rendercv_model, typst_root)
+    font_paths = get_font_paths(rendercv_model)
+
+    typst_compiler = get_typst_compiler(typst_root, font_paths)
+    # A compiler in the set is referenced by its borrower, so its id can't be
+    # reused by another object until it is returned:
+    with lent_typst_compilers_lock:
+        lent = id(typst_compiler) in lent_typst_compilers
+        if not lent:
+            lent_typst_compilers.add(id(typst_compiler))
+
+    if lent:
+        key = (typst_root, font_paths)
+        with lent_typst_compilers_lock:
+            spare = None
+            if spares := spare_typst_compilers.get(key):
+                spare = spares.pop()
+                if not spares:
+                    del spare_typst_compilers[key]
+        if spare is None:
+            spare = create_typst_compiler(typst_root, font_paths)
+        try:
+            yield spare
+        finally:
+            maximum_spares = typst_compiler_pool.cache_info().maxsize
+            with lent_typst_compilers_lock:
+                spare_count = sum(map(len, spare_typst_compilers.values()))
+                if maximum_spares is None or spare_count < maximum_spares:
+                    spare_typst_compilers.setdefault(key, []).append(spare)
+        return
+
+    try:
+        yield typst_compiler
+    finally:
+        with lent_typst_compilers_lock:
+            lent_typst_compilers.discard(id(typst_compiler))
+
+
+def get_typst_package_path() -> str | None:
+    """Return the folder of the vendored Typst packages if it exists.
+
+    Why:
+        Source checkouts don't contain the vendored packages until
+        `just update-typst-packages` runs. Without them, compilers use Typst's
+        default package cache, like before packages were vendored.
+
+    Returns:
+        Path of `typst_package_path`, or None if it doesn't exist.
+    """
+    if typst_package_path.is_dir():
+        return str(typst_package_path)
+    return None
+
+
+def get_typst_root(rendercv_model: RenderCVModel) -> pathlib.Path:
+    """Return the directory Typst resolves relative paths, like the photo, from.
+
+    Why:
+        In-memory sources have no location of their own. The directory of the
+        Typst output path is used, so paths resolve the same whether or not
+        the Typst file is written.
+
+    Args:
+        rendercv_model: CV model with the Typst output path.
+
+    Returns:
+        Directory of the resolved Typst output path.
+    """
+    return resolve_rendercv_file_path(
+        rendercv_model, rendercv_model.settings.render_command.typst_path
+    ).parent
+
+
+def get_in_memory_typst_root(rendercv_model: RenderCVModel) -> pathlib.Path:
+    """Return a directory to compile in without writing any file first.
+
+    Why:
+        Compiling in the Typst output directory means creating it and copying
+        the photo there. The photo's own directory already contains the photo,
+        so `place_photo` leaves it where it is. Without a photo, nothing is
+        read from the root, and the input file's directory, or the current
+        one, is used.
+
+    Args:
+        rendercv_model: CV model with the photo and input file location.
+
+    Returns:
+        Existing directory to use as the Typst root.
+    """
+    if rendercv_model.cv.photo:
+        return rendercv_model.cv.photo.parent
+
+    input_file_path = rendercv_model._input_file_path
+    return input_file_path.parent if input_file_path else pathlib.Path.cwd()
 
 
 def generate_pdf(
-    rendercv_model: RenderCVModel, typst_path: pathlib.Path | None
+    rendercv_model: RenderCVModel, typst_document: TypstDocument | None
 ) -> pathlib.Path | None:
-    """Compile Typst source to PDF using typst-py compiler.
+    """Write the PDF export of the compiled Typst document.
 
     Why:
         PDF is the primary output format for CVs. Typst compilation produces
@@ -22,114 +350,244 @@ def generate_pdf(
         intermediate Typst markup.
 
     Args:
-        rendercv_model: CV model for path resolution and photo handling.
-        typst_path: Path to Typst source file to compile.
+        rendercv_model: CV model for path resolution.
+        typst_document: Compiled Typst document.
 
     Returns:
         Path to generated PDF file, or None if generation disabled.
     """
-    if rendercv_model.settings.render_command.dont_generate_pdf or typst_path is None:
+    if (
+        rendercv_model.settings.render_command.dont_generate_pdf
+        or typst_document is None
+        or typst_document.pdf is None
+    ):
         return None
     pdf_path = resolve_rendercv_file_path(
         rendercv_model, rendercv_model.settings.render_command.pdf_path
     )
-    typst_compiler = get_typst_compiler(typst_path, rendercv_model._input_file_path)
-    copy_photo_next_to_typst_file(rendercv_model, typst_path)
-    typst_compiler.compile(format="pdf", output=pdf_path)
+    write_output(pdf_path, typst_document.pdf)
 
     return pdf_path
 
 
 def generate_png(
-    rendercv_model: RenderCVModel, typst_path: pathlib.Path | None
+    rendercv_model: RenderCVModel, typst_document: TypstDocument | None
 ) -> list[pathlib.Path] | None:
-    """Compile Typst source to PNG images using typst-py compiler.
+    """Write the PNG exports of the compiled Typst document.
 
     Why:
         PNG format enables CV preview in web applications and README files.
         Multi-page CVs produce multiple PNG files with sequential numbering.
+        Previews usually need only some pages at a low resolution, which the
+        `png_pages` and `png_ppi` settings select.
 
     Args:
-        rendercv_model: CV model for path resolution and photo handling.
-        typst_path: Path to Typst source file to compile.
+        rendercv_model: CV model for path resolution.
+        typst_document: Compiled Typst document.
 
     Returns:
         List of paths to generated PNG files, or None if generation disabled.
     """
-    if rendercv_model.settings.render_command.dont_generate_png or typst_path is None:
+    if (
+        rendercv_model.settings.render_command.dont_generate_png
+        or typst_document is None
+    ):
         return None
     png_path = resolve_rendercv_file_path(
         rendercv_model, rendercv_model.settings.render_command.png_path
     )
-    typst_compiler = get_typst_compiler(typst_path, rendercv_model._input_file_path)
-    copy_photo_next_to_typst_file(rendercv_model, typst_path)
-    png_files_bytes = typst_compiler.compile(format="png")
 
-    if not isinstance(png_files_bytes, list):
-        png_files_bytes = [png_files_bytes]
+    return write_pages(
+        typst_document.png,
+        png_path,
+        rendercv_model.settings.render_command.png_pages,
+    )
+
+
+def generate_svg(
+    rendercv_model: RenderCVModel, typst_document: TypstDocument | None
+) -> list[pathlib.Path] | None:
+    """Write the SVG exports of the compiled Typst document.
+
+    Why:
+        SVG pages scale without blurring, which suits CVs embedded in websites.
+        They are only generated when an SVG path is set.
+
+    Args:
+        rendercv_model: CV model for path resolution.
+        typst_document: Compiled Typst document.
 
-    png_files = []
-    for i, png_file_bytes in enumerate(png_files_bytes):
-        if png_file_bytes is None:
-            raise RenderCVInternalError("Typst compiler returned None for PNG bytes")
-        png_file = png_path.parent / (png_path.stem + f"_{i + 1}.png")
-        png_file.write_bytes(png_file_bytes)
-        png_files.append(png_file)
+    Returns:
+        List of paths to generated SVG files, or None if generation disabled.
+    """
+    svg_path = rendercv_model.settings.render_command.svg_path
+    if svg_path is None or typst_document is None:
+        return None
+    svg_path = resolve_rendercv_file_path(rendercv_model, svg_path)
 
-    return png_files if png_files else None
+    return write_pages(typst_document.svg, svg_path)
 
 
-def copy_photo_next_to_typst_file(
-    rendercv_model: RenderCVModel, typst_path: pathlib.Path
-) -> None:
-    """Copy CV photo to Typst file directory for compilation.
+def write_pages(
+    pages: list[bytes] | None,
+    path: pathlib.Path,
+    page_numbers: list[int] | None = None,
+) -> list[pathlib.Path] | None:
+    """Write one file per page, numbering them after the stem of the given path.
 
     Why:
-        Typst compiler resolves image paths relative to source file location.
-        Copying photo ensures compilation succeeds regardless of original
-        photo location.
+        Multi-page CVs produce many files. They are written on a thread pool
+        because writing releases the GIL, which matters for services that
+        export previews of many CVs. Pages that didn't change aren't rewritten.
+
+    Example:
+        ```py
+        files = write_pages([b"...", b"...", b"..."], pathlib.Path("cv.png"), [1, 3])
+        # Returns: [Path("cv_1.png"), Path("cv_3.png")]
+        ```
 
     Args:
-        rendercv_model: CV model containing photo path.
-        typst_path: Path to Typst source file.
+        pages: Exported bytes of each page.
+        path: Output path whose stem and suffix the page files use.
+        page_numbers: Page numbers to write, starting from 1. Pages that don't
+            exist and repeated numbers are skipped. All pages are written if
+            not given.
+
+    Returns:
+        Paths to the written files, or None if there are no pages.
     """
-    if rendercv_model.cv.photo:
-        photo_path = rendercv_model.cv.photo
-        copy_to = typst_path.parent / photo_path.name
-        if photo_path != copy_to:
-            shutil.copy(
-                rendercv_model.cv.photo,
-                typst_path.parent / rendercv_model.cv.photo.name,
+    pages = pages or []
+    if page_numbers is None:
+        page_numbers = list(range(1, len(pages) + 1))
+    # Writing the same page twice at once would race on its file:
+    page_numbers = [
+        number for number in dict.fromkeys(page_numbers) if 1 <= number <= len(pages)
+    ]
+
+    files = []
+    for number in page_numbers:
+        if pages[number - 1] is None:
+            file_format = path.suffix.removeprefix(".").upper()
+            message = f"Typst compiler returned None for {file_format} bytes"
+            raise RenderCVInternalError(message)
+        files.append(path.parent / (path.stem + f"_{number}{path.suffix}"))
+
+    if len(files) > 1:
+        with concurrent.futures.ThreadPoolExecutor() as executor:
+            list(
+                executor.map(
+                    write_output,
+                    files,
+                    [pages[number - 1] for number in page_numbers],
+                )
             )
+    elif files:
+        write_output(files[0], pages[page_numbers[0] - 1])
 
+    return files if files else None
 
-@functools.lru_cache(maxsize=1)
-def get_typst_compiler(
-    file_path: pathlib.Path,
-    input_file_path: pathlib.Path | None,
+
+def create_typst_compiler(
+    root: pathlib.Path, font_paths: tuple[pathlib.Path, ...]
 ) -> typst.Compiler:
-    """Create cached Typst compiler with font paths configured.
+    """Create a Typst compiler for a root directory and font folders.
 
     Why:
-        Compiler initialization is expensive. Caching enables reuse for both
-        PDF and PNG generation. Font paths include package fonts and optional
-        user fonts from input file directory.
+        Compiler initialization is expensive. Reusing a compiler enables reuse
+        for all exports and keeps Typst's layout memoized between them, so
+        recompiling an edited source only lays out what changed. Watch mode and
+        services that render CVs from several directories alternate between
+        roots, so a pool of compilers, instead of a single one, keeps the
+        incremental caches of each of them alive across renders. Packages are
+        resolved from `typst_package_path` first if it exists, so the first
+        compilation on a fresh machine doesn't wait for, or fail on, a download.
 
     Args:
-        file_path: Typst source file to compile.
-        input_file_path: Original input file path for relative font resolution.
+        root: Directory that relative paths in the source resolve from.
+        font_paths: Font folders the compiler searches.
 
     Returns:
         Configured Typst compiler instance.
     """
     return typst.Compiler(
-        file_path,
-        font_paths=[
-            *rendercv_fonts.paths_to_font_folders,
-            (
-                input_file_path.parent / "fonts"
-                if input_file_path
-                else pathlib.Path.cwd() / "fonts"
-            ),
-        ],
+        root=root,
+        font_paths=list(font_paths),
+        package_path=get_typst_package_path(),
     )
+
+
+# Looked up on every call of `get_typst_compiler`, so resizing the pool also
+# reaches modules that imported the function:
+typst_compiler_pool = functools.lru_cache(maxsize=8)(create_typst_compiler)
+
+
+def get_typst_compiler(
+    root: pathlib.Path, font_paths: tuple[pathlib.Path, ...]
+) -> typst.Compiler:
+    """Return the pooled Typst compiler for a root and fonts, creating it if needed.
+
+    Args:
+        root: Directory that relative paths in the source resolve from.
+        font_paths: Font folders the compiler searches.
+
+    Returns:
+        Pooled Typst compiler instance.
+    """
+    return typst_compiler_pool(root, font_paths)
+
+
+def set_typst_compiler_pool_size(maxsize: int | None) -> None:
+    """Change how many Typst compilers are kept in memory.
+
+    Why:
+        Each compiler holds loaded fonts and layout caches. Long-running
+        processes that render CVs from many directories need a larger pool,
+        while memory-constrained ones may want a smaller one. Changing the size
+        drops the pooled and spare compilers.
+
+    Args:
+        maxsize: Maximum number of pooled compilers, or None for no limit.
+    """
+    global typst_compiler_pool  # NOQA: PLW0603
+    typst_compiler_pool = functools.lru_cache(maxsize=maxsize)(create_typst_compiler)
+    with lent_typst_compilers_lock:
+        spare_typst_compilers.clear()
+
+
+def clear_typst_compiler_pool() -> None:
+    """Drop all pooled Typst compilers and free their caches.
+
+    Why:
+        Services may want to release memory when idle or after fonts in a font
+        folder change, because a pooled compiler keeps the fonts it loaded.
+    """
+    typst_compiler_pool.cache_clear()
+    with lent_typst_compilers_lock:
+        spare_typst_compilers.clear()
+
+
+def get_typst_compiler_pool_statistics() -> dict[str, int | None]:
+    """Report how often a pooled Typst compiler was reused.
+
+    Why:
+        A compiler is only fast for edited sources if it is reused. Hits and
+        misses show whether the pool is large enough for the workload.
+
+    Example:
+        ```py
+        statistics = get_typst_compiler_pool_statistics()
+        # Returns: {"hits": 12, "misses": 1, "size": 1, "max_size": 8}
+        ```
+
+    Returns:
+        Number of reused compilers (`hits`), created compilers (`misses`),
+        pooled compilers (`size`), and the pool limit (`max_size`, None for no
+        limit).
+    """
+    cache_info = typst_compiler_pool.cache_info()
+    return {
+        "hits": cache_info.hits,
+        "misses": cache_info.misses,
+        "size": cache_info.currsize,
+        "max_size": cache_info.maxsize,
+    }
@@ -0,0 +1,175 @@
+import functools
+import hashlib
+import io
+import pathlib
+import re
+
+from rendercv.schema.models.rendercv_model import RenderCVModel
+
+from .output_writer import write_output
+
+# Resolution the photo is downscaled to at its printed width. 300 DPI is print
+# quality, anything above it only makes the PDF larger:
+photo_dpi = 300
+
+# Formats that are downscaled. Others, like SVG, are used as they are:
+downscaled_photo_formats = frozenset({"JPEG", "PNG", "WEBP"})
+
+inches_per_unit = {"in": 1.0, "cm": 1 / 2.54, "mm": 1 / 25.4, "pt": 1 / 72}
+dimension_pattern = re.compile(r"(\d+(?:\.\d+)?)(cm|in|pt|mm)")
+
+
+def place_photo(rendercv_model: RenderCVModel, typst_root: pathlib.Path) -> None:
+    """Put the processed CV photo in the Typst root directory if it changed.
+
+    Why:
+        Typst resolves the photo relative to the root directory, so it has to
+        be there. Copying it on every compilation wastes I/O and changes the
+        file's modification time, which makes Typst decode it again. Camera
+        photos are also often far larger than the printed size needs. The
+        photo is downscaled once per content, and the file in the root is
+        only written when its contents differ.
+
+    Args:
+        rendercv_model: CV model containing photo path and header design.
+        typst_root: Root directory of the Typst compilation.
+    """
+    photo_path = rendercv_model.cv.photo
+    if not photo_path:
+        return
+
+    target = typst_root / photo_path.name
+    if target == photo_path:
+        # Never overwrite the user's original photo:
+        return
+
+    header = getattr(rendercv_model.design, "header", None)
+    width = get_width_in_pixels(getattr(header, "photo_width", ""))
+    cache_directory = rendercv_model.settings.render_command.cache_dir
+    stat = photo_path.stat()
+    photo_bytes = get_processed_photo(
+        photo_path,
+        stat.st_mtime_ns,
+        stat.st_size,
+        width,
+        cache_directory / "photos" if cache_directory else None,
+    )
+    write_output(target, photo_bytes)
+
+
+@functools.lru_cache(maxsize=16)
+def get_processed_photo(
+    photo_path: pathlib.Path,
+    modification_time: int,  # NOQA: ARG001
+    size: int,  # NOQA: ARG001
+    width: int | None,
+    cache_directory: pathlib.Path | None,
+) -> bytes:
+    """Return the downscaled photo, reusing earlier results of the same content.
+
+    Why:
+        Decoding and re-encoding a large photo takes longer than compiling a
+        CV. Results are kept in memory, keyed by the file's modification time
+        and size, and in the cache directory, keyed by a hash of the content
+        and the target width, so they survive across processes and renamed
+        files.
+
+    Args:
+        photo_path: Original photo.
+        modification_time: Modification time of the photo, to notice edits.
+        size: Size of the photo, to notice edits.
+        width: Target width in pixels, or None to keep the original size.
+        cache_directory: Optional directory for processed photos.
+
+    Returns:
+        Contents of the processed photo.
+    """
+    original = photo_path.read_bytes()
+    if width is None:
+        return original
+
+    digest = hashlib.sha256(original + f"\n{width}".encode()).hexdigest()
+    cached_file = (
+        cache_directory / f"{digest}{photo_path.suffix}" if cache_directory else None
+    )
+    if cached_file is not None and cached_file.is_file():
+        return cached_file.read_bytes()
+
+    processed = downscale_photo(original, width)
+    if cached_file is not None:
+        cached_file.parent.mkdir(parents=True, exist_ok=True)
+        cached_file.write_bytes(processed)
+
+    return processed
+
+
+def downscale_photo(photo_bytes: bytes, width: int) -> bytes:
+    """Resize and recompress a photo that is wider than needed.
+
+    Example:
+        ```py
+        result = downscale_photo(camera_jpeg_bytes, 413)
+        # Returns a 413 pixels wide JPEG
+        ```
+
+    Args:
+        photo_bytes: Contents of the photo.
+        width: Target width in pixels.
+
+    Returns:
+        Contents of the downscaled photo in the same format, or the original
+        contents if the photo can't be downscaled or is already small enough.
+    """
+    from PIL import Image, ImageOps, UnidentifiedImageError  # NOQA: PLC0415
+
+    try:
+        image = Image.open(io.BytesIO(photo_bytes))
+    except UnidentifiedImageError:
+        return photo_bytes
+
+    image_format = image.format
+    if image_format not in downscaled_photo_formats:
+        return photo_bytes
+
+    # Camera photos are often stored sideways with an EXIF orientation tag,
+    # which re-encoding drops. Rotating the pixels keeps the photo upright, and
+    # the width is then measured as displayed. The copy is never None, that is
+    # only returned when transposing in place:
+    image = ImageOps.exif_transpose(image) or image
+    if image.width <= width:
+        return photo_bytes
+
+    height = max(1, round(image.height * width / image.width))
+    resized = image.resize((width, height), Image.Resampling.LANCZOS)
+
+    output = io.BytesIO()
+    if image_format == "JPEG":
+        resized.save(output, format="JPEG", quality=85, optimize=True)
+    else:
+        resized.save(output, format=image_format, optimize=True)
+
+    processed = output.getvalue()
+    return processed if len(processed) < len(photo_bytes) else photo_bytes
+
+
+def get_width_in_pixels(photo_width: str) -> int | None:
+    """Convert the printed photo width to pixels at `photo_dpi`.
+
+    Example:
+        ```py
+        result = get_width_in_pixels("3.5cm")
+        # Returns: 413
+        ```
+
+    Args:
+        photo_width: Typst dimension of the photo.
+
+    Returns:
+        Width in pixels, or None for font-relative units like `em`.
+    """
+    match = dimension_pattern.fullmatch(photo_width)
+    if match is None:
+        return None
+
+    inches = float(match.group(1)) * inches_per_unit[match.group(2)]
+    return max(1, round(inches * photo_dpi))
@@ -0,0 +1,280 @@
+import concurrent.futures
+import pathlib
+from collections.abc import Iterable
+from typing import Any, Literal, get_args
+
+from rendercv.exception import RenderCVInternalError, RenderCVUserError
+from rendercv.schema.models.rendercv_model import RenderCVModel
+from rendercv.schema.rendercv_model_builder import (
+    build_rendercv_model_from_commented_map,
+    build_rendercv_model_variants,
+)
+
+from .page_fitter import fit_to_pages
+from .pdf_png import (
+    CompiledFormat,
+    TypstDocument,
+    compile_typst,
+    get_in_memory_typst_root,
+)
+from .sidebar_balancer import balance_sidebar
+from .templater.templater import render_full_template, render_html
+
+type OutputFormat = Literal["typst", "pdf", "png", "svg", "markdown", "html"]
+
+output_formats: tuple[OutputFormat, ...] = get_args(OutputFormat.__value__)
+compiled_output_formats: frozenset[OutputFormat] = frozenset(
+    get_args(CompiledFormat.__value__)
+)
+
+
+def render(
+    rendercv_model: RenderCVModel | dict[str, Any],
+    formats: Iterable[OutputFormat] = ("pdf",),
+    typst_root: pathlib.Path | None = None,
+) -> dict[OutputFormat, bytes | list[bytes]]:
+    """Render a CV to the contents of the requested formats without writing files.
+
+    Why:
+        The `generate_*` functions write outputs next to the input and create
+        their directories, which services embedding RenderCV would have to
+        redirect to temporary directories and read back. This runs the same
+        steps, including sidebar balancing and page fitting, and returns the
+        contents instead. Typst compiles in the photo's directory, so the
+        photo is read where it is instead of being copied. It isn't
+        downscaled for the same reason.
+
+    Example:
+        ```py
+        outputs = render({"cv": {"name": "John Doe"}}, formats=("pdf", "png"))
+        # Returns: {"pdf": b"%PDF-1.7...", "png": [b"\\x89PNG..."]}
+        ```
+
+    Args:
+        rendercv_model: Validated CV model, or a dictionary to validate, like
+            the parsed contents of an input file. A given model isn't changed.
+        formats: Formats to render.
+        typst_root: Directory to compile in. The photo is placed there if it
+            isn't in it already. Defaults to the photo's directory.
+
+    Returns:
+        Contents keyed by format, in the requested order. PDF, Typst, Markdown,
+        and HTML are bytes; PNG and SVG are lists with the bytes of each page.
+    """
+    formats = check_output_formats(formats)
+    rendercv_model, typst_root = prepare_render_model(rendercv_model, typst_root)
+
+    outputs = render_typst_outputs(rendercv_model, formats, typst_root)
+    outputs.update(render_markdown_outputs(rendercv_model, formats))
+
+    return {file_format: outputs[file_format] for file_format in formats}
+
+
+def prepare_render_model(
+    rendercv_model: RenderCVModel | dict[str, Any],
+    typst_root: pathlib.Path | None = None,
+) -> tuple[RenderCVModel, pathlib.Path]:
+    """Validate or copy the model, then balance its sidebar and fit its pages.
+
+    Why:
+        `render` and `render_async` run the same steps before rendering the
+        outputs. Keeping them in one place stops the two from drifting apart.
+
+    Args:
+        rendercv_model: Validated CV model, or a dictionary to validate. A given
+            model isn't changed.
+        typst_root: Directory to compile in. Defaults to the photo's directory.
+
+    Returns:
+        Model to render and the directory to compile it in.
+    """
+    if isinstance(rendercv_model, dict):
+        rendercv_model = build_rendercv_model_from_commented_map(rendercv_model)
+    else:
+        # Balancing and fitting replace the design, which must not change the
+        # caller's model:
+        rendercv_model = rendercv_model.model_copy()
+    if typst_root is None:
+        typst_root = get_in_memory_typst_root(rendercv_model)
+
+    balance_sidebar(rendercv_model, typst_root)
+    fit_to_pages(rendercv_model, typst_root)
+
+    return rendercv_model, typst_root
+
+
+def render_typst_outputs(
+    rendercv_model: RenderCVModel,
+    formats: list[OutputFormat],
+    typst_root: pathlib.Path,
+) -> dict[OutputFormat, bytes | list[bytes]]:
+    """Render the Typst source and compile it to the requested formats.
+
+    Args:
+        rendercv_model: Model returned by `prepare_render_model`.
+        formats: Formats checked by `check_output_formats`.
+        typst_root: Directory to compile in.
+
+    Returns:
+        Typst source and compiled contents keyed by format, or nothing if no
+        Typst based format is requested.
+    """
+    if not needs_typst(formats):
+        return {}
+    # The formats are spelled out so that type checkers narrow them:
+    compiled_formats: list[CompiledFormat] = [
+        file_format for file_format in formats if file_format in ("pdf", "png", "svg")
+    ]
+
+    typst_source = render_full_template(rendercv_model, "typst")
+    outputs: dict[OutputFormat, bytes | list[bytes]] = {
+        "typst": typst_source.encode("utf-8")
+    }
+    typst_document = compile_typst(
+        rendercv_model, typst_source, compiled_formats, typst_root
+    )
+    outputs.update(get_compiled_outputs(typst_document, compiled_formats))
+    return outputs
+
+
+def render_markdown_outputs(
+    rendercv_model: RenderCVModel, formats: list[OutputFormat]
+) -> dict[OutputFormat, bytes | list[bytes]]:
+    """Render the Markdown source and, if requested, the HTML built from it.
+
+    Args:
+        rendercv_model: Model returned by `prepare_render_model`.
+        formats: Formats checked by `check_output_formats`.
+
+    Returns:
+        Markdown and HTML contents keyed by format, or nothing if neither is
+        requested.
+    """
+    if not needs_markdown(formats):
+        return {}
+
+    markdown_source = render_full_template(rendercv_model, "markdown")
+    outputs: dict[OutputFormat, bytes | list[bytes]] = {
+        "markdown": markdown_source.encode("utf-8")
+    }
+    if "html" in formats:
+        outputs["html"] = render_html(rendercv_model, markdown_source).encode("utf-8")
+    return outputs
+
+
+def needs_typst(formats: list[OutputFormat]) -> bool:
+    """Tell whether any requested format is rendered from the Typst source.
+
+    Args:
+        formats: Requested formats.
+
+    Returns:
+        True if Typst, PDF, PNG, or SVG is requested.
+    """
+    return "typst" in formats or any(
+        file_format in compiled_output_formats for file_format in formats
+    )
+
+
+def needs_markdown(formats: list[OutputFormat]) -> bool:
+    """Tell whether any requested format is rendered from the Markdown source.
+
+    Args:
+        formats: Requested formats.
+
+    Returns:
+        True if Markdown or HTML is requested.
+    """
+    return "markdown" in formats or "html" in formats
+
+
+def check_output_formats(formats: Iterable[OutputFormat]) -> list[OutputFormat]:
+    """Deduplicate the requested formats and reject unsupported ones.
+
+    Args:
+        formats: Requested formats.
+
+    Returns:
+        Requested formats without duplicates, in order.
+    """
+    formats = list(dict.fromkeys(formats))
+    unsupported_formats = [
+        file_format for file_format in formats if file_format not in output_formats
+    ]
+    if unsupported_formats:
+        message = (
+            f"The formats {', '.join(unsupported_formats)} aren't supported! Use"
+            f" {', '.join(output_formats)}."
+        )
+        raise RenderCVUserError(message)
+    return formats
+
+
+def get_compiled_outputs(
+    typst_document: TypstDocument | None, compiled_formats: list[CompiledFormat]
+) -> dict[OutputFormat, bytes | list[bytes]]:
+    """Take the exports of the requested formats from a compiled document.
+
+    Args:
+        typst_document: Document compiled to the requested formats.
+        compiled_formats: Requested PDF, PNG, and SVG formats.
+
+    Returns:
+        Contents keyed by format.
+    """
+    outputs: dict[OutputFormat, bytes | list[bytes]] = {}
+    for file_format in compiled_formats:
+        exported = getattr(typst_document, file_format, None)
+        if exported is None:
+            message = f"Typst compiler returned None for {file_format.upper()} bytes"
+            raise RenderCVInternalError(message)
+        outputs[file_format] = exported
+    return outputs
+
+
+def render_variants(
+    rendercv_model: RenderCVModel | dict[str, Any],
+    themes: list[str] | None = None,
+    locales: list[str] | None = None,
+    formats: Iterable[OutputFormat] = ("pdf",),
+) -> dict[str, dict[OutputFormat, bytes | list[bytes]]]:
+    """Render a CV under each combination of themes and locales in parallel.
+
+    Why:
+        Rendering a CV once per theme and locale with `render` validated the
+        whole CV each time. It is validated once here, only the themes and
+        locales are validated for the variants, and the variants are compiled
+        on a thread pool since Typst compilation releases the GIL.
+
+    Example:
+        ```py
+        outputs = render_variants(
+            {"cv": {"name": "John Doe"}}, themes=["classic", "moderncv"]
+        )
+        # Returns: {"classic": {"pdf": b"%PDF-1.7..."}, "moderncv": {...}}
+        ```
+
+    Args:
+        rendercv_model: Validated CV model, or a dictionary to validate.
+        themes: Built-in themes to render. Defaults to the model's theme.
+        locales: Built-in locales to render. Defaults to the model's locale.
+        formats: Formats to render.
+
+    Returns:
+        Contents of each variant as returned by `render`, keyed by variant names
+        like `moderncv_french`.
+    """
+    if isinstance(rendercv_model, dict):
+        rendercv_model = build_rendercv_model_from_commented_map(rendercv_model)
+    formats = list(formats)
+
+    variants = build_rendercv_model_variants(rendercv_model, themes, locales)
+    futures: dict[
+        str, concurrent.futures.Future[dict[OutputFormat, bytes | list[bytes]]]
+    ]
+    with concurrent.futures.ThreadPoolExecutor() as executor:
+        futures = {
+            variant_name: executor.submit(render, variant, formats)
+            for variant_name, variant in variants.items()
+        }
+    return {variant_name: future.result() for variant_name, future in futures.items()}
@@ -0,0 +1,122 @@
+import itertools
+import pathlib
+
+from rendercv.schema.models.rendercv_model import RenderCVModel
+
+from .pdf_png import query_typst
+from .templater.templater import render_full_template
+
+
+def balance_sidebar(
+    rendercv_model: RenderCVModel, typst_root: pathlib.Path | None = None
+) -> dict[str, str]:
+    """Move sidebar sections to the main column until both columns end evenly.
+
+    Why:
+        Which sections fit in the sidebar depends on their rendered height, so
+        users used to move sections by hand and re-render until the columns
+        matched. With `design.sidebar.auto_balance`, the Typst document
+        contains invisible markers at the end of each column and sidebar
+        section. A single query reports their positions, and the trailing
+        sidebar sections whose move brings the column ends closest together
+        are moved to the main column. Sections are only ever moved out of the
+        sidebar: if the main column is the longer one, nothing changes, because
+        the main column's sections are not listed in the sidebar settings and
+        choosing which of them fit in the narrower column is left to the user.
+
+    Example:
+        ```py
+        overrides = balance_sidebar(rendercv_model)
+        # Returns: {"design.sidebar.sections": "[skills, languages]"}
+        ```
+
+    Args:
+        rendercv_model: CV model to balance. Its design is replaced in place.
+        typst_root: Directory to compile in. Defaults to the directory of the
+            Typst output path.
+
+    Returns:
+        The chosen sidebar sections keyed by their override path, or an empty
+        dictionary if nothing was moved or balancing is disabled.
+    """
+    sidebar = getattr(rendercv_model.design, "sidebar", None)
+    if sidebar is None or not sidebar.auto_balance:
+        return {}
+
+    markers = query_typst(
+        rendercv_model,
+        render_full_template(rendercv_model, "typst"),
+        "<rendercv-column-marker>",
+        typst_root,
+    )
+
+    moved_sections = choose_sections_to_move(markers)
+    if not moved_sections:
+        return {}
+
+    sidebar_sections = [
+        section for section in sidebar.sections if section not in moved_sections
+    ]
+    rendercv_model.design = rendercv_model.design.model_copy(
+        update={"sidebar": sidebar.model_copy(update={"sections": sidebar_sections})}
+    )
+
+    return {"design.sidebar.sections": f"[{', '.join(sidebar_sections)}]"}
+
+
+def choose_sections_to_move(markers: list[dict]) -> list[str]:
+    """Pick the trailing sidebar sections to move so the columns end evenly.
+
+    Why:
+        A section moved to the wider main column takes up less height there.
+        Its height is scaled by the ratio of the column widths to estimate how
+        much the main column grows.
+
+    Example:
+        ```py
+        markers = [
+            {"column": "sidebar", "section": None, "width": 100, "offset": 0},
+            {"column": "sidebar", "section": "skills", "width": 100, "offset": 300},
+            {"column": "sidebar", "section": "hobbies", "width": 100, "offset": 500},
+            {"column": "main", "section": None, "width": 200, "offset": 0},
+            {"column": "main", "section": "end", "width": 200, "offset": 300},
+        ]
+        result = choose_sections_to_move(markers)
+        # Returns: ["hobbies"]
+        ```
+
+    Args:
+        markers: Values of the `rendercv-column-marker` metadata in document
+            order, with `column`, `section`, `width`, and `offset` keys.
+
+    Returns:
+        Snake case titles of the sidebar sections to move to the main column.
+    """
+    sidebar_markers = [marker for marker in markers if marker["column"] == "sidebar"]
+    main_markers = [marker for marker in markers if marker["column"] == "main"]
+    if len(sidebar_markers) < 2 or len(main_markers) < 2:
+        return []
+
+    sections = [
+        (
+            marker["section"],
+            marker["offset"] - previous_marker["offset"],
+        )
+        for previous_marker, marker in itertools.pairwise(sidebar_markers)
+    ]
+    sidebar_height = sidebar_markers[-1]["offset"] - sidebar_markers[0]["offset"]
+    main_height = main_markers[-1]["offset"] - main_markers[0]["offset"]
+    width_ratio = sidebar_markers[0]["width"] / main_markers[0]["width"]
+
+    best_count = 0
+    best_difference = abs(sidebar_height - main_height)
+    moved_height = 0.0
+    for count, (_, height) in enumerate(reversed(sections), start=1):
+        moved_height += height
+        difference = abs(
+            (sidebar_height - moved_height) - (main_height + moved_height * width_ratio)
+        )
+        if difference < best_difference:
+            best_count, best_difference = count, difference
+
+    return [section for section, _ in sections[len(sections) - best_count :]]
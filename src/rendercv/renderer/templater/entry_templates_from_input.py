@@ -1,7 +1,10 @@
+import functools
 import re
 import textwrap
 from datetime import date as Date
 
+import pydantic
+
 from rendercv.exception import RenderCVInternalError
 from rendercv.schema.models.cv.entries.publication import PublicationEntry
 from rendercv.schema.models.cv.section import Entry
@@ -9,7 +12,12 @@ from rendercv.schema.models.design.classic_theme import Templates
 from rendercv.schema.models.locale.locale import Locale
 
 from .date import compute_time_span_string, format_date_range, format_single_date
-from .string_processor import clean_url, substitute_placeholders
+from .field_plan import iterate_fields
+from .string_processor import (
+    build_keyword_matcher_pattern,
+    clean_url,
+    substitute_placeholders,
+)
 
 uppercase_word_pattern = re.compile(r"\b[A-Z_]+\b")
 
@@ -39,16 +47,18 @@ def render_entry_templates[EntryType: Entry](
     Returns:
         Entry with template-generated display fields.
     """
-    if isinstance(entry, str) or not hasattr(templates, entry.entry_type_in_snake_case):
+    if not isinstance(entry, pydantic.BaseModel) or not hasattr(
+        templates, entry.entry_type_in_snake_case
+    ):
         # It's a TextEntry, or an entry type without templates. Return it as is:
         return entry
 
-    entry_templates: dict[str, str] = getattr(
-        templates, entry.entry_type_in_snake_case
-    ).model_dump(exclude_none=True)
+    entry_templates: dict[str, str] = dict(
+        iterate_fields(getattr(templates, entry.entry_type_in_snake_case))
+    )
 
-    entry_fields: dict[str, str | str] = {
-        key.upper(): value for key, value in entry.model_dump(exclude_none=True).items()
+    entry_fields: dict[str, str] = {
+        key.upper(): value for key, value in iterate_fields(entry)
     }
 
     # Handle special placeholders:
@@ -111,18 +121,81 @@ def render_entry_templates[EntryType: Entry](
     if "SUMMARY" in entry_fields:
         entry_fields["SUMMARY"] = process_summary(entry_fields["SUMMARY"])
 
-    entry_templates = remove_not_provided_placeholders(entry_templates, entry_fields)
+    compiled_templates = compile_entry_templates(
+        tuple(entry_templates.items()), frozenset(entry_fields)
+    )
+    for template_name, segments in compiled_templates:
+        setattr(entry, template_name, expand_compiled_template(segments, entry_fields))
 
-    for template_name, template in (entry_templates | entry_fields).items():
-        setattr(
-            entry,
-            template_name,
-            substitute_placeholders(template, entry_fields),
-        )
+    for field_name, value in entry_fields.items():
+        setattr(entry, field_name, substitute_placeholders(value, entry_fields))
 
     return entry
 
 
+@functools.lru_cache(maxsize=256)
+def compile_entry_templates(
+    entry_templates: tuple[tuple[str, str], ...],
+    provided_placeholders: frozenset[str],
+) -> tuple[tuple[str, tuple[str, ...]], ...]:
+    """Split entry templates into literal text and placeholder segments.
+
+    Why:
+        Every entry of a section uses the same templates and, usually, the same
+        set of provided fields. Removing missing placeholders and locating the
+        remaining ones once per combination means expanding an entry is a
+        plain join over segments instead of regex passes per template and
+        entry.
+
+    Example:
+        ```py
+        compiled = compile_entry_templates(
+            (("main_column", "**NAME**, LOCATION"),), frozenset({"NAME"})
+        )
+        # Returns: (("main_column", ("**", "NAME", "**")),)
+        ```
+
+    Args:
+        entry_templates: Template names and template strings of an entry type.
+        provided_placeholders: Uppercase names of the fields the entry provides.
+
+    Returns:
+        Template names with segments; odd positions hold placeholder names and
+        even positions hold the literal text between them.
+    """
+    templates = remove_not_provided_placeholders(
+        dict(entry_templates), dict.fromkeys(provided_placeholders, "")
+    )
+    if not provided_placeholders:
+        return tuple((name, (template,)) for name, template in templates.items())
+
+    pattern = build_keyword_matcher_pattern(provided_placeholders)
+    return tuple(
+        (name, tuple(pattern.split(template))) for name, template in templates.items()
+    )
+
+
+def expand_compiled_template(
+    segments: tuple[str, ...], entry_fields: dict[str, str]
+) -> str:
+    """Fill a compiled entry template with the field values of an entry.
+
+    Args:
+        segments: Segments returned by `compile_entry_templates`.
+        entry_fields: Field values with uppercase keys.
+
+    Returns:
+        Expanded template, stripped like `substitute_placeholders` does.
+    """
+    if len(segments) == 1:
+        return segments[0] if not entry_fields else segments[0].strip()
+
+    return "".join(
+        entry_fields[segment] if i % 2 else segment
+        for i, segment in enumerate(segments)
+    ).strip()
+
+
 def process_highlights(highlights: list[str]) -> str:
     """Convert highlight list to Markdown unordered list with nested items.
 
@@ -0,0 +1,69 @@
+import functools
+from collections.abc import Iterator
+from typing import Any
+
+import pydantic
+
+
+@functools.cache
+def get_field_plan(
+    model_class: type[pydantic.BaseModel], skipped_fields: frozenset[str] = frozenset()
+) -> tuple[str, ...]:
+    """List the declared fields of a model class that processing should visit.
+
+    Why:
+        Calling `model_dump()` on every entry only to loop over its fields and
+        skip some of them serializes the whole entry into a fresh dictionary.
+        The field names of an entry class never change, so they are resolved
+        once per class and skipped fields are filtered out up front.
+
+    Example:
+        ```py
+        plan = get_field_plan(NormalEntry, frozenset({"start_date", "end_date"}))
+        # Returns: ("name", "date", "location", "summary", "highlights")
+        ```
+
+    Args:
+        model_class: Pydantic model class to plan for.
+        skipped_fields: Field names to leave out of the plan.
+
+    Returns:
+        Field names in declaration order.
+    """
+    return tuple(
+        field_name
+        for field_name in model_class.model_fields
+        if field_name not in skipped_fields
+    )
+
+
+def iterate_fields(
+    model: pydantic.BaseModel, skipped_fields: frozenset[str] = frozenset()
+) -> Iterator[tuple[str, Any]]:
+    """Yield field names and values that are set, like `model_dump(exclude_none=True)`.
+
+    Why:
+        Entries keep user-defined extra keys and values added while rendering
+        templates next to their declared fields. This walks both through direct
+        attribute access, in the same order `model_dump()` would, without
+        building a dictionary.
+
+    Args:
+        model: Pydantic model to read.
+        skipped_fields: Field names to leave out, in addition to private ones.
+
+    Returns:
+        Iterator over `(field_name, value)` pairs whose value is not None.
+    """
+    for field_name in get_field_plan(type(model), skipped_fields):
+        value = getattr(model, field_name)
+        if value is not None:
+            yield field_name, value
+
+    for field_name, value in (model.__pydantic_extra__ or {}).items():
+        if (
+            value is not None
+            and field_name not in skipped_fields
+            and not field_name.startswith("_")
+        ):
+            yield field_name, value
@@ -1,3 +1,5 @@
+import concurrent.futures
+import threading
 from collections.abc import Callable
 from typing import Literal
 
@@ -6,6 +8,7 @@ from rendercv.schema.models.rendercv_model import RenderCVModel
 
 from .connections import compute_connections
 from .entry_templates_from_input import render_entry_templates
+from .field_plan import iterate_fields
 from .footer_and_top_note import render_footer_template, render_top_note_template
 from .markdown_parser import markdown_to_typst
 from .string_processor import apply_string_processors, make_keywords_bold
@@ -19,7 +22,9 @@ def process_model(
     Why:
         Templates need processed data, not raw model. This applies markdown
         parsing, keyword bolding, connection formatting, date rendering, and
-        entry template expansion before templates execute.
+        entry template expansion before templates execute. The format-independent
+        part is shared between formats through `get_render_model`, so rendering
+        both Typst and Markdown only pays for it once.
 
     Args:
         rendercv_model: Validated CV model.
@@ -28,15 +33,19 @@ def process_model(
     Returns:
         Processed model ready for templates.
     """
-    rendercv_model = rendercv_model.model_copy(deep=True)
+    render_model = get_render_model(rendercv_model)
 
     string_processors: list[Callable[[str], str]] = [
-        lambda string: make_keywords_bold(string, rendercv_model.settings.bold_keywords)
+        lambda string: make_keywords_bold(string, render_model.settings.bold_keywords)
     ]
     if file_type == "typst":
         string_processors.extend([markdown_to_typst])
 
-    rendercv_model.cv.plain_name = rendercv_model.cv.name  # ty: ignore[unresolved-attribute]
+    # Shallow copies are enough below because every processed value is assigned,
+    # never mutated in place, so the shared render model stays untouched:
+    rendercv_model = render_model.model_copy()
+    rendercv_model.cv = render_model.cv.model_copy()
+
     rendercv_model.cv.name = apply_string_processors(
         rendercv_model.cv.name, string_processors
     )
@@ -64,25 +73,168 @@ def process_model(
     if rendercv_model.cv.sections is None:
         return rendercv_model
 
-    for section in rendercv_model.cv.rendercv_sections:
-        section.title = apply_string_processors(section.title, string_processors)
+    rendercv_model.cv.rendercv_sections = [
+        section.model_copy(
+            update={
+                "title": apply_string_processors(section.title, string_processors),
+                "entries": [
+                    process_fields(
+                        entry if isinstance(entry, str) else entry.model_copy(),
+                        string_processors,
+                    )
+                    for entry in section.entries
+                ],
+            }
+        )
+        for section in render_model.cv.rendercv_sections
+    ]
+
+    return rendercv_model
+
+
+# Guards the cache entries of all models. It is only held to look an entry up or
+# store one, never while a render model is built, so renders of different models
+# don't wait for each other:
+render_model_lock = threading.Lock()
+
+
+def get_render_model(rendercv_model: RenderCVModel) -> RenderCVModel:
+    """Return the format-independent processed model, computing it on first use.
+
+    Why:
+        Typst and Markdown outputs need the same entry template expansion, date
+        formatting, and time span computation; only the final string
+        processing differs. Computing this intermediate model once per
+        validated model and storing it on the model halves the processing cost
+        when both formats are generated.
+
+    Example:
+        ```py
+        render_model = get_render_model(rendercv_model)
+        assert get_render_model(rendercv_model) is render_model
+        ```
+
+    Args:
+        rendercv_model: Validated CV model.
+
+    Returns:
+        View of the model with entry templates rendered and `plain_name` set.
+    """
+    # The cache is tied to the component objects it was built from, so a model
+    # copied with a different design, locale, or settings doesn't reuse it. The
+    # entry holds the components themselves, so they can't be freed and have
+    # their ids reused while it is stored:
+    components = get_model_components(rendercv_model)
+    with render_model_lock:
+        cached = rendercv_model._render_model
+        building = cached is None or not all(
+            cached_component is component
+            for cached_component, component in zip(cached[0], components, strict=True)
+        )
+        if cached is None or building:
+            # Typst and Markdown are rendered on different threads. The first
+            # one builds the render model, and the other waits for its result:
+            cached = (components, concurrent.futures.Future())
+            rendercv_model._render_model = cached
+
+    future = cached[1]
+    if building:
+        try:
+            future.set_result(build_render_model(rendercv_model))
+        except BaseException as e:
+            future.set_exception(e)
+            # Don't keep the error, so that the next call tries again:
+            with render_model_lock:
+                if rendercv_model._render_model is cached:
+                    rendercv_model._render_model = None
+            raise
+    return future.result()
+
+
+def clear_render_model(rendercv_model: RenderCVModel) -> None:
+    """Drop the cached render model so that the next render rebuilds it.
+
+    Why:
+        Replacing a component of the model, like its design, is noticed
+        automatically. Changing a component in place, like
+        `rendercv_model.cv.name = "Jane Doe"`, isn't, and has to be followed
+        by this call.
+
+    Args:
+        rendercv_model: Validated CV model.
+    """
+    with render_model_lock:
+        rendercv_model._render_model = None
+
+
+def get_model_components(rendercv_model: RenderCVModel) -> tuple[object, ...]:
+    """Return the components a render model is built from.
+
+    Args:
+        rendercv_model: Validated CV model.
+
+    Returns:
+        The CV, design, locale, and settings of the model.
+    """
+    return (
+        rendercv_model.cv,
+        rendercv_model.design,
+        rendercv_model.locale,
+        rendercv_model.settings,
+    )
+
+
+def build_render_model(rendercv_model: RenderCVModel) -> RenderCVModel:
+    """Apply the format-independent processing steps to a view of the model.
+
+    Why:
+        Deep-copying a validated model with hundreds of entries dominated render
+        time. Processing only ever assigns new attribute values, so a view made
+        of shallow copies of the model, CV, sections, and entries is enough:
+        processed values live on the view while nested lists, dates, and all
+        other unchanged values are shared with the validated model, which is
+        never modified.
+
+    Args:
+        rendercv_model: Validated CV model.
+
+    Returns:
+        View of the model with entry templates rendered and `plain_name` set.
+    """
+    validated_cv = rendercv_model.cv
+
+    rendercv_model = rendercv_model.model_copy()
+    rendercv_model.cv = validated_cv.model_copy()
+
+    rendercv_model.cv.plain_name = validated_cv.name  # ty: ignore[unresolved-attribute]
+    if validated_cv.sections is None:
+        return rendercv_model
+
+    rendercv_sections = []
+    for section in validated_cv.rendercv_sections:
         show_time_span = (
             section.snake_case_title
             in rendercv_model.design.sections.show_time_spans_in
         )
-        for i, entry in enumerate(section.entries):
-            entry = render_entry_templates(  # NOQA: PLW2901
-                entry,
+        entries = [
+            render_entry_templates(
+                entry if isinstance(entry, str) else entry.model_copy(),
                 templates=rendercv_model.design.templates,
                 locale=rendercv_model.locale,
                 show_time_span=show_time_span,
                 current_date=rendercv_model.settings.current_date,
             )
-            section.entries[i] = process_fields(entry, string_processors)
+            for entry in section.entries
+        ]
+        rendercv_sections.append(section.model_copy(update={"entries": entries}))
+    rendercv_model.cv.rendercv_sections = rendercv_sections
 
     return rendercv_model
 
 
+unprocessed_fields = frozenset({"start_date", "end_date", "doi", "url"})
+
+
 def process_fields(
     entry: Entry, string_processors: list[Callable[[str], str]]
 ) -> Entry:
@@ -100,16 +252,11 @@ def process_fields(
     Returns:
         Entry with processed fields.
     """
-    skipped = {"start_date", "end_date", "doi", "url"}
-
     if isinstance(entry, str):
         return apply_string_processors(entry, string_processors)
 
-    data = entry.model_dump(exclude_none=True)
-    for field, value in data.items():
-        if field in skipped or field.startswith("_"):
-            continue
-
+    # Materialized first because the loop below assigns to the fields:
+    for field, value in list(iterate_fields(entry, unprocessed_fields)):
         if isinstance(value, str):
             setattr(entry, field, apply_string_processors(value, string_processors))
         elif isinstance(value, list):
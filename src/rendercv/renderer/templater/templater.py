@@ -1,6 +1,8 @@
-import contextlib
+import collections
 import functools
 import pathlib
+import threading
+from collections.abc import Iterator
 from typing import Literal
 
 import jinja2
@@ -14,32 +16,89 @@ from .string_processor import clean_url
 templates_directory = pathlib.Path(__file__).parent / "templates"
 
 
-@functools.lru_cache(maxsize=1)
-def get_jinja2_environment(
-    input_file_path: pathlib.Path | None = None,
+class InMemoryBytecodeCache(jinja2.BytecodeCache):
+    """Bytecode cache that shares compiled templates between environments.
+
+    Why:
+        Each input directory gets its own environment, so without a cache the
+        built-in templates are compiled again for every directory. Buckets are
+        keyed by the template's file path and checked against its source, so
+        environments of different directories can safely reuse each other's
+        compiled templates. Overridden templates of every directory add
+        buckets, so the least recently used ones are dropped beyond
+        `maximum_size`.
+
+    Args:
+        maximum_size: Maximum number of compiled templates to keep.
+    """
+
+    def __init__(self, maximum_size: int = 256):
+        self.maximum_size = maximum_size
+        self.bytecode: collections.OrderedDict[str, bytes] = collections.OrderedDict()
+        self.lock = threading.Lock()
+
+    def load_bytecode(self, bucket: jinja2.bccache.Bucket) -> None:
+        with self.lock:
+            bytecode = self.bytecode.get(bucket.key)
+            if bytecode is not None:
+                self.bytecode.move_to_end(bucket.key)
+        if bytecode is not None:
+            bucket.bytecode_from_string(bytecode)
+
+    def dump_bytecode(self, bucket: jinja2.bccache.Bucket) -> None:
+        bytecode = bucket.bytecode_to_string()
+        with self.lock:
+            self.bytecode[bucket.key] = bytecode
+            self.bytecode.move_to_end(bucket.key)
+            while len(self.bytecode) > self.maximum_size:
+                self.bytecode.popitem(last=False)
+
+    def clear(self) -> None:
+        with self.lock:
+            self.bytecode.clear()
+
+
+# Used by environments without a cache directory:
+in_memory_bytecode_cache = InMemoryBytecodeCache()
+
+
+def create_jinja2_environment(
+    input_directory: pathlib.Path, cache_directory: pathlib.Path | None = None
 ) -> jinja2.Environment:
-    """Create cached Jinja2 environment with custom filters and template loaders.
+    """Create Jinja2 environment with custom filters and template loaders.
 
     Why:
         Template rendering is called multiple times per render. Caching environment
         prevents repeated filesystem scans. Loader hierarchy enables user template
-        overrides by checking input file directory before built-in templates.
+        overrides by checking input file directory before built-in templates. One
+        environment is kept per loader search path, so a process rendering CVs
+        from several directories doesn't recompile templates on every switch. With
+        a cache directory, compiled templates are also stored on disk and reused by
+        later processes. Without one, they are shared between the environments of
+        this process.
 
     Args:
-        input_file_path: Path to input file for user template override resolution.
+        input_directory: Directory of the input file for user template override
+            resolution.
+        cache_directory: Optional directory for the persistent bytecode cache.
 
     Returns:
         Configured Jinja2 environment with filters and loaders.
     """
+    bytecode_cache: jinja2.BytecodeCache = in_memory_bytecode_cache
+    if cache_directory is not None:
+        bytecode_cache_directory = cache_directory / "jinja2"
+        bytecode_cache_directory.mkdir(parents=True, exist_ok=True)
+        bytecode_cache = jinja2.FileSystemBytecodeCache(str(bytecode_cache_directory))
+
     env = jinja2.Environment(
         loader=jinja2.FileSystemLoader(
             [
-                (  # To allow users to override the templates:
-                    input_file_path.parent if input_file_path else pathlib.Path.cwd()
-                ),
+                input_directory,  # To allow users to override the templates
                 templates_directory,
             ]
         ),
+        bytecode_cache=bytecode_cache,
         trim_blocks=True,
         lstrip_blocks=True,
     )
@@ -48,15 +107,56 @@ def get_jinja2_environment(
     return env
 
 
+# Looked up on every call of `get_jinja2_environment`, so resizing it also
+# reaches modules that imported the function:
+jinja2_environment_cache = functools.lru_cache(maxsize=8)(create_jinja2_environment)
+
+
+def get_jinja2_environment(
+    input_directory: pathlib.Path, cache_directory: pathlib.Path | None = None
+) -> jinja2.Environment:
+    """Return the cached Jinja2 environment of a directory, creating it if needed.
+
+    Args:
+        input_directory: Directory of the input file for user template override
+            resolution.
+        cache_directory: Optional directory for the persistent bytecode cache.
+
+    Returns:
+        Configured Jinja2 environment with filters and loaders.
+    """
+    return jinja2_environment_cache(input_directory, cache_directory)
+
+
+def set_jinja2_environment_cache_size(maxsize: int | None) -> None:
+    """Change how many Jinja2 environments are kept in memory.
+
+    Why:
+        Long-running processes that render CVs from many directories need more
+        than the default number of cached environments, while memory-constrained
+        ones may want fewer. Changing the size drops the cached environments.
+
+    Args:
+        maxsize: Maximum number of cached environments, or None for no limit.
+    """
+    global jinja2_environment_cache  # NOQA: PLW0603
+    jinja2_environment_cache = functools.lru_cache(maxsize=maxsize)(
+        create_jinja2_environment
+    )
+
+
 def render_full_template(
     rendercv_model: RenderCVModel, file_type: Literal["typst", "markdown"]
 ) -> str:
-    """Render complete CV document by assembling preamble, header, and sections.
+    """Render complete CV document through a single document-level template.
 
     Why:
-        CV generation requires consistent structure across formats. This orchestrates
-        model processing, template rendering for each component, and assembly into
-        final document following proper order.
+        Rendering every section beginning, entry, and section ending separately
+        resolves the environment, looks up a template, and builds a fresh context
+        hundreds of times for large CVs. The `Full` driver template includes the
+        preamble, header, section, and entry templates itself, so the whole
+        document comes out of one `render()` call while user overrides in the
+        theme folder keep working.
 
     Example:
         ```py
@@ -74,6 +174,33 @@ def render_full_template(
     Returns:
         Complete rendered document as string.
     """
+    return "".join(stream_full_template(rendercv_model, file_type))
+
+
+def stream_full_template(
+    rendercv_model: RenderCVModel, file_type: Literal["typst", "markdown"]
+) -> Iterator[str]:
+    """Render complete CV document as a stream of chunks.
+
+    Why:
+        Holding the whole document in memory before writing it is wasteful for
+        CVs with very long publication lists. Yielding chunks as the `Full`
+        driver template produces them lets writers stream straight to the
+        output file and lets consumers start before rendering finishes.
+
+    Example:
+        ```py
+        with typst_path.open("w", encoding="utf-8") as file:
+            file.writelines(stream_full_template(rendercv_model, "typst"))
+        ```
+
+    Args:
+        rendercv_model: CV model to render.
+        file_type: Output format for template selection and processing.
+
+    Returns:
+        Iterator over consecutive pieces of the rendered document.
+    """
     extension = {
         "typst": "typ",
         "markdown": "md",
@@ -81,212 +208,7 @@ def render_full_template(
 
     rendercv_model = process_model(rendercv_model, file_type)
 
-    header = render_single_template(
-        file_type,
-        f"Header.j2.{extension}",
-        rendercv_model,
-    )
-
-    # Check if using sidebar theme for 2-column layout
-    is_sidebar_theme = rendercv_model.design.theme == "sidebar"
-    sidebar_section_names = []
-    main_section_names = []
-
-    if is_sidebar_theme and hasattr(rendercv_model.design, 'sidebar'):
-        # Split sections into sidebar and main groups
-        sidebar_config_sections = set(rendercv_model.design.sidebar.sections)
-        for section in rendercv_model.cv.rendercv_sections:
-            if section.snake_case_title in sidebar_config_sections:
-                sidebar_section_names.append(section.snake_case_title)
-            else:
-                main_section_names.append(section.snake_case_title)
-
-    if file_type == "typst":
-        preamble = render_single_template(
-            file_type,
-            f"Preamble.j2.{extension}",
-            rendercv_model,
-        )
-        # For sidebar theme, don't add header yet - it goes in main column
-        if is_sidebar_theme:
-            code = f"{preamble}\n\n"
-        else:
-            code = f"{preamble}\n\n{header}\n"
-    else:
-        code = f"{header}\n"
-
-    # Render sections - group by sidebar/main if sidebar theme
-    if is_sidebar_theme and file_type == "typst":
-        sidebar_sections_code = []
-        main_sections_code = []
-
-        for rendercv_section in rendercv_model.cv.rendercv_sections:
-            section_beginning = render_single_template(
-                file_type,
-                f"SectionBeginning.j2.{extension}",
-                rendercv_model,
-                section_title=rendercv_section.title,
-                snake_case_section_title=rendercv_section.snake_case_title,
-                entry_type=rendercv_section.entry_type,
-            )
-            section_ending = render_single_template(
-                file_type,
-                f"SectionEnding.j2.{extension}",
-                rendercv_model,
-                entry_type=rendercv_section.entry_type,
-            )
-            entry_codes = []
-            for entry in rendercv_section.entries:
-                entry_code = render_single_template(
-                    file_type,
-                    f"entries/{rendercv_section.entry_type}.j2.{extension}",
-                    rendercv_model,
-                    entry=entry,
-                )
-                entry_codes.append(entry_code)
-
-            # Add to sidebar or main based on configuration
-            if rendercv_section.snake_case_title in sidebar_section_names:
-                # Use sidebar-specific spacing between entries
-                sidebar_spacing = rendercv_model.design.sidebar.space_between_entries
-                entries_code = f"\n#v({sidebar_spacing})\n".join(entry_codes)
-                # Add section icon mapping
-                section_icons = {
-                    "skills": "⚙",
-                    "publications": "📚",
-                    "values": "🧭",
-                    "hobbies": "❤",
-                    "references": "📄"
-                }
-                icon = section_icons.get(rendercv_section.snake_case_title, "")
-                icon_prefix = f"{icon} " if icon else ""
-                # Replace section title with icon + title
-                section_beginning_with_icon = section_beginning.replace(
-                    rendercv_section.title,
-                    f"{icon_prefix}{rendercv_section.title}"
-                )
-                section_code = f"{section_beginning_with_icon}\n{entries_code}\n{section_ending}"
-                sidebar_sections_code.append(section_code)
-            else:
-                # Use default spacing for main column
-                entries_code = "\n\n".join(entry_codes)
-                section_code = f"{section_beginning}\n{entries_code}\n{section_ending}"
-                main_sections_code.append(section_code)
-
-        # Create 2-column layout with grid
-        sidebar_content = "\n\n".join(sidebar_sections_code)
-        # Add header to main column
-        main_content = f"{header}\n\n" + "\n\n".join(main_sections_code)
-
-        # Get sidebar configuration
-        sidebar_width = rendercv_model.design.sidebar.width
-        gutter = rendercv_model.design.sidebar.gutter
-        position = rendercv_model.design.sidebar.position
-        background_color = rendercv_model.design.sidebar.background_color
-        left_margin = rendercv_model.design.page.left_margin
-        top_margin = rendercv_model.design.page.top_margin
-        bottom_margin = rendercv_model.design.page.bottom_margin
-
-        # Create background rectangle for sidebar that extends to page edges
-        background_rect = ""
-        if background_color:
-            if position == "left":
-                # Place rectangle from page edge covering sidebar area
-                background_rect = f"""
-// Background for left sidebar extending to page edges
-#place(
-  top + left,
-  dx: -{left_margin},
-  dy: -{top_margin},
-  rect(
-    width: {sidebar_width} + {left_margin},
-    height: 100% + {top_margin} + {bottom_margin},
-    fill: {background_color.as_rgb()},
-  )
-)
-
-"""
-            else:  # right
-                background_rect = f"""
-// Background for right sidebar extending to page edges
-#place(
-  top + right,
-  dx: {rendercv_model.design.page.right_margin},
-  dy: -{top_margin},
-  rect(
-    width: {sidebar_width} + {rendercv_model.design.page.right_margin},
-    height: 100% + {top_margin} + {bottom_margin},
-    fill: {background_color.as_rgb()},
-  )
-)
-
-"""
-
-        # Create grid layout with sidebar
-        sidebar_font_size = rendercv_model.design.sidebar.font_size
-        if position == "left":
-            code += f"""{background_rect}#grid(
-  columns: ({sidebar_width}, 1fr),
-  gutter: {gutter},
-  [
-    #block(width: 100%, inset: (x: 0.3cm, y: 0cm))[
-      #text(size: {sidebar_font_size})[
-{sidebar_content}
-      ]
-    ]
-  ],
-  [
-{main_content}
-  ]
-)
-"""
-        else:  # right
-            code += f"""{background_rect}#grid(
-  columns: (1fr, {sidebar_width}),
-  gutter: {gutter},
-  [
-{main_content}
-  ],
-  [
-    #block(width: 100%, inset: (x: 0.3cm, y: 0cm))[
-      #text(size: {sidebar_font_size})[
-{sidebar_content}
-      ]
-    ]
-  ]
-)
-"""
-    else:
-        # Standard single-column rendering
-        for rendercv_section in rendercv_model.cv.rendercv_sections:
-            section_beginning = render_single_template(
-                file_type,
-                f"SectionBeginning.j2.{extension}",
-                rendercv_model,
-                section_title=rendercv_section.title,
-                snake_case_section_title=rendercv_section.snake_case_title,
-                entry_type=rendercv_section.entry_type,
-            )
-            section_ending = render_single_template(
-                file_type,
-                f"SectionEnding.j2.{extension}",
-                rendercv_model,
-                entry_type=rendercv_section.entry_type,
-            )
-            entry_codes = []
-            for entry in rendercv_section.entries:
-                entry_code = render_single_template(
-                    file_type,
-                    f"entries/{rendercv_section.entry_type}.j2.{extension}",
-                    rendercv_model,
-                    entry=entry,
-                )
-                entry_codes.append(entry_code)
-            entries_code = "\n\n".join(entry_codes)
-            section_code = f"{section_beginning}\n{entries_code}\n{section_ending}"
-            code += f"\n{section_code}"
-
-    return code
+    return stream_single_template(file_type, f"Full.j2.{extension}", rendercv_model)
 
 
 def render_html(rendercv_model: RenderCVModel, markdown: str) -> str:
@@ -329,7 +251,9 @@ def render_single_template(
     Why:
         Users can override built-in templates by placing custom templates in
         theme folder alongside input file. Typst templates check theme-specific
-        location first, falling back to built-in templates if not found.
+        location first, falling back to built-in templates if not found. Other
+        templates are reachable through the `resolve_template` function passed to
+        the template, which is how the `Full` driver template includes them.
 
     Example:
         ```py
@@ -353,24 +277,186 @@ def render_single_template(
     Returns:
         Rendered template as string.
     """
-    jinja2_environment = get_jinja2_environment(rendercv_model._input_file_path)
-    template = None
-    if file_type == "typst":
-        # Try user's own Typst templates first:
-        with contextlib.suppress(jinja2.TemplateNotFound):
-            template = jinja2_environment.get_template(
-                f"{rendercv_model.design.theme}/{relative_template_path}"
-            )
-
-    if template is None:
-        template = jinja2_environment.get_template(
-            f"{file_type}/{relative_template_path}"
+    return "".join(
+        stream_single_template(
+            file_type, relative_template_path, rendercv_model, **kwargs
         )
+    )
+
+
+def stream_single_template(
+    file_type: Literal["markdown", "typst", "html"],
+    relative_template_path: str,
+    rendercv_model: RenderCVModel,
+    **kwargs,
+) -> Iterator[str]:
+    """Render single Jinja2 template as a stream of chunks.
+
+    Why:
+        Same as `render_single_template`, but built on Jinja2's `generate()` so
+        large documents never have to exist as one string.
+
+    Args:
+        file_type: Format for template directory selection.
+        relative_template_path: Template file path relative to format directory.
+        rendercv_model: CV model providing template context.
 
-    return template.render(
+    Returns:
+        Iterator over consecutive pieces of the rendered template.
+    """
+    input_file_path = rendercv_model._input_file_path
+    template_index = get_template_index(
+        file_type,
+        input_directory=(
+            input_file_path.parent if input_file_path else pathlib.Path.cwd()
+        ),
+        theme=rendercv_model.design.theme,
+        cache_directory=rendercv_model.settings.render_command.cache_dir,
+    )
+    template = template_index[relative_template_path]
+
+    return template.generate(
         cv=rendercv_model.cv,
         design=rendercv_model.design,
         locale=rendercv_model.locale,
         settings=rendercv_model.settings,
+        resolve_template=template_index.__getitem__,
         **kwargs,
     )
+
+
+def get_template_names(
+    file_type: Literal["markdown", "typst", "html"],
+    relative_template_path: str,
+    *,
+    theme: str,
+) -> list[str]:
+    """List candidate template names for a logical template, in lookup order.
+
+    Why:
+        Typst templates can be overridden per theme by placing them in a folder
+        named after the theme next to the input file. Both single-template
+        rendering and the includes of the `Full` driver template resolve
+        templates through this list so the override rules stay identical.
+
+    Example:
+        ```py
+        names = get_template_names("typst", "Header.j2.typ", theme="classic")
+        # Returns: ["classic/Header.j2.typ", "typst/Header.j2.typ"]
+        ```
+
+    Args:
+        file_type: Format for template directory selection.
+        relative_template_path: Template file path relative to format directory.
+        theme: Theme name used as the user override folder for Typst templates.
+
+    Returns:
+        Template names to try, the first existing one wins.
+    """
+    template_names = [f"{file_type}/{relative_template_path}"]
+    if file_type == "typst":
+        # Try user's own Typst templates first:
+        template_names.insert(0, f"{theme}/{relative_template_path}")
+    return template_names
+
+
+def get_template_index(
+    file_type: Literal["markdown", "typst", "html"],
+    *,
+    input_directory: pathlib.Path,
+    theme: str,
+    cache_directory: pathlib.Path | None = None,
+) -> dict[str, jinja2.Template]:
+    """Return the template index for a theme, rebuilding it if overrides changed.
+
+    Why:
+        Looking up a Typst template first tries the theme folder, which fails
+        for every built-in theme and costs a filesystem miss plus an exception.
+        The index resolves every logical template name once. It is rebuilt only
+        when the modification times of the override folders change, which
+        happens when an override is added, removed, or renamed. Only folders
+        are checked, not every file in them, since this runs on every render.
+        Overrides edited in place are reloaded individually, so editing
+        templates in watch mode still takes effect.
+
+    Args:
+        file_type: Format for template directory selection.
+        input_directory: Directory of the input file, where user overrides live.
+        theme: Theme name used as the user override folder for Typst templates.
+        cache_directory: Optional directory for the persistent bytecode cache.
+
+    Returns:
+        Map of logical template names to resolved Jinja2 templates.
+    """
+    override_directories = [input_directory / file_type]
+    if file_type == "typst":
+        override_directories.insert(0, input_directory / theme)
+
+    overrides_fingerprint = tuple(
+        (str(folder), folder.stat().st_mtime_ns)
+        for directory in override_directories
+        if directory.is_dir()
+        for folder, _, _ in directory.walk()
+    )
+    template_index = build_template_index(
+        file_type, input_directory, theme, cache_directory, overrides_fingerprint
+    )
+    if overrides_fingerprint:
+        # Editing a file doesn't change its folder's modification time:
+        jinja2_environment = get_jinja2_environment(input_directory, cache_directory)
+        for relative_template_path, template in template_index.items():
+            if is_override(template) and not template.is_up_to_date:
+                template_index[relative_template_path] = (
+                    jinja2_environment.get_template(template.name)
+                )
+
+    return template_index
+
+
+def is_override(template: jinja2.Template) -> bool:
+    """Tell whether a template was loaded from the user's override folders.
+
+    Args:
+        template: Template from the index.
+
+    Returns:
+        True unless it is one of the built-in templates.
+    """
+    return template.filename is not None and not template.filename.startswith(
+        str(templates_directory)
+    )
+
+
+@functools.lru_cache(maxsize=16)
+def build_template_index(
+    file_type: Literal["markdown", "typst", "html"],
+    input_directory: pathlib.Path,
+    theme: str,
+    cache_directory: pathlib.Path | None,
+    overrides_fingerprint: tuple[tuple[str, int], ...],  # NOQA: ARG001
+) -> dict[str, jinja2.Template]:
+    """Resolve every built-in template name to the template that will be used.
+
+    Args:
+        file_type: Format for template directory selection.
+        input_directory: Directory of the input file, where user overrides live.
+        theme: Theme name used as the user override folder for Typst templates.
+        cache_directory: Optional directory for the persistent bytecode cache.
+        overrides_fingerprint: Paths and modification times of the override
+            folders. Only used as part of the cache key.
+
+    Returns:
+        Map of logical template names to resolved Jinja2 templates.
+    """
+    jinja2_environment = get_jinja2_environment(input_directory, cache_directory)
+    built_in_templates_directory = templates_directory / file_type
+    return {
+        relative_template_path: jinja2_environment.select_template(
+            get_template_names(file_type, relative_template_path, theme=theme)
+        )
+        for relative_template_path in sorted(
+            path.relative_to(built_in_templates_directory).as_posix()
+            for path in built_in_templates_directory.rglob("*")
+            if path.is_file()
+        )
+    }
@@ -0,0 +1,119 @@
+{% set section_icons = {
+  "skills": "⚙",
+  "publications": "📚",
+  "values": "🧭",
+  "hobbies": "❤",
+  "references": "📄",
+} %}
+{% macro section(rendercv_section, entries_separator, icon_prefix="") %}
+{% set section_title = rendercv_section.title %}
+{% set snake_case_section_title = rendercv_section.snake_case_title %}
+{% set entry_type = rendercv_section.entry_type %}
+{% set section_beginning %}{% include resolve_template("SectionBeginning.j2.typ") %}{% endset %}
+{{ section_beginning.replace(section_title, icon_prefix ~ section_title) }}
+{% for entry in rendercv_section.entries %}
+{% include resolve_template("entries/" ~ entry_type ~ ".j2.typ") %}{% if not loop.last %}{{ entries_separator }}{% endif %}
+{% endfor %}
+
+{% include resolve_template("SectionEnding.j2.typ") %}
+{% endmacro %}
+{% include resolve_template("Preamble.j2.typ") %}
+
+
+{% if design.theme == "sidebar" and design.sidebar is defined %}
+{% set sidebar_sections = cv.rendercv_sections|selectattr("snake_case_title", "in", design.sidebar.sections)|list %}
+{% set main_sections = cv.rendercv_sections|rejectattr("snake_case_title", "in", design.sidebar.sections)|list %}
+{% if design.sidebar.auto_balance %}
+// Invisible markers that report where each column and sidebar section ends, used to
+// balance the columns:
+#let rendercv-column-marker(column, section) = place(layout(size => context [#metadata((
+  column: column,
+  section: section,
+  width: size.width.pt(),
+  offset: (here().page() - 1) * (page.height - ({{ design.page.top_margin }} + {{ design.page.bottom_margin }}).to-absolute()).pt() + here().position().y.pt(),
+))<rendercv-column-marker>]))
+
+{% endif %}
+{% set sidebar_column %}
+  [
+    #block(width: 100%, inset: (x: 0.3cm, y: 0cm))[
+      #text(size: {{ design.sidebar.font_size }})[
+{% if design.sidebar.auto_balance %}
+#rendercv-column-marker("sidebar", none)
+{% endif %}
+{% for rendercv_section in sidebar_sections %}
+{% set icon = section_icons.get(rendercv_section.snake_case_title, "") %}
+{{ section(rendercv_section, "\n#v(" ~ design.sidebar.space_between_entries ~ ")\n", icon ~ " " if icon else "") }}{% if design.sidebar.auto_balance %}{{ "\n" }}#rendercv-column-marker("sidebar", "{{ rendercv_section.snake_case_title }}"){% endif %}{% if not loop.last %}{{ "\n\n" }}{% endif %}
+{% endfor %}
+
+      ]
+    ]
+  ]{% endset %}
+{% set main_column %}
+  [
+{% if design.sidebar.auto_balance %}
+#rendercv-column-marker("main", none)
+{% endif %}
+{% include resolve_template("Header.j2.typ") %}
+
+
+{% for rendercv_section in main_sections %}
+{{ section(rendercv_section, "\n\n") }}{% if not loop.last %}{{ "\n\n" }}{% endif %}
+{% endfor %}
+{% if design.sidebar.auto_balance %}
+#rendercv-column-marker("main", "end")
+{% endif %}
+
+  ]{% endset %}
+{% if design.sidebar.background_color and design.sidebar.position == "left" %}
+
+// Background for left sidebar extending to page edges
+#place(
+  top + left,
+  dx: -{{ design.page.left_margin }},
+  dy: -{{ design.page.top_margin }},
+  rect(
+    width: {{ design.sidebar.width }} + {{ design.page.left_margin }},
+    height: 100% + {{ design.page.top_margin }} + {{ design.page.bottom_margin }},
+    fill: {{ design.sidebar.background_color.as_rgb() }},
+  )
+)
+
+{% elif design.sidebar.background_color %}
+
+// Background for right sidebar extending to page edges
+#place(
+  top + right,
+  dx: {{ design.page.right_margin }},
+  dy: -{{ design.page.top_margin }},
+  rect(
+    width: {{ design.sidebar.width }} + {{ design.page.right_margin }},
+    height: 100% + {{ design.page.top_margin }} + {{ design.page.bottom_margin }},
+    fill: {{ design.sidebar.background_color.as_rgb() }},
+  )
+)
+
+{% endif %}
+{% if design.sidebar.position == "left" %}
+#grid(
+  columns: ({{ design.sidebar.width }}, 1fr),
+  gutter: {{ design.sidebar.gutter }},
+{{ sidebar_column }},
+{{ main_column }}
+)
+{% else %}
+#grid(
+  columns: (1fr, {{ design.sidebar.width }}),
+  gutter: {{ design.sidebar.gutter }},
+{{ main_column }},
+{{ sidebar_column }}
+)
+{% endif %}
+{% else %}
+{% include resolve_template("Header.j2.typ") %}
+
+{% for rendercv_section in cv.rendercv_sections %}
+
+{{ section(rendercv_section, "\n\n") -}}
+{% endfor %}
+{% endif %}
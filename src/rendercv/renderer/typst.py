@@ -2,20 +2,26 @@ import pathlib
 
 from rendercv.schema.models.rendercv_model import RenderCVModel
 
+from .output_writer import write_output, write_output_chunks
 from .path_resolver import resolve_rendercv_file_path
-from .templater.templater import render_full_template
+from .templater.templater import stream_full_template
 
 
-def generate_typst(rendercv_model: RenderCVModel) -> pathlib.Path | None:
+def generate_typst(
+    rendercv_model: RenderCVModel, typst_source: str | None = None
+) -> pathlib.Path | None:
     """Generate Typst source file from CV model via Jinja2 templates.
 
     Why:
         Typst is the intermediate format before PDF/PNG compilation. Templates
         convert validated model data to Typst markup with proper formatting,
-        fonts, and styling from design options.
+        fonts, and styling from design options. Compilation takes the source
+        from memory, so the file is only an artifact for users.
 
     Args:
         rendercv_model: Validated CV model with content and design.
+        typst_source: Already rendered source to write. Rendered from the
+            model and streamed to the file if not given.
 
     Returns:
         Path to generated Typst file, or None if generation disabled.
@@ -25,6 +31,14 @@ def generate_typst(rendercv_model: RenderCVModel) -> pathlib.Path | None:
     typst_path = resolve_rendercv_file_path(
         rendercv_model, rendercv_model.settings.render_command.typst_path
     )
-    typst_contents = render_full_template(rendercv_model, "typst")
-    typst_path.write_text(typst_contents, encoding="utf-8")
+    if typst_source is None:
+        write_output_chunks(
+            typst_path,
+            (
+                chunk.encode("utf-8")
+                for chunk in stream_full_template(rendercv_model, "typst")
+            ),
+        )
+    else:
+        write_output(typst_path, typst_source.encode("utf-8"))
     return typst_path
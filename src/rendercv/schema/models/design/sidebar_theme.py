@@ -876,6 +876,15 @@ class Sidebar(BaseModelWithoutExtraKeys):
             " The default value is ['skills', 'publications', 'values', 'hobbies', 'references']."
         ),
     )
+    auto_balance: bool = pydantic.Field(
+        default=False,
+        description=(
+            "Move sections from the end of the sidebar to the main column when the"
+            " sidebar is taller, so that both columns end at similar heights. Only"
+            " sections listed in `sections` are moved, and sections are never moved"
+            " from the main column to the sidebar. The default value is `false`."
+        ),
+    )
 
 
 class SidebarTheme(BaseModelWithoutExtraKeys):
@@ -1,3 +1,4 @@
+import concurrent.futures
 import pathlib
 
 import pydantic
@@ -42,6 +43,12 @@ class RenderCVModel(BaseModelWithoutExtraKeys):
     )
 
     _input_file_path: pathlib.Path | None = pydantic.PrivateAttr(default=None)
+    # Format-independent processed copy of the model, filled in by the renderer so
+    # that Typst and Markdown generation share the work, with the components it
+    # is built from. It is a future because one thread may still be building it:
+    _render_model: (
+        tuple[tuple[object, ...], concurrent.futures.Future["RenderCVModel"]] | None
+    ) = pydantic.PrivateAttr(default=None)
 
     @pydantic.model_validator(mode="after")
     def set_input_file_path(self, info: pydantic.ValidationInfo) -> "RenderCVModel":
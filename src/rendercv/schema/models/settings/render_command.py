@@ -76,6 +76,15 @@ class RenderCommand(BaseModelWithoutExtraKeys):
             f"{file_path_placeholders_description}"
         ),
     )
+    svg_path: PlannedPathRelativeToInput | None = pydantic.Field(
+        default=None,
+        title="SVG Path",
+        description=(
+            "Output path for SVG files, relative to the input YAML file. SVG files are"
+            " only generated if this is set.\n\n"
+            f"{file_path_placeholders_description}"
+        ),
+    )
     dont_generate_markdown: bool = pydantic.Field(
         default=False,
         title="Don't Generate Markdown",
@@ -93,7 +102,8 @@ class RenderCommand(BaseModelWithoutExtraKeys):
         default=False,
         title="Don't Generate Typst",
         description=(
-            "Skip Typst generation. This also disables PDF and PNG generation. The"
+            "Skip writing the Typst file. PDF, PNG, and SVG files are still"
+            " generated, because the Typst source is compiled from memory. The"
             " default value is `false`."
         ),
     )
@@ -107,3 +117,38 @@ class RenderCommand(BaseModelWithoutExtraKeys):
         title="Don't Generate PNG",
         description="Skip PNG generation. The default value is `false`.",
     )
+    png_ppi: pydantic.PositiveInt = pydantic.Field(
+        default=144,
+        title="PNG Resolution",
+        description=(
+            "Resolution of PNG files in pixels per inch (DPI). Lower values, like 72,"
+            " make thumbnails much faster to generate. The default value is `144`."
+        ),
+    )
+    png_pages: list[pydantic.PositiveInt] | None = pydantic.Field(
+        default=None,
+        title="PNG Pages",
+        description=(
+            "Page numbers to save as PNG files, starting from 1. For example, `[1]`"
+            " saves only the first page. All pages are saved by default."
+        ),
+    )
+    fit_pages: pydantic.PositiveInt | None = pydantic.Field(
+        default=None,
+        title="Fit to Pages",
+        description=(
+            "Maximum number of pages. If the CV is longer, margins, spacing, and the"
+            " body font size are reduced until it fits, using a limited number of"
+            " Typst compilations, and the chosen values are reported. Disabled by"
+            " default."
+        ),
+    )
+    cache_dir: PlannedPathRelativeToInput | None = pydantic.Field(
+        default=None,
+        title="Cache Directory",
+        description=(
+            "Directory for caches that persist between runs, such as compiled"
+            " templates, relative to the input YAML file. Reusing it makes later runs"
+            " start faster. Caching to disk is disabled by default."
+        ),
+    )
@@ -3,16 +3,19 @@ import datetime
 import pydantic
 
 from ..base import BaseModelWithoutExtraKeys
+from ..validation_context import get_today
 from .render_command import RenderCommand
 
 
 class Settings(BaseModelWithoutExtraKeys):
     current_date: datetime.date = pydantic.Field(
-        default_factory=datetime.date.today,
+        default_factory=get_today,
         title="Date",
         description=(
             'The date to use as "current date" for filenames, the "last updated" label,'
-            " and time span calculations. Defaults to the actual current date."
+            " time span calculations, and the creation date in the PDF metadata."
+            " Defaults to the date of the `SOURCE_DATE_EPOCH` environment variable if"
+            " it is set, otherwise to the actual current date."
         ),
     )
     render_command: RenderCommand = pydantic.Field(
@@ -1,5 +1,8 @@
+import os
 import pathlib
+from datetime import UTC
 from datetime import date as Date
+from datetime import datetime as DateTime
 from typing import cast
 
 import pydantic
@@ -43,9 +46,37 @@ def get_current_date(info: pydantic.ValidationInfo) -> Date:
         info: Pydantic validation info containing context.
 
     Returns:
-        Current date from context or Date.today().
+        Current date from context or `get_today()`.
     """
     if isinstance(info.context, dict):
         context = cast(ValidationContext, info.context["context"])
-        return context.current_date or Date.today()
-    return Date.today()
+        return context.current_date or get_today()
+    return get_today()
+
+
+def get_today() -> Date:
+    """Return today's date, or the date of `SOURCE_DATE_EPOCH` if it is set.
+
+    Why:
+        Reproducible builds set `SOURCE_DATE_EPOCH` so that outputs don't
+        depend on when they were built. Dates derived from "today", like the
+        "last updated" label and ongoing time spans, follow it.
+
+    Returns:
+        Date of `SOURCE_DATE_EPOCH` in UTC, or the actual current date.
+    """
+    source_date_epoch = get_source_date_epoch()
+    if source_date_epoch is None:
+        return Date.today()
+    return DateTime.fromtimestamp(source_date_epoch, tz=UTC).date()
+
+
+def get_source_date_epoch() -> int | None:
+    """Read the `SOURCE_DATE_EPOCH` environment variable.
+
+    Returns:
+        Seconds since the Unix epoch, or None if the variable isn't set or
+        isn't a non-negative integer.
+    """
+    value = os.environ.get("SOURCE_DATE_EPOCH", "")
+    return int(value) if value.isdigit() else None
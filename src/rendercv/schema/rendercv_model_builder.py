@@ -4,8 +4,10 @@ from typing import Any, TypedDict, Unpack
 import pydantic
 from ruamel.yaml.comments import CommentedMap
 
-from rendercv.exception import RenderCVUserValidationError
+from rendercv.exception import RenderCVUserError, RenderCVUserValidationError
 
+from .models.design.built_in_design import available_themes, built_in_design_adapter
+from .models.locale.locale import available_locales, locale_adapter
 from .models.rendercv_model import RenderCVModel
 from .models.validation_context import ValidationContext
 from .override_dictionary import apply_overrides_to_dictionary
@@ -22,12 +24,19 @@ class BuildRendercvModelArguments(TypedDict, total=False):
     markdown_path: pathlib.Path | str | None
     html_path: pathlib.Path | str | None
     png_path: pathlib.Path | str | None
+    svg_path: pathlib.Path | str | None
     dont_generate_typst: bool | None
     dont_generate_html: bool | None
     dont_generate_markdown: bool | None
     dont_generate_pdf: bool | None
     dont_generate_png: bool | None
+    png_ppi: int | None
+    png_pages: list[int] | None
+    fit_pages: int | None
+    cache_dir: pathlib.Path | str | None
     overrides: dict[str, str] | None
+    themes: list[str] | None
+    locales: list[str] | None
 
 
 def build_rendercv_dictionary(
@@ -76,17 +85,22 @@ def build_rendercv_dictionary(
                 input_dict["settings"]["render_command"][key] = path_or_contents
 
     # Optional render-command overrides
-    render_overrides: dict[str, pathlib.Path | str | bool | None] = {
+    render_overrides: dict[str, pathlib.Path | str | bool | int | list[int] | None] = {
         "typst_path": kwargs.get("typst_path"),
         "pdf_path": kwargs.get("pdf_path"),
         "markdown_path": kwargs.get("markdown_path"),
         "html_path": kwargs.get("html_path"),
         "png_path": kwargs.get("png_path"),
+        "svg_path": kwargs.get("svg_path"),
         "dont_generate_typst": kwargs.get("dont_generate_typst"),
         "dont_generate_html": kwargs.get("dont_generate_html"),
         "dont_generate_markdown": kwargs.get("dont_generate_markdown"),
         "dont_generate_pdf": kwargs.get("dont_generate_pdf"),
         "dont_generate_png": kwargs.get("dont_generate_png"),
+        "png_ppi": kwargs.get("png_ppi"),
+        "png_pages": kwargs.get("png_pages"),
+        "fit_pages": kwargs.get("fit_pages"),
+        "cache_dir": kwargs.get("cache_dir"),
     }
 
     for key, value in render_overrides.items():
@@ -179,3 +193,106 @@ def build_rendercv_dictionary_and_model(
     )
     m = build_rendercv_model_from_commented_map(d, input_file_path)
     return d, m
+
+
+def build_rendercv_model_variants(
+    rendercv_model: RenderCVModel,
+    themes: list[str] | None = None,
+    locales: list[str] | None = None,
+) -> dict[str, RenderCVModel]:
+    """Build a model for each combination of the given themes and locales.
+
+    Why:
+        Rendering a CV under many themes and locales used to re-read and
+        re-validate the whole input for each of them. The CV and settings of
+        the validated model are shared by the variants instead, and only each
+        theme and locale is validated, once, however many combinations use it.
+        Each variant writes its outputs to a subdirectory named after it, so
+        the variants don't overwrite each other.
+
+    Example:
+        ```py
+        variants = build_rendercv_model_variants(
+            model, themes=["classic", "moderncv"], locales=["english", "french"]
+        )
+        # variants["moderncv_french"].settings.render_command.pdf_path is
+        # Path("rendercv_output/moderncv_french/John_Doe_CV.pdf")
+        ```
+
+    Args:
+        rendercv_model: Validated model. It isn't changed.
+        themes: Built-in themes to vary. Defaults to the model's design only.
+        locales: Built-in locales to vary. Defaults to the model's locale only.
+
+    Returns:
+        Variant models keyed by the names of their subdirectories, which join
+        the varied theme and locale, like `moderncv_french`. The model's own
+        theme and locale keep its customizations; the others use defaults.
+    """
+    unknown_themes = [theme for theme in themes or [] if theme not in available_themes]
+    unknown_locales = [
+        locale for locale in locales or [] if locale not in available_locales
+    ]
+    if unknown_themes or unknown_locales:
+        message = (
+            f"{', '.join(unknown_themes + unknown_locales)} aren't built-in themes or"
+            f" locales! Available themes: {', '.join(available_themes)}. Available"
+            f" locales: {', '.join(available_locales)}."
+        )
+        raise RenderCVUserError(message)
+
+    validation_context = {
+        "context": ValidationContext(input_file_path=rendercv_model._input_file_path)
+    }
+    designs = {
+        theme: (
+            rendercv_model.design
+            if theme == rendercv_model.design.theme
+            else built_in_design_adapter.validate_python(
+                {"theme": theme}, context=validation_context
+            )
+        )
+        for theme in dict.fromkeys(themes or [rendercv_model.design.theme])
+    }
+    locale_models = {
+        language: (
+            rendercv_model.locale
+            if language == rendercv_model.locale.language
+            else locale_adapter.validate_python(
+                {"language": language}, context=validation_context
+            )
+        )
+        for language in dict.fromkeys(locales or [rendercv_model.locale.language])
+    }
+
+    variants: dict[str, RenderCVModel] = {}
+    for theme, design in designs.items():
+        for language, locale in locale_models.items():
+            variant_name = "_".join(
+                name
+                for name, varied in ((theme, themes), (language, locales))
+                if varied
+            )
+            render_command = rendercv_model.settings.render_command
+            output_paths = {
+                field: path.parent / variant_name / path.name
+                for field in (
+                    "typst_path",
+                    "pdf_path",
+                    "markdown_path",
+                    "html_path",
+                    "png_path",
+                    "svg_path",
+                )
+                if (path := getattr(render_command, field)) is not None
+            }
+            settings = rendercv_model.settings.model_copy(
+                update={
+                    "render_command": render_command.model_copy(update=output_paths)
+                }
+            )
+            variants[variant_name] = rendercv_model.model_copy(
+                update={"design": design, "locale": locale, "settings": settings}
+            )
+
+    return variants
@@ -1,4 +1,5 @@
 import pathlib
+import threading
 
 import ruamel.yaml
 import ruamel.yaml.scanner
@@ -50,7 +51,7 @@ def read_yaml(file_path_or_contents: pathlib.Path | str) -> CommentedMap:
     else:
         file_content = file_path_or_contents
 
-    yaml_as_dictionary: CommentedMap = yaml.load(file_content)
+    yaml_as_dictionary: CommentedMap = get_yaml_loader().load(file_content)
 
     if yaml_as_dictionary is None:
         message = "The input file is empty!"
@@ -78,9 +79,28 @@ class ScannerNoAlias(RoundTripScanner):
 
 # Monkey-patch the RoundTripScanner to treat * as a regular character:
 ruamel.yaml.scanner.RoundTripScanner = ScannerNoAlias  # ty: ignore[invalid-assignment]
-yaml = ruamel.yaml.YAML()
 
-# Disable ISO date parsing, keep it as a string:
-yaml.constructor.yaml_constructors["tag:yaml.org,2002:timestamp"] = (
-    lambda loader, node: loader.construct_scalar(node)
-)
+# Loaders keep the state of the document they parse, so each thread has its own:
+yaml_loaders = threading.local()
+
+
+def get_yaml_loader() -> ruamel.yaml.YAML:
+    """Return the current thread's YAML loader, creating it on first use.
+
+    Why:
+        A loader can't parse two documents at once. Services that validate
+        inputs on several threads would otherwise get corrupted parse results.
+
+    Returns:
+        Round-trip YAML loader that keeps ISO dates as strings.
+    """
+    yaml = getattr(yaml_loaders, "yaml", None)
+    if yaml is None:
+        yaml = ruamel.yaml.YAML()
+        # Disable ISO date parsing, keep it as a string:
+        yaml.constructor.yaml_constructors["tag:yaml.org,2002:timestamp"] = (
+            lambda loader, node: loader.construct_scalar(node)
+        )
+        yaml_loaders.yaml = yaml
+
+    return yaml
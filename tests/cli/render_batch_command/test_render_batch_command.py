@@ -0,0 +1,63 @@
+import json
+
+import pytest
+import typer
+
+from rendercv.cli.render_batch_command.render_batch_command import (
+    cli_command_render_batch,
+)
+from rendercv.schema.sample_generator import create_sample_yaml_input_file
+
+
+class TestCliCommandRenderBatch:
+    @pytest.fixture
+    def default_arguments(self):
+        return {
+            "inputs": None,
+            "manifest": None,
+            "workers": 1,
+            "design": None,
+            "locale": None,
+            "settings": None,
+            "dont_generate_markdown": False,
+            "dont_generate_html": False,
+            "dont_generate_typst": False,
+            "dont_generate_pdf": True,
+            "dont_generate_png": True,
+            "cache_dir": None,
+        }
+
+    def test_prints_a_json_line_per_file(self, tmp_path, default_arguments, capsys):
+        for name in ("John Doe", "Jane Doe"):
+            create_sample_yaml_input_file(
+                file_path=tmp_path / f"{name.replace(' ', '_')}_CV.yaml", name=name
+            )
+        default_arguments["inputs"] = [str(tmp_path)]
+
+        cli_command_render_batch(**default_arguments)
+
+        lines = capsys.readouterr().out.splitlines()
+        results = [json.loads(line) for line in lines]
+        assert len(results) == 2
+        assert all(result["status"] == "success" for result in results)
+        assert (tmp_path / "rendercv_output" / "Jane_Doe_CV.typ").is_file()
+
+    def test_exits_with_error_if_a_file_fails(
+        self, tmp_path, default_arguments, capsys
+    ):
+        (tmp_path / "Broken_CV.yaml").write_text("cv: [unclosed\n", encoding="utf-8")
+        default_arguments["inputs"] = [str(tmp_path / "Broken_CV.yaml")]
+
+        with pytest.raises(typer.Exit) as exc_info:
+            cli_command_render_batch(**default_arguments)
+
+        assert exc_info.value.exit_code == 1
+        assert json.loads(capsys.readouterr().out)["status"] == "error"
+
+    def test_exits_with_error_without_input_files(self, tmp_path, default_arguments):
+        default_arguments["inputs"] = [str(tmp_path)]
+
+        with pytest.raises(typer.Exit) as exc_info:
+            cli_command_render_batch(**default_arguments)
+
+        assert exc_info.value.exit_code == 1
@@ -0,0 +1,160 @@
+import pathlib
+
+import pytest
+
+from rendercv.cli.render_batch_command.run_batch import (
+    collect_input_files,
+    describe_error,
+    render_file,
+    run_batch,
+    warm_up_worker,
+)
+from rendercv.exception import (
+    RenderCVUserError,
+    RenderCVUserValidationError,
+    RenderCVValidationError,
+)
+from rendercv.renderer.templater import templater
+from rendercv.schema.rendercv_model_builder import BuildRendercvModelArguments
+from rendercv.schema.sample_generator import create_sample_yaml_input_file
+
+arguments: BuildRendercvModelArguments = {
+    "dont_generate_pdf": True,
+    "dont_generate_png": True,
+}
+
+
+@pytest.fixture
+def input_file(tmp_path) -> pathlib.Path:
+    input_file = tmp_path / "John_Doe_CV.yaml"
+    create_sample_yaml_input_file(file_path=input_file)
+    return input_file
+
+
+@pytest.fixture
+def broken_input_file(tmp_path) -> pathlib.Path:
+    broken_input_file = tmp_path / "Broken_CV.yaml"
+    broken_input_file.write_text("cv:\n  name: [unclosed\n", encoding="utf-8")
+    return broken_input_file
+
+
+class TestCollectInputFiles:
+    def test_expands_directories(self, tmp_path):
+        (tmp_path / "b.yaml").touch()
+        (tmp_path / "a.yml").touch()
+        (tmp_path / "notes.txt").touch()
+
+        assert collect_input_files([str(tmp_path)]) == [
+            tmp_path / "a.yml",
+            tmp_path / "b.yaml",
+        ]
+
+    def test_expands_glob_patterns(self, tmp_path):
+        (tmp_path / "nested").mkdir()
+        (tmp_path / "nested" / "John_CV.yaml").touch()
+        (tmp_path / "design.yaml").touch()
+
+        assert collect_input_files([f"{tmp_path}/**/*_CV.yaml"]) == [
+            tmp_path / "nested" / "John_CV.yaml"
+        ]
+
+    def test_reads_manifest(self, tmp_path):
+        manifest = tmp_path / "manifest.txt"
+        manifest.write_text("# Nightly\nfirst.yaml\n\n  second.yaml\n")
+
+        assert collect_input_files([], manifest) == [
+            tmp_path / "first.yaml",
+            tmp_path / "second.yaml",
+        ]
+
+    def test_removes_duplicates(self, tmp_path):
+        (tmp_path / "cv.yaml").touch()
+
+        assert collect_input_files([str(tmp_path), str(tmp_path / "cv.yaml")]) == [
+            tmp_path / "cv.yaml"
+        ]
+
+    def test_raises_for_missing_manifest(self, tmp_path):
+        with pytest.raises(RenderCVUserError):
+            collect_input_files([], tmp_path / "missing.txt")
+
+
+class TestRenderFile:
+    def test_reports_outputs_and_timings(self, input_file):
+        result = render_file(input_file, arguments)
+
+        assert result["status"] == "success"
+        assert result["input"] == str(input_file)
+        assert result["unchanged"] == []
+        assert "Generated Typst" in result["timings_ms"]
+        assert {pathlib.Path(output).suffix for output in result["outputs"]} == {
+            ".typ",
+            ".md",
+            ".html",
+        }
+        assert all(pathlib.Path(output).is_file() for output in result["outputs"])
+
+    def test_reports_unchanged_outputs(self, input_file):
+        render_file(input_file, arguments)
+
+        result = render_file(input_file, arguments)
+
+        assert sorted(result["unchanged"]) == sorted(result["outputs"])
+
+    def test_reports_errors(self, broken_input_file):
+        result = render_file(broken_input_file, arguments)
+
+        assert result["status"] == "error"
+        assert result["error"].startswith("This is not a valid YAML file!")
+
+
+def test_describe_error_joins_validation_errors():
+    error = RenderCVUserValidationError(
+        validation_errors=[
+            RenderCVValidationError(
+                location=("cv", "email"),
+                yaml_location=None,
+                message="Invalid email",
+                input="x",
+            ),
+            RenderCVValidationError(
+                location=("cv", "phone"),
+                yaml_location=None,
+                message="Invalid phone",
+                input="y",
+            ),
+        ]
+    )
+
+    assert describe_error(error) == "cv.email: Invalid email; cv.phone: Invalid phone"
+
+
+def test_warm_up_worker():
+    warm_up_worker()
+
+
+def test_warm_up_worker_ignores_errors_in_the_inputs_templates(tmp_path):
+    (tmp_path / "classic").mkdir()
+    (tmp_path / "classic" / "Header.j2.typ").write_text("{% if %}")
+
+    warm_up_worker(tmp_path)
+
+
+def test_warm_up_worker_fills_caches_of_the_inputs(tmp_path):
+    cache_dir = tmp_path / "cache"
+
+    warm_up_worker(tmp_path, {"cache_dir": cache_dir})
+    misses = templater.jinja2_environment_cache.cache_info().misses
+    templater.get_jinja2_environment(tmp_path, cache_dir)
+
+    assert templater.jinja2_environment_cache.cache_info().misses == misses
+    assert any((cache_dir / "jinja2").iterdir())
+
+
+def test_run_batch(input_file, broken_input_file):
+    results = list(run_batch([input_file, broken_input_file], workers=2, **arguments))
+
+    assert sorted((result["input"], result["status"]) for result in results) == [
+        (str(broken_input_file), "error"),
+        (str(input_file), "success"),
+    ]
@@ -37,6 +37,21 @@ class TestProgressPanelUpdateProgress:
         assert len(panel.completed_steps) == 1
         assert panel.completed_steps[0].paths == []
 
+    def test_stores_notes(self):
+        panel = ProgressPanel(quiet=True)
+
+        panel.update_progress("50", "Fitted to the page limit", [], ["a: b"])
+
+        assert panel.completed_steps[0].notes == ["a: b"]
+
+    def test_stores_unchanged_paths(self):
+        panel = ProgressPanel(quiet=True)
+        test_path = pathlib.Path.cwd() / "output.pdf"
+
+        panel.update_progress("50", "Generated PDF", [test_path], [], [test_path])
+
+        assert panel.completed_steps[0].unchanged_paths == [test_path]
+
 
 class TestProgressPanelFinishProgress:
     def test_clears_completed_steps(self):
@@ -97,6 +112,25 @@ class TestProgressPanelPrintProgressPanel:
 
         panel.print_progress_panel("Rendering your CV...")
 
+    def test_displays_unchanged_paths_as_note(self, monkeypatch):
+        panel = ProgressPanel(quiet=False)
+        path1 = pathlib.Path.cwd() / "page1.png"
+        path2 = pathlib.Path.cwd() / "page2.png"
+        panel.completed_steps.extend(
+            [
+                CompletedStep("100", "Generated PDF", [path1], [], [path1]),
+                CompletedStep("200", "Generated PNGs", [path1, path2], [], [path2]),
+            ]
+        )
+        updates = []
+        monkeypatch.setattr(panel, "update", updates.append)
+
+        panel.print_progress_panel("Rendering your CV...")
+
+        content = updates[0].renderable
+        assert "Unchanged, not rewritten[/bright_black]\n" in content
+        assert content.endswith("Unchanged, not rewritten: ./page2.png[/bright_black]")
+
     def test_handles_empty_steps(self):
         panel = ProgressPanel(quiet=True)
 
@@ -21,11 +21,18 @@ class TestCliCommandRender:
             "markdown_path": None,
             "html_path": None,
             "png_path": None,
+            "svg_path": None,
             "dont_generate_markdown": False,
             "dont_generate_html": False,
             "dont_generate_typst": False,
             "dont_generate_pdf": False,
             "dont_generate_png": False,
+            "png_ppi": None,
+            "png_pages": None,
+            "fit_pages": None,
+            "cache_dir": None,
+            "themes": None,
+            "locales": None,
             "watch": False,
             "quiet": False,
             "_": None,
@@ -89,12 +96,17 @@ class TestCliCommandRender:
                 ],
                 ["John_Doe_CV.html"],
             ),
-            # dont_generate_typst: skips Typst, PDF, and PNG
+            # dont_generate_typst: skips only Typst
             (
                 False,
                 {"dont_generate_typst": True},
-                ["John_Doe_CV.md", "John_Doe_CV.html"],
-                ["John_Doe_CV.typ", "John_Doe_CV.pdf", "John_Doe_CV_1.png"],
+                [
+                    "John_Doe_CV.pdf",
+                    "John_Doe_CV_1.png",
+                    "John_Doe_CV.md",
+                    "John_Doe_CV.html",
+                ],
+                ["John_Doe_CV.typ"],
             ),
             # dont_generate_pdf: skips only PDF
             (
@@ -143,6 +155,7 @@ class TestCliCommandRender:
             "markdown_path": input_file.parent / "custom.md",
             "html_path": input_file.parent / "custom.html",
             "png_path": input_file.parent / "custom.png",
+            "svg_path": input_file.parent / "custom.svg",
         }
 
         cli_command_render(
@@ -155,6 +168,7 @@ class TestCliCommandRender:
         assert (input_file.parent / "custom.md").exists()
         assert (input_file.parent / "custom.html").exists()
         assert (input_file.parent / "custom_1.png").exists()
+        assert (input_file.parent / "custom_1.svg").exists()
 
     def test_accepts_relative_input_file_path(self, input_file, default_arguments):
         cli_command_render(
@@ -165,6 +179,31 @@ class TestCliCommandRender:
         rendercv_output = input_file.parent / "rendercv_output"
         assert (rendercv_output / "John_Doe_CV.pdf").exists()
 
+    @pytest.mark.usefixtures("vendored_typst_packages")
+    def test_renders_theme_and_locale_matrix(self, input_file, default_arguments):
+        cli_command_render(
+            input_file_name=input_file,
+            **{
+                **default_arguments,
+                "themes": "classic, moderncv",
+                "locales": "english,turkish",
+                "dont_generate_png": True,
+            },
+        )
+
+        rendercv_output = input_file.parent / "rendercv_output"
+        for variant in (
+            "classic_english",
+            "classic_turkish",
+            "moderncv_english",
+            "moderncv_turkish",
+        ):
+            assert (rendercv_output / variant / "John_Doe_CV.pdf").exists()
+        assert "Fontin" in (
+            rendercv_output / "moderncv_turkish" / "John_Doe_CV.typ"
+        ).read_text(encoding="utf-8")
+        assert not (rendercv_output / "John_Doe_CV.pdf").exists()
+
     @patch("rendercv.cli.render_command.render_command.run_function_if_file_changes")
     def test_calls_watcher_when_watch_flag_is_true(
         self, mock_watcher, input_file, default_arguments
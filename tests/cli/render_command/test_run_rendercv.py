@@ -1,12 +1,25 @@
 import os
 import pathlib
 import sys
+import threading
 
 import pytest
 import typer
 
 from rendercv.cli.render_command.progress_panel import ProgressPanel
-from rendercv.cli.render_command.run_rendercv import run_rendercv, timed_step
+from rendercv.cli.render_command.run_rendercv import (
+    RenderStep,
+    get_render_steps,
+    render_input_file,
+    render_steps,
+    run_render_steps,
+    run_rendercv,
+    timed_step,
+)
+from rendercv.exception import RenderCVInternalError
+from rendercv.renderer.output_writer import write_output
+from rendercv.schema.models.cv.cv import Cv
+from rendercv.schema.models.rendercv_model import RenderCVModel
 
 
 class TestTimedStep:
@@ -67,6 +80,33 @@ class TestTimedStep:
 
         assert progress.completed_steps[0].message == "Generated PNGs"
 
+    def test_shows_dictionary_result_as_notes(self):
+        def sample_func() -> dict[str, str]:
+            return {"design.page.top_margin": "0.5in"}
+
+        progress = ProgressPanel(quiet=True)
+
+        timed_step("Fitted to the page limit", progress, sample_func)
+
+        assert progress.completed_steps[0].paths == []
+        assert progress.completed_steps[0].notes == ["design.page.top_margin: 0.5in"]
+
+    def test_marks_unchanged_outputs(self, tmp_path):
+        changed_path = tmp_path / "cv.pdf"
+        unchanged_path = tmp_path / "cv.html"
+        unchanged_path.write_bytes(b"html")
+
+        def sample_func() -> list[pathlib.Path]:
+            write_output(changed_path, b"pdf")
+            write_output(unchanged_path, b"html")
+            return [changed_path, unchanged_path]
+
+        progress = ProgressPanel(quiet=True)
+
+        timed_step("Generated output", progress, sample_func)
+
+        assert progress.completed_steps[0].unchanged_paths == [unchanged_path]
+
     def test_passes_args_and_kwargs_to_function(self):
         def sample_func(a: int, b: int, c: int = 0) -> int:
             return a + b + c
@@ -78,6 +118,100 @@ class TestTimedStep:
         assert result == 6
 
 
+class TestRunRenderSteps:
+    @pytest.fixture
+    def model(self) -> RenderCVModel:
+        return RenderCVModel(cv=Cv(name="John Doe"))
+
+    def test_passes_model_and_dependency_results(self, model):
+        steps = {
+            "name": RenderStep("Named", lambda model: model.cv.name),
+            "greeting": RenderStep(
+                "Greeted",
+                lambda model, name: f"{name} ({model.cv.name})",
+                ("name",),
+            ),
+        }
+
+        results = run_render_steps(steps, ProgressPanel(quiet=True), model)
+
+        assert results == {"name": "John Doe", "greeting": "John Doe (John Doe)"}
+
+    def test_runs_independent_steps_concurrently(self, model):
+        barrier = threading.Barrier(2, timeout=5)
+        steps = {
+            "first": RenderStep("First", lambda _: barrier.wait()),
+            "second": RenderStep("Second", lambda _: barrier.wait()),
+        }
+
+        results = run_render_steps(steps, ProgressPanel(quiet=True), model)
+
+        assert set(results) == {"first", "second"}
+
+    def test_reports_each_step(self, model):
+        steps = {
+            "first": RenderStep("First", lambda _: pathlib.Path.cwd() / "a.pdf"),
+            "second": RenderStep(
+                "Second", lambda _, path: path.with_suffix(".png"), ("first",)
+            ),
+        }
+        progress = ProgressPanel(quiet=True)
+
+        run_render_steps(steps, progress, model)
+
+        assert [step.message for step in progress.completed_steps] == [
+            "First",
+            "Second",
+        ]
+
+    def test_raises_step_errors(self, model):
+        def fail(_):
+            raise OSError
+
+        steps = {"fail": RenderStep("Failed", fail)}
+
+        with pytest.raises(OSError):  # NOQA: PT011
+            run_render_steps(steps, ProgressPanel(quiet=True), model)
+
+    def test_raises_for_unmet_dependencies(self, model):
+        steps = {"orphan": RenderStep("Orphan", lambda _, __: None, ("missing",))}
+
+        with pytest.raises(RenderCVInternalError):
+            run_render_steps(steps, ProgressPanel(quiet=True), model)
+
+    def test_skips_markdown_source_without_markdown(self):
+        model = RenderCVModel()
+        assert "markdown_source" in get_render_steps(model)
+
+        model.settings.render_command.dont_generate_markdown = True
+        steps = get_render_steps(model)
+
+        assert not {"markdown_source", "markdown", "html"} & set(steps)
+        for step in steps.values():
+            assert set(step.dependencies) <= set(steps)
+
+    def test_render_steps_only_depend_on_render_steps(self):
+        for step in render_steps.values():
+            assert set(step.dependencies) <= set(render_steps)
+
+
+def test_render_input_file_keys_variant_results(tmp_path):
+    yaml_file = tmp_path / "cv.yaml"
+    yaml_file.write_text("cv:\n  name: John Doe\n", encoding="utf-8")
+
+    results = render_input_file(
+        yaml_file,
+        ProgressPanel(quiet=True),
+        themes=["classic", "sb2nov"],
+        dont_generate_pdf=True,
+        dont_generate_png=True,
+    )
+
+    assert results["classic/typst"].parent.name == "classic"
+    assert results["sb2nov/typst"].parent.name == "sb2nov"
+    assert results["sb2nov/typst"].exists()
+
+
 class TestRunRendercv:
     def test_invalid_yaml(self, tmp_path):
         invalid_yaml = tmp_path / "invalid.yaml"
@@ -0,0 +1,241 @@
+import http.client
+import json
+import pathlib
+import queue
+import socket
+import threading
+import time
+import urllib.error
+import urllib.request
+import uuid
+
+import pytest
+
+from rendercv.cli.serve_command import render_server
+from rendercv.cli.serve_command.render_server import (
+    RenderService,
+    build_request_model,
+    create_render_server,
+    render_to_bytes,
+)
+from rendercv.exception import RenderCVUserError
+from rendercv.schema.sample_generator import create_sample_yaml_input_file
+
+
+@pytest.fixture
+def input_contents() -> str:
+    return create_sample_yaml_input_file(file_path=None)
+
+
+@pytest.fixture
+def render_service(tmp_path):
+    render_service = RenderService(tmp_path, max_concurrent_renders=2, timeout=30)
+    yield render_service
+    render_service.shutdown()
+
+
+@pytest.fixture
+def server_url(render_service):
+    server = create_render_server(render_service, port=0)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{server.server_address[1]}"
+    server.shutdown()
+    server.server_close()
+
+
+def post(url: str, body: bytes) -> tuple[int, str, bytes]:
+    request = urllib.request.Request(url, data=body, method="POST")
+    try:
+        with urllib.request.urlopen(request) as response:
+            return response.status, response.headers["Content-Type"], response.read()
+    except urllib.error.HTTPError as e:
+        return e.code, e.headers["Content-Type"], e.read()
+
+
+class TestRenderToBytes:
+    @pytest.mark.parametrize("file_format", ["typst", "markdown", "html"])
+    def test_renders_text_formats(self, input_contents, tmp_path, file_format):
+        result = render_to_bytes(input_contents, file_format, tmp_path)
+
+        assert b"John Doe" in result
+        assert list(tmp_path.iterdir()) == []
+
+    @pytest.mark.usefixtures("vendored_typst_packages")
+    def test_renders_pdf(self, input_contents, tmp_path):
+        result = render_to_bytes(input_contents, "pdf", tmp_path)
+
+        assert result.startswith(b"%PDF")
+
+
+class TestBuildRequestModel:
+    def test_ignores_render_settings_of_the_request(self, tmp_path):
+        input_contents = (
+            "cv:\n  name: John Doe\nsettings:\n  render_command:\n"
+            f"    cache_dir: {tmp_path / 'elsewhere'}\n"
+            f"    design: {tmp_path / 'design.yaml'}\n"
+        )
+
+        rendercv_model = build_request_model(input_contents, tmp_path / "cache")
+
+        assert rendercv_model.settings.render_command.cache_dir == tmp_path / "cache"
+        assert rendercv_model.settings.render_command.design is None
+
+    def test_rejects_photos_without_photo_directory(self):
+        with pytest.raises(RenderCVUserError, match="doesn't accept photos"):
+            build_request_model("cv:\n  name: John Doe\n  photo: photo.jpg\n")
+
+    @pytest.mark.parametrize("photo", ["../secret.jpg", "/etc/passwd"])
+    def test_rejects_photos_outside_photo_directory(self, tmp_path, photo):
+        photo_dir = tmp_path / "photos"
+        photo_dir.mkdir()
+
+        with pytest.raises(RenderCVUserError, match="photo directory"):
+            build_request_model(
+                f"cv:\n  name: John Doe\n  photo: {photo}\n", photo_dir=photo_dir
+            )
+
+    def test_resolves_photos_in_photo_directory(self, tmp_path):
+        photo_dir = tmp_path / "photos"
+        photo_dir.mkdir()
+        photo = photo_dir / "photo.svg"
+        photo.write_text('<svg xmlns="http://www.w3.org/2000/svg"/>', encoding="utf-8")
+
+        rendercv_model = build_request_model(
+            "cv:\n  name: John Doe\n  photo: photo.svg\n", photo_dir=photo_dir
+        )
+
+        assert rendercv_model.cv.photo == photo.resolve()
+
+
+class TestRenderService:
+    def test_frees_the_slot_after_a_failed_render(self, render_service):
+        with pytest.raises(RenderCVUserError):
+            render_service.render("cv:\n  name: John Doe\n", "docx")
+
+        assert render_service.slots.qsize() == 2
+
+    def test_raises_if_no_slot_is_free(self, tmp_path):
+        render_service = RenderService(tmp_path, max_concurrent_renders=1, timeout=0.1)
+        render_service.slots.get()
+
+        with pytest.raises(queue.Empty):
+            render_service.render("cv:\n  name: John Doe\n", "typst")
+
+        render_service.shutdown()
+
+    def test_raises_if_the_render_takes_too_long(self, tmp_path, monkeypatch):
+        monkeypatch.setattr(
+            render_server, "render_to_bytes", lambda *args: time.sleep(0.5)
+        )
+        render_service = RenderService(tmp_path, max_concurrent_renders=1, timeout=0.1)
+
+        with pytest.raises(TimeoutError):
+            render_service.render("cv:\n  name: John Doe\n", "typst")
+
+        render_service.shutdown()
+        assert render_service.slots.qsize() == 1
+
+
+class TestRenderServer:
+    def test_renders_yaml(self, server_url, input_contents):
+        status, content_type, body = post(
+            f"{server_url}/render?format=markdown", input_contents.encode()
+        )
+
+        assert status == 200
+        assert content_type == "text/markdown; charset=utf-8"
+        assert b"# John Doe" in body
+
+    def test_renders_json(self, server_url):
+        body = json.dumps({"cv": {"name": "John Doe"}}).encode()
+
+        status, _, result = post(f"{server_url}/render?format=typst", body)
+
+        assert status == 200
+        assert b"John Doe" in result
+
+    def test_renders_concurrent_requests(self, server_url, input_contents):
+        def render(results: list) -> None:
+            results.append(
+                post(f"{server_url}/render?format=html", input_contents.encode())
+            )
+
+        results: list = []
+        threads = [threading.Thread(target=render, args=(results,)) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert [status for status, _, _ in results] == [200] * 4
+
+    def test_returns_validation_errors(self, server_url):
+        status, content_type, body = post(
+            f"{server_url}/render?format=typst", b"cv:\n  email: not-an-email\n"
+        )
+
+        assert status == 422
+        assert content_type == "application/json"
+        assert json.loads(body)["validation_errors"][0]["location"] == [
+            "cv",
+            "email",
+        ]
+
+    def test_rejects_unknown_formats_without_taking_a_slot(
+        self, server_url, render_service, input_contents
+    ):
+        slots = [render_service.slots.get() for _ in range(2)]
+
+        status, _, body = post(
+            f"{server_url}/render?format=docx", input_contents.encode()
+        )
+
+        assert status == 400
+        assert json.loads(body)["error"].startswith("The format must be one of")
+        for slot in slots:
+            render_service.slots.put(slot)
+
+    def test_returns_invalid_yaml_errors(self, server_url):
+        status, _, body = post(f"{server_url}/render", b"cv: [unclosed\n")
+
+        assert status == 400
+        assert json.loads(body)["error"].startswith("This is not a valid YAML file!")
+
+    def test_reports_health(self, server_url):
+        with urllib.request.urlopen(f"{server_url}/health") as response:
+            health = json.loads(response.read())
+
+        assert health["status"] == "ok"
+        assert "hits" in health["typst_compilers"]
+
+    def test_returns_not_found_for_unknown_paths(self, server_url):
+        status, _, _ = post(f"{server_url}/unknown", b"")
+
+        assert status == 404
+
+
+def test_serves_on_unix_socket(render_service, input_contents):
+    # Unix socket paths are limited to about 100 characters, which pytest's
+    # temporary directories can exceed:
+    socket_path = pathlib.Path(f"/tmp/rendercv-test-{uuid.uuid4().hex}.sock")
+    server = create_render_server(render_service, socket_path=socket_path)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+
+    class UnixHTTPConnection(http.client.HTTPConnection):
+        def connect(self):
+            self.sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+            self.sock.connect(str(socket_path))
+
+    try:
+        connection = UnixHTTPConnection("localhost")
+        connection.request("POST", "/render?format=typst", input_contents.encode())
+        response = connection.getresponse()
+
+        assert response.status == 200
+        assert b"John Doe" in response.read()
+    finally:
+        server.shutdown()
+        server.server_close()
+        socket_path.unlink(missing_ok=True)
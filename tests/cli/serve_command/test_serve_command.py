@@ -0,0 +1,32 @@
+import http.server
+
+import pytest
+import typer
+
+from rendercv.cli.serve_command import serve_command
+from rendercv.cli.serve_command.serve_command import cli_command_serve
+
+
+class TestCliCommandServe:
+    @pytest.fixture(autouse=True)
+    def skip_warm_up(self, monkeypatch):
+        monkeypatch.setattr(serve_command, "warm_up_worker", lambda **_kwargs: None)
+
+    def test_serves_until_interrupted(self, monkeypatch, capsys):
+        def interrupt(_server):
+            raise KeyboardInterrupt
+
+        monkeypatch.setattr(http.server.ThreadingHTTPServer, "serve_forever", interrupt)
+
+        cli_command_serve(port=0, max_concurrent_renders=1)
+
+        assert "Serving RenderCV on http://127.0.0.1:" in capsys.readouterr().out
+
+    def test_refuses_to_replace_a_file_with_the_socket(self, tmp_path):
+        socket_path = tmp_path / "server.sock"
+        socket_path.write_text("important", encoding="utf-8")
+
+        with pytest.raises(typer.Exit):
+            cli_command_serve(socket_path=socket_path)
+
+        assert socket_path.read_text(encoding="utf-8") == "important"
@@ -48,6 +48,14 @@ class TestCliCommandNoArgs:
         assert "RenderCV is a command-line tool" in result.output
         mock_warn.assert_called_once()
 
+    @patch("rendercv.cli.app.warn_if_new_version_is_available")
+    def test_does_not_warn_for_machine_readable_commands(self, mock_warn):
+        runner = CliRunner()
+        result = runner.invoke(app, ["render-batch", "--help"])
+
+        assert result.exit_code == 0
+        mock_warn.assert_not_called()
+
 
 class TestWarnIfNewVersionIsAvailable:
     @pytest.mark.parametrize(
@@ -2,6 +2,8 @@ import pathlib
 
 import pytest
 
+from rendercv.renderer.pdf_png import typst_package_path
+
 
 def pytest_addoption(parser: pytest.Parser) -> None:
     parser.addoption(
@@ -24,3 +26,11 @@ def testdata_dir(request: pytest.FixtureRequest) -> pathlib.Path:
     base_dir = module_path.parent
 
     return base_dir / "testdata" / module_name
+
+
+@pytest.fixture
+def vendored_typst_packages() -> None:
+    # Built-in templates import Typst packages. Without the copies that
+    # `just update-typst-packages` vendors, compiling them needs network access:
+    if not any(typst_package_path.glob("*/*/*/typst.toml")):
+        pytest.skip("Typst packages aren't vendored")
@@ -6,6 +6,8 @@ import pytest
 from rendercv.exception import RenderCVInternalError
 from rendercv.renderer.templater.entry_templates_from_input import (
     clean_trailing_parts,
+    compile_entry_templates,
+    expand_compiled_template,
     process_authors,
     process_date,
     process_doi,
@@ -15,6 +17,7 @@ from rendercv.renderer.templater.entry_templates_from_input import (
     remove_not_provided_placeholders,
     render_entry_templates,
 )
+from rendercv.renderer.templater.string_processor import substitute_placeholders
 from rendercv.schema.models.cv.entries.normal import NormalEntry
 from rendercv.schema.models.cv.entries.publication import PublicationEntry
 from rendercv.schema.models.design.classic_theme import (
@@ -407,6 +410,49 @@ def test_remove_not_provided_placeholders(entry_templates, entry_fields, expecte
     assert result == expected
 
 
+@pytest.mark.parametrize(
+    ("entry_templates", "entry_fields"),
+    [
+        (
+            {"main": "**NAME**, LOCATION", "date": "DATE"},
+            {"NAME": "Entry", "DATE": "2024"},
+        ),
+        (
+            {"main": "**POSITION** at COMPANY_NAME", "extra": "plain text "},
+            {"POSITION": "Engineer", "COMPANY_NAME": "Acme"},
+        ),
+        (
+            {"main": "START_DATE to END_DATE - DATE"},
+            {"START_DATE": "Jan 2020", "END_DATE": "present", "DATE": "Jan 2020"},
+        ),
+    ],
+)
+def test_compiled_templates_match_substitution(entry_templates, entry_fields):
+    compiled = compile_entry_templates(
+        tuple(entry_templates.items()), frozenset(entry_fields)
+    )
+
+    expected = {
+        name: substitute_placeholders(template, entry_fields)
+        for name, template in remove_not_provided_placeholders(
+            entry_templates, entry_fields
+        ).items()
+    }
+    assert {
+        name: expand_compiled_template(segments, entry_fields)
+        for name, segments in compiled
+    } == expected
+
+
+def test_compile_entry_templates_is_cached_per_field_set():
+    entry_templates = (("main", "**NAME**, LOCATION"),)
+
+    first = compile_entry_templates(entry_templates, frozenset({"NAME"}))
+
+    assert first == (("main", ("**", "NAME", "**")),)
+    assert compile_entry_templates(entry_templates, frozenset({"NAME"})) is first
+
+
 @pytest.mark.parametrize(
     ("input_text", "expected"),
     [
@@ -0,0 +1,57 @@
+import pytest
+
+from rendercv.renderer.templater.field_plan import get_field_plan, iterate_fields
+from rendercv.schema.models.cv.entries.normal import NormalEntry
+from rendercv.schema.models.cv.entries.publication import PublicationEntry
+from rendercv.schema.models.cv.section import available_entry_models
+
+
+def test_get_field_plan_skips_fields():
+    assert get_field_plan(NormalEntry, frozenset({"start_date", "end_date"})) == (
+        "name",
+        "date",
+        "location",
+        "summary",
+        "highlights",
+    )
+
+
+@pytest.mark.parametrize(
+    "entry",
+    [
+        NormalEntry.model_validate(
+            {
+                "name": "Entry",
+                "start_date": "2020-01",
+                "end_date": "present",
+                "highlights": ["a", "b"],
+                "custom_key": "custom",
+            }
+        ),
+        PublicationEntry.model_validate(
+            {
+                "title": "Paper",
+                "authors": ["Jane Doe"],
+                "doi": "10.1109/TASC.2023.3340648",
+                "date": 2024,
+            }
+        ),
+    ],
+)
+def test_iterate_fields_matches_model_dump(entry):
+    assert dict(iterate_fields(entry)) == entry.model_dump(exclude_none=True)
+    assert list(dict(iterate_fields(entry))) == list(
+        entry.model_dump(exclude_none=True)
+    )
+
+
+def test_iterate_fields_skips_private_and_skipped_extras():
+    entry = NormalEntry.model_validate({"name": "Entry", "custom_key": "custom"})
+    entry._hidden = "hidden"  # ty: ignore[unresolved-attribute]
+
+    assert dict(iterate_fields(entry, frozenset({"custom_key"}))) == {"name": "Entry"}
+
+
+@pytest.mark.parametrize("entry_type", available_entry_models)
+def test_get_field_plan_covers_every_entry_type(entry_type):
+    assert get_field_plan(entry_type) == tuple(entry_type.model_fields)
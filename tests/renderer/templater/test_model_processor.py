@@ -1,9 +1,18 @@
+import concurrent.futures
+import threading
+import time
 from datetime import date as Date
 
 import pydantic
 import pytest
 
-from rendercv.renderer.templater.model_processor import process_fields, process_model
+from rendercv.renderer.templater import model_processor
+from rendercv.renderer.templater.model_processor import (
+    clear_render_model,
+    get_render_model,
+    process_fields,
+    process_model,
+)
 from rendercv.schema.models.cv.cv import Cv
 from rendercv.schema.models.cv.entries.normal import NormalEntry
 from rendercv.schema.models.rendercv_model import RenderCVModel
@@ -178,3 +187,114 @@ class TestProcessModel:
         assert result.cv.name == "Jane Doe"
         assert result.cv.headline == "Software Engineer"
         assert hasattr(result.cv, "connections")
+
+    def test_formats_share_render_model_without_mutating_it(self, model):
+        render_model = get_render_model(model)
+        render_entry = render_model.cv.rendercv_sections[0].entries[0]
+        main_column = render_entry.main_column
+
+        typst_result = process_model(model, "typst")
+        markdown_result = process_model(model, "markdown")
+
+        assert get_render_model(model) is render_model
+        assert render_entry.main_column == main_column
+        assert typst_result.cv.name == "Jane Doe \\@"
+        assert markdown_result.cv.name == "Jane Doe @"
+        assert (
+            markdown_result.cv.rendercv_sections[0]
+            .entries[0]
+            .main_column.startswith("**Backend Work**")
+        )
+
+
+class TestGetRenderModel:
+    def test_does_not_mutate_input_model(self, model):
+        get_render_model(model)
+
+        assert not hasattr(model.cv, "plain_name")
+        assert model.cv.rendercv_sections[0].entries[0].name == "Backend Work"
+
+    def test_shares_unchanged_values_with_input_model(self, model):
+        render_model = get_render_model(model)
+
+        entry = model.cv.rendercv_sections[0].entries[0]
+        render_entry = render_model.cv.rendercv_sections[0].entries[0]
+        assert render_entry is not entry
+        assert render_entry.highlights is entry.highlights
+        assert render_model.design is model.design
+
+    def test_rebuilds_when_a_component_is_replaced(self, model):
+        render_model = get_render_model(model)
+
+        model.settings = model.settings.model_copy(
+            update={"current_date": Date(2025, 2, 1)}
+        )
+
+        assert get_render_model(model) is not render_model
+
+    def test_keeps_components_it_was_built_from(self, model):
+        get_render_model(model)
+        settings = model.settings
+
+        model.settings = model.settings.model_copy()
+
+        assert model._render_model is not None
+        assert model._render_model[0][3] is settings
+
+    def test_builds_different_models_concurrently(self, model, monkeypatch):
+        both_building = threading.Barrier(2, timeout=5)
+        original_build_render_model = model_processor.build_render_model
+
+        def build_render_model(rendercv_model):
+            # Fails with BrokenBarrierError if the builds are serialized:
+            both_building.wait()
+            return original_build_render_model(rendercv_model)
+
+        monkeypatch.setattr(model_processor, "build_render_model", build_render_model)
+        models = [model, model.model_copy(update={"cv": model.cv.model_copy()})]
+
+        with concurrent.futures.ThreadPoolExecutor(max_workers=2) as executor:
+            render_models = list(executor.map(get_render_model, models))
+
+        assert render_models[0] is not render_models[1]
+
+    def test_builds_once_for_concurrent_callers(self, model, monkeypatch):
+        builds = []
+        original_build_render_model = model_processor.build_render_model
+
+        def build_render_model(rendercv_model):
+            builds.append(rendercv_model)
+            time.sleep(0.05)
+            return original_build_render_model(rendercv_model)
+
+        monkeypatch.setattr(model_processor, "build_render_model", build_render_model)
+
+        with concurrent.futures.ThreadPoolExecutor(max_workers=4) as executor:
+            render_models = list(executor.map(get_render_model, [model] * 4))
+
+        assert len(builds) == 1
+        assert all(render_model is render_models[0] for render_model in render_models)
+
+    def test_retries_after_a_failed_build(self, model, monkeypatch):
+        original_build_render_model = model_processor.build_render_model
+
+        def fail(_rendercv_model):
+            raise ValueError("failed")
+
+        monkeypatch.setattr(model_processor, "build_render_model", fail)
+        with pytest.raises(ValueError, match="failed"):
+            get_render_model(model)
+        monkeypatch.setattr(
+            model_processor, "build_render_model", original_build_render_model
+        )
+
+        assert get_render_model(model).cv.plain_name == model.cv.name  # ty: ignore[unresolved-attribute]
+
+    def test_rebuilds_after_clearing(self, model):
+        render_model = get_render_model(model)
+
+        model.cv.name = "John Doe"
+        clear_render_model(model)
+
+        assert get_render_model(model) is not render_model
+        assert get_render_model(model).cv.plain_name == "John Doe"  # ty: ignore[unresolved-attribute]
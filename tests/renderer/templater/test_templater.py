@@ -0,0 +1,194 @@
+import os
+import pathlib
+
+import pytest
+
+from rendercv.renderer.templater import templater
+from rendercv.renderer.templater.templater import (
+    get_jinja2_environment,
+    get_template_index,
+    get_template_names,
+    render_full_template,
+    stream_full_template,
+)
+from rendercv.schema.models.cv.cv import Cv
+from rendercv.schema.models.rendercv_model import RenderCVModel
+
+
+@pytest.fixture
+def model_with_input_file(tmp_path: pathlib.Path) -> RenderCVModel:
+    cv = Cv.model_validate(
+        {
+            "name": "Jane Doe",
+            "sections": {
+                "Summary": ["First text entry.", "Second text entry."],
+                "Skills": [{"label": "Languages", "details": "Python, Typst"}],
+            },
+        }
+    )
+    rendercv_model = RenderCVModel(cv=cv)
+    rendercv_model._input_file_path = tmp_path / "Jane_Doe_CV.yaml"
+    return rendercv_model
+
+
+@pytest.mark.parametrize(
+    ("file_type", "expected"),
+    [
+        ("typst", ["classic/Header.j2.typ", "typst/Header.j2.typ"]),
+        ("markdown", ["markdown/Header.j2.typ"]),
+        ("html", ["html/Header.j2.typ"]),
+    ],
+)
+def test_get_template_names(file_type, expected):
+    assert get_template_names(file_type, "Header.j2.typ", theme="classic") == expected
+
+
+class TestGetJinja2Environment:
+    def test_keeps_one_environment_per_directory(self, tmp_path):
+        first_directory = tmp_path / "first"
+        second_directory = tmp_path / "second"
+
+        first = get_jinja2_environment(first_directory)
+        second = get_jinja2_environment(second_directory)
+
+        assert first is not second
+        assert get_jinja2_environment(first_directory) is first
+
+    def test_writes_bytecode_to_cache_directory(self, tmp_path):
+        cache_directory = tmp_path / "cache"
+
+        environment = get_jinja2_environment(tmp_path, cache_directory)
+        environment.get_template("typst/Preamble.j2.typ")
+
+        assert any((cache_directory / "jinja2").iterdir())
+
+    def test_shares_compiled_templates_between_environments(
+        self, tmp_path, monkeypatch
+    ):
+        bytecode_cache = templater.InMemoryBytecodeCache()
+        monkeypatch.setattr(templater, "in_memory_bytecode_cache", bytecode_cache)
+        first = templater.create_jinja2_environment(tmp_path / "first")
+        second = templater.create_jinja2_environment(tmp_path / "second")
+
+        first.get_template("typst/Preamble.j2.typ")
+
+        def fail(_bucket):
+            raise AssertionError
+
+        # The second environment must load the bytecode instead of compiling:
+        monkeypatch.setattr(bytecode_cache, "dump_bytecode", fail)
+        second.get_template("typst/Preamble.j2.typ")
+
+        assert len(bytecode_cache.bytecode) == 1
+
+    def test_drops_least_recently_used_bytecode(self, tmp_path, monkeypatch):
+        bytecode_cache = templater.InMemoryBytecodeCache(maximum_size=1)
+        monkeypatch.setattr(templater, "in_memory_bytecode_cache", bytecode_cache)
+        environment = templater.create_jinja2_environment(tmp_path)
+
+        environment.get_template("typst/Preamble.j2.typ")
+        environment.get_template("typst/Header.j2.typ")
+
+        assert len(bytecode_cache.bytecode) == 1
+
+    def test_set_cache_size(self, tmp_path):
+        try:
+            templater.set_jinja2_environment_cache_size(1)
+            # The function imported before resizing must use the new cache:
+            first = get_jinja2_environment(tmp_path / "first")
+            get_jinja2_environment(tmp_path / "second")
+
+            assert get_jinja2_environment(tmp_path / "first") is not first
+            assert templater.jinja2_environment_cache.cache_info().maxsize == 1
+        finally:
+            templater.set_jinja2_environment_cache_size(8)
+
+
+class TestGetTemplateIndex:
+    def test_contains_every_built_in_template(self, tmp_path):
+        template_index = get_template_index(
+            "typst", input_directory=tmp_path, theme="classic"
+        )
+
+        assert "Full.j2.typ" in template_index
+        assert "entries/NormalEntry.j2.typ" in template_index
+
+    def test_reuses_index_while_overrides_are_unchanged(self, tmp_path):
+        first = get_template_index("typst", input_directory=tmp_path, theme="classic")
+        second = get_template_index("typst", input_directory=tmp_path, theme="classic")
+
+        assert first is second
+
+    def test_rebuilds_index_when_overrides_change(self, tmp_path):
+        before = get_template_index("typst", input_directory=tmp_path, theme="classic")
+
+        theme_folder = tmp_path / "classic"
+        theme_folder.mkdir()
+        (theme_folder / "Header.j2.typ").write_text("= Custom", encoding="utf-8")
+
+        after = get_template_index("typst", input_directory=tmp_path, theme="classic")
+
+        assert before is not after
+        assert pathlib.Path(after["Header.j2.typ"].filename) == (  # ty: ignore[invalid-argument-type]
+            theme_folder / "Header.j2.typ"
+        )
+        assert after["Preamble.j2.typ"] is before["Preamble.j2.typ"]
+
+    def test_reloads_overrides_edited_in_place(self, tmp_path):
+        theme_folder = tmp_path / "classic"
+        theme_folder.mkdir()
+        header = theme_folder / "Header.j2.typ"
+        header.write_text("= Old", encoding="utf-8")
+        get_template_index("typst", input_directory=tmp_path, theme="classic")
+
+        header.write_text("= New", encoding="utf-8")
+        os.utime(header, ns=(0, 0))
+
+        template_index = get_template_index(
+            "typst", input_directory=tmp_path, theme="classic"
+        )
+
+        assert template_index["Header.j2.typ"].render() == "= New"
+
+
+class TestRenderFullTemplate:
+    def test_renders_every_section_and_entry(self, model_with_input_file):
+        result = render_full_template(model_with_input_file, "typst")
+
+        assert result.startswith("// Import the rendercv function")
+        assert "== Summary\n\nFirst text entry.\n\nSecond text entry." in result
+        assert "== Skills" in result
+
+    def test_uses_theme_overrides_for_included_templates(
+        self, model_with_input_file, tmp_path
+    ):
+        entries_folder = tmp_path / "classic" / "entries"
+        entries_folder.mkdir(parents=True)
+        (tmp_path / "classic" / "SectionBeginning.j2.typ").write_text(
+            "== Custom {{ section_title }}", encoding="utf-8"
+        )
+        (entries_folder / "TextEntry.j2.typ").write_text(
+            "#custom-text[{{ entry }}]", encoding="utf-8"
+        )
+
+        result = render_full_template(model_with_input_file, "typst")
+
+        assert "== Custom Summary" in result
+        assert "== Custom Skills" in result
+        assert "#custom-text[First text entry.]" in result
+        # Templates that are not overridden fall back to the built-in ones:
+        assert "Languages" in result
+
+    def test_renders_markdown(self, model_with_input_file):
+        result = render_full_template(model_with_input_file, "markdown")
+
+        assert result.startswith("# Jane Doe's CV")
+        assert "# Summary\nFirst text entry.\n\nSecond text entry." in result
+
+
+@pytest.mark.parametrize("file_type", ["typst", "markdown"])
+def test_stream_full_template(model_with_input_file, file_type):
+    chunks = list(stream_full_template(model_with_input_file, file_type))
+
+    assert len(chunks) > 1
+    assert "".join(chunks) == render_full_template(model_with_input_file, file_type)
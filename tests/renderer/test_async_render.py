@@ -0,0 +1,167 @@
+import asyncio
+import pathlib
+import threading
+import time
+
+import pytest
+
+from rendercv.exception import RenderCVUserValidationError
+from rendercv.renderer import async_render, pdf_png
+from rendercv.renderer.async_render import (
+    build_rendercv_model_async,
+    compile_typst_async,
+    render_async,
+    render_full_template_async,
+    set_render_executor_size,
+)
+
+
+class BlockingCompiler:
+    def __init__(self):
+        self.release = threading.Event()
+        self.condition = threading.Condition()
+        self.running = 0
+        self.most_running = 0
+        self.compiles = 0
+
+    def compile(self, input, format, ppi=None, timestamp=None):  # NOQA: ARG002
+        with self.condition:
+            self.compiles += 1
+            self.running += 1
+            self.most_running = max(self.most_running, self.running)
+            self.condition.notify_all()
+        self.release.wait(timeout=5)
+        with self.condition:
+            self.running -= 1
+        return b"%PDF"
+
+    def wait_until_running(self, count: int) -> None:
+        with self.condition:
+            assert self.condition.wait_for(lambda: self.running == count, timeout=5)
+
+
+@pytest.fixture(autouse=True)
+def render_executor(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setattr(async_render, "render_executor", None)
+    yield
+    if async_render.render_executor is not None:
+        async_render.render_executor.shutdown(wait=True)
+
+
+@pytest.fixture
+def blocking_compiler(monkeypatch):
+    compiler = BlockingCompiler()
+
+    def get_typst_compiler(_root, _font_paths):
+        return compiler
+
+    monkeypatch.setattr(pdf_png, "get_typst_compiler", get_typst_compiler)
+    # Spare compilers stand for the pooled one when it is busy:
+    monkeypatch.setattr(
+        pdf_png, "create_typst_compiler", lambda _root, _font_paths: compiler
+    )
+    monkeypatch.setattr(pdf_png, "spare_typst_compilers", {})
+    yield compiler
+    compiler.release.set()
+
+
+def test_builds_model_from_yaml():
+    rendercv_model = asyncio.run(build_rendercv_model_async("cv:\n  name: John Doe\n"))
+
+    assert rendercv_model.cv.name == "John Doe"
+
+
+def test_raises_validation_errors():
+    with pytest.raises(RenderCVUserValidationError):
+        asyncio.run(build_rendercv_model_async({"cv": {"email": "not-an-email"}}))
+
+
+def test_renders_template_and_compiles(blocking_compiler):
+    blocking_compiler.release.set()
+
+    async def render_and_compile():
+        rendercv_model = await build_rendercv_model_async({"cv": {"name": "John Doe"}})
+        typst_source = await render_full_template_async(rendercv_model, "typst")
+        return typst_source, await compile_typst_async(
+            rendercv_model, typst_source, ("pdf",), pathlib.Path.cwd()
+        )
+
+    typst_source, typst_document = asyncio.run(render_and_compile())
+
+    assert "John Doe" in typst_source
+    assert typst_document is not None
+    assert typst_document.pdf == b"%PDF"
+
+
+def test_renders_text_formats(tmp_path):
+    outputs = asyncio.run(
+        render_async({"cv": {"name": "John Doe"}}, ("typst", "markdown", "html"))
+    )
+
+    assert list(outputs) == ["typst", "markdown", "html"]
+    assert all(b"John Doe" in contents for contents in outputs.values())
+    assert list(tmp_path.iterdir()) == []
+
+
+def test_keeps_event_loop_responsive(blocking_compiler):
+    async def render_while_ticking() -> int:
+        ticks = 0
+        render_task = asyncio.create_task(
+            render_async({"cv": {"name": "John Doe"}}, ("pdf",))
+        )
+        await asyncio.to_thread(blocking_compiler.wait_until_running, 1)
+        for _ in range(5):
+            await asyncio.sleep(0.01)
+            ticks += 1
+        blocking_compiler.release.set()
+        await render_task
+        return ticks
+
+    assert asyncio.run(render_while_ticking()) == 5
+
+
+def test_bounds_concurrent_renders(blocking_compiler):
+    set_render_executor_size(2)
+
+    async def render_many():
+        tasks = [
+            asyncio.create_task(render_async({"cv": {"name": "John Doe"}}, ("pdf",)))
+            for _ in range(4)
+        ]
+        # Both threads are held in compilations, so the other renders must
+        # wait in the queue until they are released:
+        await asyncio.to_thread(blocking_compiler.wait_until_running, 2)
+        compiles_while_full = blocking_compiler.compiles
+        blocking_compiler.release.set()
+        return compiles_while_full, await asyncio.gather(*tasks)
+
+    compiles_while_full, outputs = asyncio.run(render_many())
+
+    assert compiles_while_full == 2
+    assert [output["pdf"] for output in outputs] == [b"%PDF"] * 4
+    assert blocking_compiler.most_running == 2
+
+
+def test_cancelled_render_does_not_start_queued_work(blocking_compiler):
+    set_render_executor_size(1)
+
+    async def cancel_queued_render():
+        running_task = asyncio.create_task(
+            render_async({"cv": {"name": "John Doe"}}, ("pdf",))
+        )
+        await asyncio.to_thread(blocking_compiler.wait_until_running, 1)
+        queued_task = asyncio.create_task(
+            render_async({"cv": {"name": "Jane Doe"}}, ("pdf",))
+        )
+        await asyncio.sleep(0.05)
+        queued_task.cancel()
+        blocking_compiler.release.set()
+        await running_task
+        with pytest.raises(asyncio.CancelledError):
+            await queued_task
+
+    asyncio.run(cancel_queued_render())
+    time.sleep(0.1)
+
+    assert blocking_compiler.compiles == 1
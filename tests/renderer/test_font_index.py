@@ -0,0 +1,163 @@
+import concurrent.futures
+import json
+
+import pytest
+import rendercv_fonts
+
+from rendercv.renderer import font_index
+from rendercv.renderer.font_index import (
+    get_design_font_families,
+    get_font_index,
+    get_font_paths,
+    read_font_names,
+)
+from rendercv.schema.models.rendercv_model import RenderCVModel
+
+
+@pytest.fixture(autouse=True)
+def empty_in_memory_index():
+    font_index.read_font_index.cache_clear()
+    yield
+    font_index.read_font_index.cache_clear()
+
+
+@pytest.mark.parametrize(
+    ("family", "file_name", "expected"),
+    [
+        ("Lato", "Lato-Bold.ttf", ("Lato", "Bold")),
+        ("Source Sans 3", "SourceSans3-Italic.ttf", ("Source Sans 3", "Italic")),
+    ],
+)
+def test_read_font_names(family, file_name, expected):
+    font_file = rendercv_fonts.path_of[family] / file_name
+
+    assert read_font_names(font_file.read_bytes()) == expected
+
+
+def test_read_font_names_rejects_non_fonts():
+    with pytest.raises(ValueError, match="name table"):
+        read_font_names(b"\x00\x01\x00\x00\x00\x00" + b"\x00" * 6)
+
+
+def test_get_design_font_families():
+    model = RenderCVModel(
+        design={"theme": "classic", "typography": {"font_family": "Lato"}}
+    )
+
+    assert set(get_design_font_families(model)) == {"Lato"}
+
+
+class TestGetFontIndex:
+    @pytest.fixture
+    def font_folder(self, tmp_path):
+        font_folder = tmp_path / "fonts"
+        font_folder.mkdir()
+        lato = rendercv_fonts.path_of["Lato"] / "Lato-Regular.ttf"
+        (font_folder / "Lato-Regular.ttf").write_bytes(lato.read_bytes())
+        return font_folder
+
+    def test_records_family_style_and_file(self, font_folder):
+        result = get_font_index((font_folder,), None)
+
+        assert result == {
+            str(font_folder): [
+                {
+                    "family": "lato",
+                    "style": "Regular",
+                    "file": str(font_folder / "Lato-Regular.ttf"),
+                }
+            ]
+        }
+
+    def test_persists_index(self, font_folder, tmp_path, monkeypatch):
+        cache_directory = tmp_path / "cache"
+        get_font_index((font_folder,), cache_directory)
+        font_index.read_font_index.cache_clear()
+
+        def fail(_font_folder):
+            raise AssertionError
+
+        monkeypatch.setattr(font_index, "index_font_folder", fail)
+        result = get_font_index((font_folder,), cache_directory)
+
+        assert result[str(font_folder)][0]["family"] == "lato"
+        stored = json.loads((cache_directory / "font_index.json").read_text())
+        assert str(font_folder) in stored
+
+    def test_leaves_no_temporary_files(self, font_folder, tmp_path):
+        cache_directory = tmp_path / "cache"
+
+        get_font_index((font_folder,), cache_directory)
+
+        assert [path.name for path in cache_directory.iterdir()] == ["font_index.json"]
+
+    def test_indexes_concurrently(self, font_folder, tmp_path):
+        cache_directory = tmp_path / "cache"
+        folders = [font_folder, *rendercv_fonts.paths_to_font_folders[:4]]
+
+        with concurrent.futures.ThreadPoolExecutor(max_workers=4) as executor:
+            results = list(
+                executor.map(
+                    lambda folder: get_font_index((folder,), cache_directory),
+                    folders,
+                )
+            )
+
+        assert all(
+            str(folder) in result
+            for folder, result in zip(folders, results, strict=True)
+        )
+        stored = json.loads((cache_directory / "font_index.json").read_text())
+        assert {str(folder) for folder in folders} <= set(stored)
+
+    def test_reads_changed_folders_again(self, font_folder):
+        get_font_index((font_folder,), None)
+        (font_folder / "Lato-Regular.ttf").rename(font_folder / "Lato.txt")
+
+        assert get_font_index((font_folder,), None) == {str(font_folder): []}
+
+    def test_reads_folders_with_changed_subfolders_again(self, font_folder):
+        subfolder = font_folder / "Lato"
+        subfolder.mkdir()
+        (font_folder / "Lato-Regular.ttf").rename(subfolder / "Lato-Regular.ttf")
+        get_font_index((font_folder,), None)
+        (subfolder / "Lato-Regular.ttf").rename(subfolder / "Lato.txt")
+
+        assert get_font_index((font_folder,), None) == {str(font_folder): []}
+
+    def test_missing_folder_has_no_fonts(self, tmp_path):
+        assert get_font_index((tmp_path / "missing",), None) == {
+            str(tmp_path / "missing"): []
+        }
+
+
+class TestGetFontPaths:
+    def test_only_includes_used_families(self):
+        model = RenderCVModel(
+            design={"theme": "classic", "typography": {"font_family": "Lato"}}
+        )
+
+        font_paths = get_font_paths(model)
+
+        assert rendercv_fonts.path_of["Lato"] in font_paths
+        assert rendercv_fonts.path_of["Font Awesome 7"] in font_paths
+        assert rendercv_fonts.path_of["Roboto"] not in font_paths
+
+    def test_includes_script_fallback_fonts(self):
+        model = RenderCVModel(
+            design={"theme": "classic", "typography": {"font_family": "Lato"}}
+        )
+
+        font_paths = get_font_paths(model)
+
+        assert rendercv_fonts.path_of["Noto Sans"] in font_paths
+        assert rendercv_fonts.path_of["Mukta"] in font_paths
+
+    def test_includes_all_folders_for_unknown_families(self):
+        model = RenderCVModel(
+            design={"theme": "classic", "typography": {"font_family": "Unknown Font"}}
+        )
+
+        font_paths = get_font_paths(model)
+
+        assert set(rendercv_fonts.paths_to_font_folders) <= set(font_paths)
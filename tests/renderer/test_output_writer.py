@@ -0,0 +1,146 @@
+import collections
+import os
+import stat
+
+import pytest
+
+from rendercv.renderer import output_writer
+from rendercv.renderer.output_writer import (
+    get_output_digest,
+    is_output_unchanged,
+    write_output,
+    write_output_chunks,
+)
+
+
+def test_writes_new_output(tmp_path):
+    path = tmp_path / "cv.pdf"
+
+    assert write_output(path, b"contents")
+
+    assert path.read_bytes() == b"contents"
+    assert not is_output_unchanged(path)
+
+
+def test_skips_identical_output(tmp_path):
+    path = tmp_path / "cv.pdf"
+    write_output(path, b"contents")
+    os.utime(path, ns=(0, 0))
+
+    assert not write_output(path, b"contents")
+
+    assert path.stat().st_mtime_ns == 0
+    assert is_output_unchanged(path)
+
+
+def test_skips_identical_output_written_by_another_process(tmp_path):
+    path = tmp_path / "cv.pdf"
+    path.write_bytes(b"contents")
+
+    assert not write_output(path, b"contents")
+
+
+def test_rewrites_changed_output(tmp_path):
+    path = tmp_path / "cv.pdf"
+    write_output(path, b"old")
+
+    assert write_output(path, b"new")
+
+    assert path.read_bytes() == b"new"
+    assert not is_output_unchanged(path)
+
+
+def test_notices_outputs_changed_by_others(tmp_path):
+    path = tmp_path / "cv.pdf"
+    write_output(path, b"contents")
+    path.write_bytes(b"edited by hand")
+
+    assert write_output(path, b"contents")
+
+    assert path.read_bytes() == b"contents"
+
+
+def test_leaves_no_temporary_files(tmp_path):
+    path = tmp_path / "cv.pdf"
+
+    write_output(path, b"old")
+    write_output(path, b"new")
+
+    assert list(tmp_path.iterdir()) == [path]
+
+
+@pytest.mark.skipif(os.name == "nt", reason="POSIX permissions")
+def test_keeps_permissions_of_replaced_output(tmp_path):
+    path = tmp_path / "cv.pdf"
+    path.write_bytes(b"old")
+    path.chmod(0o640)
+
+    write_output(path, b"new")
+
+    assert stat.S_IMODE(path.stat().st_mode) == 0o640
+
+
+def test_removes_temporary_file_on_failure(tmp_path, monkeypatch):
+    path = tmp_path / "cv.pdf"
+
+    def fail(*_args):
+        raise OSError
+
+    monkeypatch.setattr(output_writer.pathlib.Path, "replace", fail)
+
+    with pytest.raises(OSError):  # NOQA: PT011
+        write_output(path, b"contents")
+
+    assert list(tmp_path.iterdir()) == []
+
+
+class TestWriteOutputChunks:
+    def test_writes_chunks(self, tmp_path):
+        path = tmp_path / "cv.typ"
+
+        assert write_output_chunks(path, iter([b"con", b"tents"]))
+
+        assert path.read_bytes() == b"contents"
+        assert list(tmp_path.iterdir()) == [path]
+
+    def test_skips_identical_output(self, tmp_path):
+        path = tmp_path / "cv.typ"
+        write_output(path, b"contents")
+        os.utime(path, ns=(0, 0))
+
+        assert not write_output_chunks(path, iter([b"con", b"tents"]))
+
+        assert path.stat().st_mtime_ns == 0
+        assert is_output_unchanged(path)
+        assert list(tmp_path.iterdir()) == [path]
+
+    def test_keeps_output_if_chunks_fail(self, tmp_path):
+        path = tmp_path / "cv.typ"
+        write_output(path, b"old")
+
+        def chunks():
+            yield b"new"
+            raise ValueError("failed")
+
+        with pytest.raises(ValueError, match="failed"):
+            write_output_chunks(path, chunks())
+
+        assert path.read_bytes() == b"old"
+        assert list(tmp_path.iterdir()) == [path]
+
+
+def test_get_output_digest_of_missing_file(tmp_path):
+    assert get_output_digest(tmp_path / "missing.pdf") is None
+
+
+def test_drops_least_recently_used_records(tmp_path, monkeypatch):
+    monkeypatch.setattr(output_writer, "maximum_output_records", 2)
+    monkeypatch.setattr(output_writer, "output_records", collections.OrderedDict())
+    first, second, third = (tmp_path / f"{name}.pdf" for name in "abc")
+    write_output(first, b"first")
+    write_output(second, b"second")
+    is_output_unchanged(first)
+
+    write_output(third, b"third")
+
+    assert list(output_writer.output_records) == [first, third]
@@ -0,0 +1,99 @@
+import pytest
+
+from rendercv.renderer import page_fitter
+from rendercv.renderer.page_fitter import fit_to_pages, scale_design, scale_dimension
+from rendercv.schema.models.design.classic_theme import ClassicTheme
+from rendercv.schema.models.rendercv_model import RenderCVModel
+
+
+@pytest.mark.parametrize(
+    ("dimension", "scale", "expected"),
+    [
+        ("0.7in", 0.5, "0.35in"),
+        ("10pt", 0.75, "7.5pt"),
+        ("1.2em", 1.0, "1.2em"),
+        ("0.3em", 0.3333, "0.1em"),
+    ],
+)
+def test_scale_dimension(dimension, scale, expected):
+    assert scale_dimension(dimension, scale) == expected
+
+
+def test_scale_design_scales_spacing_more_than_font_size():
+    design = ClassicTheme()
+
+    scaled = scale_design(design, 0.5)
+
+    assert scaled.page.top_margin == "0.35in"
+    assert scaled.sections.space_between_regular_entries == "0.6em"
+    assert scaled.typography.font_size.body == "7.5pt"
+    # The original design is not modified:
+    assert design.page.top_margin == "0.7in"
+
+
+class TestFitToPages:
+    @pytest.fixture
+    def model(self) -> RenderCVModel:
+        model = RenderCVModel()
+        model.settings.render_command.fit_pages = 2
+        return model
+
+    @staticmethod
+    def fake_page_counts(monkeypatch, pages_at_scale):
+        scales = []
+
+        def count_pages(rendercv_model, _typst_root):
+            margin = float(rendercv_model.design.page.top_margin.removesuffix("in"))
+            scale = margin / 0.7
+            scales.append(scale)
+            return pages_at_scale(scale)
+
+        monkeypatch.setattr(page_fitter, "count_pages", count_pages)
+        return scales
+
+    def test_returns_nothing_when_disabled(self, monkeypatch):
+        scales = self.fake_page_counts(monkeypatch, lambda _: 3)
+
+        assert fit_to_pages(RenderCVModel()) == {}
+        assert scales == []
+
+    def test_keeps_design_when_cv_already_fits(self, model, monkeypatch):
+        design = model.design
+        scales = self.fake_page_counts(monkeypatch, lambda _: 2)
+
+        assert fit_to_pages(model) == {}
+        assert model.design is design
+        assert scales == [1.0]
+
+    def test_searches_largest_fitting_scale_within_budget(self, model, monkeypatch):
+        scales = self.fake_page_counts(
+            monkeypatch, lambda scale: 2 if scale <= 0.8 else 3
+        )
+
+        overrides = fit_to_pages(model)
+
+        assert len(scales) == page_fitter.maximum_compiles
+        assert 0.7 < float(model.design.page.top_margin.removesuffix("in")) / 0.7 <= 0.8
+        assert overrides["design.page.top_margin"] == model.design.page.top_margin
+        assert overrides["design.typography.font_size.body"] == (
+            model.design.typography.font_size.body
+        )
+
+    def test_uses_minimum_scale_when_nothing_fits(self, model, monkeypatch):
+        scales = self.fake_page_counts(monkeypatch, lambda _: 3)
+
+        overrides = fit_to_pages(model)
+
+        assert len(scales) == 2
+        assert overrides["design.page.top_margin"] == "0.35in"
+
+
+@pytest.mark.parametrize("page_count", [1, 3])
+def test_count_pages(tmp_path, monkeypatch, page_count):
+    monkeypatch.setattr(
+        page_fitter,
+        "render_full_template",
+        lambda *_: "#pagebreak()\n".join(["Page"] * page_count),
+    )
+
+    assert page_fitter.count_pages(RenderCVModel(), tmp_path) == page_count
@@ -1,7 +1,16 @@
+from datetime import date as Date
+
 import pytest
 
-from rendercv.renderer.pdf_png import generate_pdf, generate_png
-from rendercv.renderer.typst import generate_typst
+from rendercv.renderer import pdf_png
+from rendercv.renderer.pdf_png import (
+    TypstDocument,
+    compile_typst,
+    generate_pdf,
+    generate_png,
+    generate_svg,
+)
+from rendercv.renderer.templater.templater import render_full_template
 from rendercv.schema.models.design.built_in_design import available_themes
 from rendercv.schema.models.rendercv_model import RenderCVModel
 
@@ -25,10 +34,10 @@ def test_generate_pdf(
 
     def generate_file(output_path):
         model.settings.render_command.typst_path = output_path.with_suffix(".typ")
-        typst_path = generate_typst(model)
+        typst_source = render_full_template(model, "typst")
 
         model.settings.render_command.pdf_path = output_path
-        generate_pdf(model, typst_path)
+        generate_pdf(model, compile_typst(model, typst_source))
 
     reference_filename = f"{theme}_{cv_variant}.pdf"
 
@@ -50,11 +59,299 @@ def test_generate_png(
 
     def generate_file(output_path):
         model.settings.render_command.typst_path = output_path.with_suffix(".typ")
-        typst_path = generate_typst(model)
+        typst_source = render_full_template(model, "typst")
 
         model.settings.render_command.png_path = output_path
-        generate_png(model, typst_path)
+        generate_png(model, compile_typst(model, typst_source))
 
     reference_filename = f"{theme}_minimal.png"
 
     assert compare_file_with_reference(generate_file, reference_filename)
+
+
+class TestCompileTypst:
+    @pytest.fixture
+    def model(self, minimal_rendercv_model: RenderCVModel, tmp_path) -> RenderCVModel:
+        model = minimal_rendercv_model.model_copy(deep=True)
+        model.settings.render_command.typst_path = tmp_path / "cv.typ"
+        model.settings.render_command.pdf_path = tmp_path / "cv.pdf"
+        model.settings.render_command.png_path = tmp_path / "cv.png"
+        return model
+
+    @pytest.fixture
+    def fake_compiler(self, monkeypatch):
+        class FakeCompiler:
+            def __init__(self):
+                self.formats: list[str] = []
+                self.inputs: list[bytes] = []
+                self.ppis: list[int | None] = []
+                self.timestamps: list[int] = []
+
+            def compile(self, input, format, ppi, timestamp):
+                self.inputs.append(input)
+                self.timestamps.append(timestamp)
+                self.formats.append(format)
+                self.ppis.append(ppi)
+                if format == "pdf":
+                    return b"%PDF"
+                return [f"{format} 1".encode(), f"{format} 2".encode()]
+
+        compiler = FakeCompiler()
+        monkeypatch.setattr(pdf_png, "get_typst_compiler", lambda *_args: compiler)
+        return compiler
+
+    def test_exports_enabled_formats_from_one_compiler(self, model, fake_compiler):
+        model.settings.render_command.svg_path = model.settings.render_command.png_path
+
+        typst_document = compile_typst(model, "= Source")
+
+        assert fake_compiler.formats == ["pdf", "png", "svg"]
+        assert fake_compiler.inputs == [b"= Source"] * 3
+        assert fake_compiler.ppis == [None, 144, None]
+        assert typst_document == TypstDocument(
+            pdf=b"%PDF", png=[b"png 1", b"png 2"], svg=[b"svg 1", b"svg 2"]
+        )
+
+    def test_skips_disabled_formats(self, model, fake_compiler):
+        model.settings.render_command.dont_generate_pdf = True
+
+        typst_document = compile_typst(model, "= Source")
+
+        assert fake_compiler.formats == ["png"]
+        assert typst_document is not None
+        assert typst_document.pdf is None
+
+    def test_returns_none_without_formats(self, model, fake_compiler):
+        model.settings.render_command.dont_generate_pdf = True
+        model.settings.render_command.dont_generate_png = True
+
+        assert compile_typst(model, "= Source") is None
+        assert fake_compiler.formats == []
+
+    @pytest.mark.usefixtures("fake_compiler")
+    def test_does_not_need_typst_file(self, model):
+        model.settings.render_command.dont_generate_typst = True
+
+        typst_document = compile_typst(model, "= Source")
+
+        assert typst_document is not None
+        assert typst_document.pdf == b"%PDF"
+        assert not model.settings.render_command.typst_path.exists()
+
+    def test_uses_png_ppi(self, model, fake_compiler):
+        model.settings.render_command.png_ppi = 72
+
+        compile_typst(model, "= Source")
+
+        assert fake_compiler.ppis == [None, 72]
+
+    def test_fixes_timestamp_to_current_date(self, model, fake_compiler, monkeypatch):
+        monkeypatch.delenv("SOURCE_DATE_EPOCH", raising=False)
+        model.settings.current_date = Date(2025, 1, 31)
+
+        compile_typst(model, "= Source")
+
+        assert fake_compiler.timestamps == [1738281600, 1738281600]
+
+    def test_prefers_source_date_epoch(self, model, fake_compiler, monkeypatch):
+        monkeypatch.setenv("SOURCE_DATE_EPOCH", "1700000000")
+
+        compile_typst(model, "= Source")
+
+        assert fake_compiler.timestamps == [1700000000, 1700000000]
+
+    def test_writes_png_page_subset(self, model, tmp_path):
+        model.settings.render_command.png_pages = [2, 5]
+        typst_document = TypstDocument(png=[b"png 1", b"png 2", b"png 3"])
+
+        assert generate_png(model, typst_document) == [tmp_path / "cv_2.png"]
+        assert not (tmp_path / "cv_1.png").exists()
+
+    def test_writes_outputs(self, model, tmp_path):
+        model.settings.render_command.svg_path = tmp_path / "cv.svg"
+        typst_document = TypstDocument(
+            pdf=b"%PDF", png=[b"png 1", b"png 2"], svg=[b"svg 1"]
+        )
+
+        assert generate_pdf(model, typst_document) == tmp_path / "cv.pdf"
+        assert generate_png(model, typst_document) == [
+            tmp_path / "cv_1.png",
+            tmp_path / "cv_2.png",
+        ]
+        assert generate_svg(model, typst_document) == [tmp_path / "cv_1.svg"]
+        assert (tmp_path / "cv_2.png").read_bytes() == b"png 2"
+
+
+@pytest.mark.parametrize(
+    ("page_numbers", "expected_numbers"),
+    [(None, [1, 2, 3]), ([3, 1], [3, 1]), ([2, 1, 2], [2, 1]), ([4], [])],
+)
+def test_write_pages(tmp_path, page_numbers, expected_numbers):
+    pages = [b"page 1", b"page 2", b"page 3"]
+
+    files = pdf_png.write_pages(pages, tmp_path / "cv.png", page_numbers)
+
+    expected_files = [tmp_path / f"cv_{number}.png" for number in expected_numbers]
+    assert files == (expected_files or None)
+    for number, file in zip(expected_numbers, expected_files, strict=True):
+        assert file.read_bytes() == f"page {number}".encode()
+
+
+class TestTypstCompilerPool:
+    @pytest.fixture(autouse=True)
+    def empty_pool(self):
+        pdf_png.clear_typst_compiler_pool()
+        yield
+        pdf_png.set_typst_compiler_pool_size(8)
+
+    def test_reuses_compiler_for_same_root_and_fonts(self, tmp_path):
+        first = pdf_png.get_typst_compiler(tmp_path, ())
+        second = pdf_png.get_typst_compiler(tmp_path, ())
+
+        assert first is second
+        assert pdf_png.get_typst_compiler_pool_statistics() == {
+            "hits": 1,
+            "misses": 1,
+            "size": 1,
+            "max_size": 8,
+        }
+
+    def test_keeps_compilers_of_several_roots(self, tmp_path):
+        first_root = tmp_path / "first"
+        second_root = tmp_path / "second"
+        first_root.mkdir()
+        second_root.mkdir()
+
+        first = pdf_png.get_typst_compiler(first_root, ())
+        pdf_png.get_typst_compiler(second_root, ())
+
+        assert pdf_png.get_typst_compiler(first_root, ()) is first
+        assert pdf_png.get_typst_compiler_pool_statistics()["size"] == 2
+
+    def test_keys_compilers_by_fonts(self, tmp_path):
+        first = pdf_png.get_typst_compiler(tmp_path, ())
+
+        assert pdf_png.get_typst_compiler(tmp_path, (tmp_path,)) is not first
+
+    def test_clear_drops_compilers(self, tmp_path):
+        first = pdf_png.get_typst_compiler(tmp_path, ())
+
+        pdf_png.clear_typst_compiler_pool()
+
+        assert pdf_png.get_typst_compiler(tmp_path, ()) is not first
+
+    def test_set_pool_size(self, tmp_path):
+        get_typst_compiler = pdf_png.get_typst_compiler
+        pdf_png.set_typst_compiler_pool_size(1)
+        other_root = tmp_path / "other"
+        other_root.mkdir()
+
+        # A reference taken before resizing must use the new pool:
+        first = get_typst_compiler(tmp_path, ())
+        get_typst_compiler(other_root, ())
+
+        assert get_typst_compiler(tmp_path, ()) is not first
+        assert pdf_png.get_typst_compiler_pool_statistics()["max_size"] == 1
+
+
+class TestLendTypstCompiler:
+    @pytest.fixture(autouse=True)
+    def empty_pool(self):
+        pdf_png.clear_typst_compiler_pool()
+        yield
+        pdf_png.clear_typst_compiler_pool()
+
+    def test_lends_pooled_compiler(self, minimal_rendercv_model, tmp_path):
+        with pdf_png.lend_typst_compiler(
+            minimal_rendercv_model, tmp_path
+        ) as typst_compiler:
+            assert typst_compiler is pdf_png.get_typst_compiler(
+                tmp_path, pdf_png.get_font_paths(minimal_rendercv_model)
+            )
+
+        assert pdf_png.lent_typst_compilers == set()
+
+    def test_lends_another_compiler_while_pooled_one_is_lent(
+        self, minimal_rendercv_model, tmp_path
+    ):
+        with (
+            pdf_png.lend_typst_compiler(minimal_rendercv_model, tmp_path) as first,
+            pdf_png.lend_typst_compiler(minimal_rendercv_model, tmp_path) as second,
+        ):
+            assert first is not second
+            assert first is pdf_png.get_typst_compiler(
+                tmp_path, pdf_png.get_font_paths(minimal_rendercv_model)
+            )
+
+    def test_reuses_spare_compilers(self, minimal_rendercv_model, tmp_path):
+        spares = []
+        for _ in range(2):
+            with (
+                pdf_png.lend_typst_compiler(minimal_rendercv_model, tmp_path),
+                pdf_png.lend_typst_compiler(minimal_rendercv_model, tmp_path) as spare,
+            ):
+                spares.append(spare)
+
+        assert spares[0] is spares[1]
+
+    def test_keeps_at_most_pool_size_spares(self, minimal_rendercv_model, tmp_path):
+        try:
+            pdf_png.set_typst_compiler_pool_size(1)
+            with (
+                pdf_png.lend_typst_compiler(minimal_rendercv_model, tmp_path),
+                pdf_png.lend_typst_compiler(minimal_rendercv_model, tmp_path),
+                pdf_png.lend_typst_compiler(minimal_rendercv_model, tmp_path),
+            ):
+                pass
+
+            assert [
+                len(spares) for spares in pdf_png.spare_typst_compilers.values()
+            ] == [1]
+        finally:
+            pdf_png.set_typst_compiler_pool_size(8)
+
+    def test_clear_drops_spare_compilers(self, minimal_rendercv_model, tmp_path):
+        with (
+            pdf_png.lend_typst_compiler(minimal_rendercv_model, tmp_path),
+            pdf_png.lend_typst_compiler(minimal_rendercv_model, tmp_path),
+        ):
+            pass
+
+        pdf_png.clear_typst_compiler_pool()
+
+        assert pdf_png.spare_typst_compilers == {}
+
+    def test_returns_compiler_after_error(self, minimal_rendercv_model, tmp_path):
+        with (
+            pytest.raises(ValueError, match="failed"),
+            pdf_png.lend_typst_compiler(minimal_rendercv_model, tmp_path),
+        ):
+            raise ValueError("failed")
+
+        assert pdf_png.lent_typst_compilers == set()
+
+
+def test_typst_package_path_is_none_without_vendored_packages(tmp_path, monkeypatch):
+    monkeypatch.setattr(pdf_png, "typst_package_path", tmp_path / "missing")
+
+    assert pdf_png.get_typst_package_path() is None
+
+
+def test_typst_compiler_resolves_vendored_packages(tmp_path, monkeypatch):
+    package_directory = tmp_path / "packages" / "preview" / "vendored" / "0.1.0"
+    package_directory.mkdir(parents=True)
+    (package_directory / "typst.toml").write_text(
+        '[package]\nname = "vendored"\nversion = "0.1.0"\nentrypoint = "lib.typ"\n'
+    )
+    (package_directory / "lib.typ").write_text('#let greeting = "Hello"\n')
+    monkeypatch.setattr(pdf_png, "typst_package_path", tmp_path / "packages")
+    pdf_png.clear_typst_compiler_pool()
+
+    typst_compiler = pdf_png.get_typst_compiler(tmp_path, ())
+    pdf = typst_compiler.compile(
+        input=b'#import "@preview/vendored:0.1.0": *\n#greeting', format="pdf"
+    )
+
+    assert isinstance(pdf, bytes)
+    assert pdf.startswith(b"%PDF")
+    pdf_png.clear_typst_compiler_pool()
@@ -0,0 +1,109 @@
+import io
+
+import pytest
+from PIL import Image
+
+from rendercv.renderer import photo
+from rendercv.renderer.photo import downscale_photo, get_width_in_pixels, place_photo
+from rendercv.schema.models.cv.cv import Cv
+from rendercv.schema.models.rendercv_model import RenderCVModel
+
+
+def make_image(width: int, height: int, image_format: str) -> bytes:
+    output = io.BytesIO()
+    Image.new("RGB", (width, height), color=(200, 100, 50)).save(
+        output, format=image_format
+    )
+    return output.getvalue()
+
+
+@pytest.fixture(autouse=True)
+def empty_photo_cache():
+    photo.get_processed_photo.cache_clear()
+    yield
+    photo.get_processed_photo.cache_clear()
+
+
+@pytest.mark.parametrize(
+    ("photo_width", "expected"),
+    [("3.5cm", 413), ("1in", 300), ("72pt", 300), ("10mm", 118), ("2em", None)],
+)
+def test_get_width_in_pixels(photo_width, expected):
+    assert get_width_in_pixels(photo_width) == expected
+
+
+class TestDownscalePhoto:
+    @pytest.mark.parametrize("image_format", ["JPEG", "PNG"])
+    def test_downscales_wide_photos(self, image_format):
+        result = downscale_photo(make_image(2000, 1000, image_format), 400)
+
+        image = Image.open(io.BytesIO(result))
+        assert image.format == image_format
+        assert image.size == (400, 200)
+
+    def test_keeps_rotated_photos_upright(self):
+        exif = Image.Exif()
+        exif[0x0112] = 6  # Stored sideways, displayed rotated by 90 degrees
+        output = io.BytesIO()
+        Image.new("RGB", (2000, 1000), color=(200, 100, 50)).save(
+            output, format="JPEG", exif=exif
+        )
+
+        result = Image.open(io.BytesIO(downscale_photo(output.getvalue(), 400)))
+
+        assert result.size == (400, 800)
+        assert result.getexif().get(0x0112, 1) == 1
+
+    def test_keeps_small_photos(self):
+        photo_bytes = make_image(300, 300, "JPEG")
+
+        assert downscale_photo(photo_bytes, 400) is photo_bytes
+
+    def test_keeps_unknown_formats(self):
+        photo_bytes = b'<svg xmlns="http://www.w3.org/2000/svg"></svg>'
+
+        assert downscale_photo(photo_bytes, 400) is photo_bytes
+
+
+class TestPlacePhoto:
+    @pytest.fixture
+    def model(self, tmp_path) -> RenderCVModel:
+        photo_path = tmp_path / "input" / "photo.jpg"
+        photo_path.parent.mkdir()
+        photo_path.write_bytes(make_image(3000, 3000, "JPEG"))
+        model = RenderCVModel(cv=Cv(name="John Doe"))
+        model.cv.photo = photo_path
+        return model
+
+    def test_places_downscaled_photo(self, model, tmp_path):
+        place_photo(model, tmp_path)
+
+        image = Image.open(tmp_path / "photo.jpg")
+        assert image.width == get_width_in_pixels(model.design.header.photo_width)
+
+    def test_does_not_rewrite_unchanged_photo(self, model, tmp_path):
+        place_photo(model, tmp_path)
+        modification_time = (tmp_path / "photo.jpg").stat().st_mtime_ns
+
+        place_photo(model, tmp_path)
+
+        assert (tmp_path / "photo.jpg").stat().st_mtime_ns == modification_time
+
+    def test_stores_processed_photo_in_cache_directory(self, model, tmp_path):
+        model.settings.render_command.cache_dir = tmp_path / "cache"
+
+        place_photo(model, tmp_path)
+        photo.get_processed_photo.cache_clear()
+        (tmp_path / "photo.jpg").unlink()
+        place_photo(model, tmp_path)
+
+        cached_files = list((tmp_path / "cache" / "photos").iterdir())
+        assert len(cached_files) == 1
+        assert cached_files[0].read_bytes() == (tmp_path / "photo.jpg").read_bytes()
+
+    def test_never_overwrites_original(self, model):
+        original = model.cv.photo.read_bytes()
+
+        place_photo(model, model.cv.photo.parent)
+
+        assert model.cv.photo.read_bytes() == original
@@ -0,0 +1,145 @@
+import threading
+import time
+
+import pytest
+
+from rendercv.exception import RenderCVUserError, RenderCVUserValidationError
+from rendercv.renderer import pdf_png
+from rendercv.renderer.render import render, render_variants
+from rendercv.schema.models.rendercv_model import RenderCVModel
+
+
+@pytest.fixture
+def fake_compiler(monkeypatch):
+    class FakeCompiler:
+        def __init__(self):
+            self.formats: list[str] = []
+
+        def compile(self, input, format, ppi=None, timestamp=None):  # NOQA: ARG002
+            self.formats.append(format)
+            if format == "pdf":
+                return b"%PDF /Type /Page"
+            return [f"{format} 1".encode(), f"{format} 2".encode()]
+
+    compiler = FakeCompiler()
+    monkeypatch.setattr(pdf_png, "get_typst_compiler", lambda *_args: compiler)
+    return compiler
+
+
+@pytest.fixture(autouse=True)
+def empty_working_directory(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    return tmp_path
+
+
+def test_renders_text_formats_from_dictionary(empty_working_directory):
+    outputs = render({"cv": {"name": "John Doe"}}, ("typst", "markdown", "html"))
+
+    assert list(outputs) == ["typst", "markdown", "html"]
+    assert all(b"John Doe" in contents for contents in outputs.values())
+    assert list(empty_working_directory.iterdir()) == []
+
+
+def test_exports_only_requested_formats(fake_compiler, empty_working_directory):
+    outputs = render({"cv": {"name": "John Doe"}}, ("png", "pdf"))
+
+    assert fake_compiler.formats == ["png", "pdf"]
+    assert outputs == {"png": [b"png 1", b"png 2"], "pdf": b"%PDF /Type /Page"}
+    assert list(empty_working_directory.iterdir()) == []
+
+
+@pytest.mark.usefixtures("fake_compiler")
+def test_does_not_change_the_given_model():
+    model = RenderCVModel.model_validate({"cv": {"name": "John Doe"}})
+    design = model.design
+    model.settings.render_command.fit_pages = 1
+
+    render(model, ("pdf",))
+
+    assert model.design is design
+
+
+def test_compiles_in_the_photo_directory(tmp_path, monkeypatch, fake_compiler):
+    photo = tmp_path / "photos" / "photo.svg"
+    photo.parent.mkdir()
+    photo.write_text('<svg xmlns="http://www.w3.org/2000/svg"/>', encoding="utf-8")
+    roots = []
+
+    def get_typst_compiler(root, _font_paths):
+        roots.append(root)
+        return fake_compiler
+
+    monkeypatch.setattr(pdf_png, "get_typst_compiler", get_typst_compiler)
+
+    render({"cv": {"name": "John Doe", "photo": str(photo)}}, ("pdf",))
+
+    assert roots == [photo.parent]
+    assert list(photo.parent.iterdir()) == [photo]
+
+
+@pytest.mark.usefixtures("vendored_typst_packages")
+def test_renders_pdf():
+    outputs = render({"cv": {"name": "John Doe"}})
+
+    assert outputs["pdf"][:4] == b"%PDF"
+
+
+def test_raises_for_unsupported_formats():
+    with pytest.raises(RenderCVUserError):
+        render({"cv": {"name": "John Doe"}}, ["docx"])  # ty: ignore[invalid-argument-type]
+
+
+def test_raises_for_invalid_dictionaries():
+    with pytest.raises(RenderCVUserValidationError):
+        render({"cv": {"email": "not-an-email"}}, ("typst",))
+
+
+def test_renders_variants(empty_working_directory):
+    outputs = render_variants(
+        {"cv": {"name": "John Doe"}},
+        themes=["classic", "moderncv"],
+        locales=["english", "turkish"],
+        formats=("typst",),
+    )
+
+    assert list(outputs) == [
+        "classic_english",
+        "classic_turkish",
+        "moderncv_english",
+        "moderncv_turkish",
+    ]
+    assert b"Fontin" in outputs["moderncv_turkish"]["typst"]
+    assert b'"tr"' in outputs["moderncv_turkish"]["typst"]
+    assert list(empty_working_directory.iterdir()) == []
+
+
+def test_compiles_variants_concurrently_in_one_directory(monkeypatch):
+    class ExclusiveCompiler:
+        def __init__(self):
+            self.lock = threading.Lock()
+
+        def compile(self, input, format, ppi=None, timestamp=None):  # NOQA: ARG002
+            # Like Typst's compiler, fail instead of waiting when it's in use:
+            if not self.lock.acquire(blocking=False):
+                raise RuntimeError("Already borrowed")
+            time.sleep(0.05)
+            self.lock.release()
+            return [b"<svg/>"]
+
+    pooled_compiler = ExclusiveCompiler()
+
+    def get_typst_compiler(_root, _font_paths):
+        return pooled_compiler
+
+    monkeypatch.setattr(pdf_png, "get_typst_compiler", get_typst_compiler)
+    monkeypatch.setattr(
+        pdf_png, "create_typst_compiler", lambda _root, _font_paths: ExclusiveCompiler()
+    )
+
+    outputs = render_variants(
+        {"cv": {"name": "John Doe"}},
+        themes=["classic", "engineeringresumes", "sb2nov", "moderncv"],
+        formats=("svg",),
+    )
+
+    assert all(variant["svg"] == [b"<svg/>"] for variant in outputs.values())
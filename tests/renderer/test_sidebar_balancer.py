@@ -0,0 +1,116 @@
+import pytest
+
+from rendercv.renderer import sidebar_balancer
+from rendercv.renderer.sidebar_balancer import balance_sidebar, choose_sections_to_move
+from rendercv.schema.models.cv.cv import Cv
+from rendercv.schema.models.rendercv_model import RenderCVModel
+
+
+def make_markers(sidebar_sections, main_height, sidebar_width=100, main_width=200):
+    markers = [
+        {"column": "sidebar", "section": None, "width": sidebar_width, "offset": 0}
+    ]
+    offset = 0
+    for section, height in sidebar_sections:
+        offset += height
+        markers.append(
+            {
+                "column": "sidebar",
+                "section": section,
+                "width": sidebar_width,
+                "offset": offset,
+            }
+        )
+    markers.append(
+        {"column": "main", "section": None, "width": main_width, "offset": 0}
+    )
+    markers.append(
+        {"column": "main", "section": "end", "width": main_width, "offset": main_height}
+    )
+    return markers
+
+
+@pytest.mark.parametrize(
+    ("sidebar_sections", "main_height", "expected"),
+    [
+        ([("skills", 300), ("hobbies", 200)], 300, ["hobbies"]),
+        ([("skills", 300), ("hobbies", 200)], 500, []),
+        (
+            [("skills", 100), ("values", 300), ("hobbies", 300)],
+            0,
+            ["values", "hobbies"],
+        ),
+        ([], 300, []),
+    ],
+)
+def test_choose_sections_to_move(sidebar_sections, main_height, expected):
+    markers = make_markers(sidebar_sections, main_height)
+
+    assert choose_sections_to_move(markers) == expected
+
+
+class TestBalanceSidebar:
+    @pytest.fixture
+    def model(self, tmp_path) -> RenderCVModel:
+        cv = Cv.model_validate(
+            {
+                "name": "Jane Doe",
+                "sections": {
+                    "Experience": ["Main column text."],
+                    "Skills": ["Sidebar text."],
+                    "Hobbies": ["Sidebar text."],
+                },
+            }
+        )
+        model = RenderCVModel(
+            cv=cv,
+            design={
+                "theme": "sidebar",
+                "sidebar": {
+                    "width": "6cm",
+                    "sections": ["skills", "hobbies"],
+                    "auto_balance": True,
+                },
+            },
+        )
+        model.settings.render_command.typst_path = tmp_path / "cv.typ"
+        return model
+
+    @pytest.fixture
+    def fake_markers(self, monkeypatch):
+        class FakeQuery:
+            def __init__(self):
+                self.markers: list[dict] = []
+                self.typst_source = ""
+
+            def __call__(self, _rendercv_model, typst_source, selector, _typst_root):
+                assert selector == "<rendercv-column-marker>"
+                self.typst_source = typst_source
+                return self.markers
+
+        fake_query = FakeQuery()
+        monkeypatch.setattr(sidebar_balancer, "query_typst", fake_query)
+        return fake_query
+
+    def test_returns_nothing_when_disabled(self, model, fake_markers):
+        model.design.sidebar.auto_balance = False
+        fake_markers.markers = make_markers([("skills", 300), ("hobbies", 200)], 300)
+
+        assert balance_sidebar(model) == {}
+
+    def test_moves_sections_to_main_column(self, model, fake_markers):
+        fake_markers.markers = make_markers([("skills", 300), ("hobbies", 200)], 300)
+
+        overrides = balance_sidebar(model)
+
+        assert overrides == {"design.sidebar.sections": "[skills]"}
+        assert model.design.sidebar.sections == ["skills"]
+
+    def test_queries_source_with_markers(self, model, fake_markers):
+        balance_sidebar(model)
+
+        assert '#rendercv-column-marker("sidebar", "hobbies")' in (
+            fake_markers.typst_source
+        )
+        assert '#rendercv-column-marker("main", "end")' in fake_markers.typst_source
+        assert not model.settings.render_command.typst_path.exists()
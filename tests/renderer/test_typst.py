@@ -1,5 +1,6 @@
 import pytest
 
+from rendercv.renderer.templater.templater import render_full_template
 from rendercv.renderer.typst import generate_typst
 from rendercv.schema.models.design.built_in_design import available_themes
 from rendercv.schema.models.rendercv_model import RenderCVModel
@@ -28,3 +29,15 @@ def test_generate_typst(
 
     reference_filename = f"{theme}_{cv_variant}.typ"
     assert compare_file_with_reference(generate_file, reference_filename)
+
+
+def test_streams_same_source_as_rendered(minimal_rendercv_model, tmp_path):
+    minimal_rendercv_model.settings.render_command.typst_path = tmp_path / "cv.typ"
+
+    typst_path = generate_typst(minimal_rendercv_model)
+
+    assert typst_path is not None
+    assert typst_path.read_text(encoding="utf-8") == render_full_template(
+        minimal_rendercv_model, "typst"
+    )
+    assert list(tmp_path.iterdir()) == [typst_path]
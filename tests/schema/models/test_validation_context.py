@@ -7,6 +7,7 @@ from rendercv.schema.models.validation_context import (
     ValidationContext,
     get_current_date,
     get_input_file_path,
+    get_today,
 )
 
 
@@ -44,7 +45,8 @@ class TestValidationContext:
         assert model.path_field == str(test_path)
         assert model.date_field == context_date.isoformat()
 
-    def test_uses_defaults_without_context(self):
+    def test_uses_defaults_without_context(self, monkeypatch):
+        monkeypatch.delenv("SOURCE_DATE_EPOCH", raising=False)
         model = DummyModel.model_validate(
             {"name": "test", "path_field": "dummy", "date_field": "dummy"}
         )
@@ -52,3 +54,15 @@ class TestValidationContext:
         expected_date = Date.today()
         assert model.path_field == "None"
         assert model.date_field == expected_date.isoformat()
+
+
+class TestGetToday:
+    def test_uses_source_date_epoch(self, monkeypatch):
+        monkeypatch.setenv("SOURCE_DATE_EPOCH", "1700000000")
+
+        assert get_today() == Date(2023, 11, 14)
+
+    def test_ignores_invalid_source_date_epoch(self, monkeypatch):
+        monkeypatch.setenv("SOURCE_DATE_EPOCH", "yesterday")
+
+        assert get_today() == Date.today()
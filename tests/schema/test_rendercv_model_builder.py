@@ -11,6 +11,7 @@ from rendercv.schema.rendercv_model_builder import (
     build_rendercv_dictionary,
     build_rendercv_dictionary_and_model,
     build_rendercv_model_from_commented_map,
+    build_rendercv_model_variants,
 )
 from rendercv.schema.sample_generator import dictionary_to_yaml
 
@@ -139,10 +140,15 @@ class TestBuildRendercvDictionary:
             ("markdown_path", "output.md"),
             ("html_path", "output.html"),
             ("png_path", "output.png"),
+            ("svg_path", "output.svg"),
             ("dont_generate_html", True),
             ("dont_generate_markdown", True),
             ("dont_generate_pdf", True),
             ("dont_generate_png", True),
+            ("png_ppi", 72),
+            ("png_pages", [1]),
+            ("fit_pages", 2),
+            ("cache_dir", "cache"),
         ],
     )
     def test_render_command_single_override(
@@ -627,3 +633,69 @@ class TestBuildRendercvModel:
 
         # Both should be applied in the model
         assert model.design.theme == "sb2nov"
+
+
+class TestBuildRendercvModelVariants:
+    @pytest.fixture
+    def model(self, tmp_path) -> RenderCVModel:
+        return build_rendercv_model_from_commented_map(
+            {
+                "cv": {"name": "John Doe"},
+                "design": {"theme": "classic", "page": {"size": "a4"}},
+            },
+            tmp_path / "cv.yaml",
+        )
+
+    def test_builds_every_combination(self, model):
+        variants = build_rendercv_model_variants(
+            model, themes=["classic", "moderncv"], locales=["english", "french"]
+        )
+
+        assert list(variants) == [
+            "classic_english",
+            "classic_french",
+            "moderncv_english",
+            "moderncv_french",
+        ]
+        for variant_name, variant in variants.items():
+            assert variant_name == f"{variant.design.theme}_{variant.locale.language}"
+            assert variant.cv is model.cv
+
+    def test_shares_validated_themes_and_locales(self, model):
+        variants = build_rendercv_model_variants(
+            model, themes=["moderncv", "sb2nov"], locales=["english", "french"]
+        )
+
+        assert variants["moderncv_english"].design is variants["moderncv_french"].design
+        assert variants["moderncv_french"].locale is variants["sb2nov_french"].locale
+
+    def test_keeps_customizations_of_own_theme(self, model):
+        variants = build_rendercv_model_variants(model, themes=["classic", "moderncv"])
+
+        assert variants["classic"].design is model.design
+        assert variants["moderncv"].design.page.size != "a4"
+
+    def test_writes_outputs_to_variant_directories(self, model):
+        variants = build_rendercv_model_variants(
+            model, themes=["moderncv"], locales=["french"]
+        )
+
+        render_command = variants["moderncv_french"].settings.render_command
+        assert render_command.pdf_path == (
+            model.settings.render_command.pdf_path.parent
+            / "moderncv_french"
+            / model.settings.render_command.pdf_path.name
+        )
+        assert model.settings.render_command.pdf_path.parent.name != "moderncv_french"
+
+    def test_names_directories_after_varied_dimension(self, model):
+        variants = build_rendercv_model_variants(model, locales=["french"])
+
+        render_command = variants["french"].settings.render_command
+        assert render_command.typst_path.parent.name == "french"
+
+    def test_raises_for_unknown_names(self, model):
+        with pytest.raises(RenderCVUserError, match="klingon"):
+            build_rendercv_model_variants(
+                model, themes=["classic"], locales=["klingon"]
+            )